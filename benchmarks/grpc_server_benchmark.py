@@ -0,0 +1,118 @@
+"""Throughput and latency of the gRPC server under different ServerConfig profiles.
+
+Serves GetModel from an in-memory model store (no database or Redis) so the
+numbers reflect transport settings only: concurrency limit, flow-control
+windows and compression, across response payload sizes.
+
+    python -m benchmarks.grpc_server_benchmark --duration 5 --concurrency 64
+"""
+import argparse
+import asyncio
+import os
+import random
+import string
+import time
+from datetime import datetime
+from typing import Dict, List
+
+import grpc
+
+from src import smart_service_pb2 as pb2
+from src import smart_service_pb2_grpc as pb2_grpc
+from src.models.models import ModelStatus, ModelType
+from src.models.snapshot import ModelSnapshot
+from src.services.service import SmartServiceServicer
+from src.utils.grpc_server import ServerConfig, create_server
+
+PROFILES: Dict[str, ServerConfig] = {
+    'default': ServerConfig(),
+    'gzip': ServerConfig(compression=grpc.Compression.Gzip),
+    'deflate': ServerConfig(compression=grpc.Compression.Deflate),
+    'limited-64': ServerConfig(max_concurrent_rpcs=64),
+    'fixed-window-1mb': ServerConfig(http2_bdp_probe=False, http2_lookahead_bytes=1024 * 1024),
+}
+
+
+class InMemoryModelService:
+    """Just enough of ModelService for GetModel, returning a model with a fixed-size payload"""
+
+    def __init__(self, payload_bytes: int):
+        # Random text so compression ratios are not flattered by repetition
+        description = ''.join(random.choices(string.ascii_letters + ' ', k=payload_bytes))
+        now = datetime.utcnow()
+        self.model = ModelSnapshot(
+            id='bench-model', name='bench', type=ModelType.DEVICE, status=ModelStatus.ACTIVE,
+            version='1.0.0', revision=1, category='bench', vendor=None, description=description,
+            meta_info={}, configuration={}, capabilities=[], security_level=None,
+            authentication_required=False, created_at=now, updated_at=now, created_by='bench',
+            is_active=True, features=[], integrations=[], tags=[]
+        )
+
+    async def get_model(self, model_id: str, fetch_plan: str = 'full', fields=None):
+        return self.model
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def run_case(config: ServerConfig, payload_bytes: int, concurrency: int, duration: float) -> Dict:
+    server = create_server(config)
+    pb2_grpc.add_SmartServiceServicer_to_server(
+        SmartServiceServicer(model_service=InMemoryModelService(payload_bytes)), server
+    )
+    port = server.add_insecure_port('127.0.0.1:0')
+    await server.start()
+
+    latencies: List[float] = []
+    errors = 0
+    channel = grpc.aio.insecure_channel(f'127.0.0.1:{port}', options=[
+        ('grpc.max_receive_message_length', config.max_message_bytes),
+    ])
+    stub = pb2_grpc.SmartServiceStub(channel)
+    request = pb2.GetModelRequest(id='bench-model')
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                await stub.GetModel(request)
+                latencies.append(time.perf_counter() - start)
+            except grpc.RpcError:
+                errors += 1
+
+    try:
+        await stub.GetModel(request)
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        await channel.close()
+        await server.stop(None)
+
+    return {
+        'rps': len(latencies) / duration,
+        'p50_ms': percentile(latencies, 0.50) * 1000 if latencies else float('nan'),
+        'p99_ms': percentile(latencies, 0.99) * 1000 if latencies else float('nan'),
+        'errors': errors,
+    }
+
+
+async def main(args):
+    profiles = {name: PROFILES[name] for name in args.profiles}
+    print(f"{'profile':<18}{'payload':>10}{'rps':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for payload_bytes in args.payload_sizes:
+        for name, config in profiles.items():
+            result = await run_case(config, payload_bytes, args.concurrency, args.duration)
+            print(f"{name:<18}{payload_bytes:>10}{result['rps']:>10.0f}"
+                  f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['errors']:>8}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--duration', type=float, default=float(os.getenv('BENCH_DURATION', '5')))
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--payload-sizes', type=int, nargs='+', default=[1024, 64 * 1024, 1024 * 1024])
+    parser.add_argument('--profiles', nargs='+', choices=sorted(PROFILES), default=sorted(PROFILES))
+    asyncio.run(main(parser.parse_args()))
@@ -7,8 +7,12 @@ setup(
     install_requires=[
         "grpcio",
         "grpcio-tools",
+        "grpcio-health-checking",
         "sqlalchemy",
         "psycopg2-binary",
+        "asyncpg",
         "python-dotenv",
+        "redis",
+        "msgpack",
     ],
 )
\ No newline at end of file
@@ -0,0 +1,4 @@
+from src.client.channel_pool import ChannelPool, build_service_config, RETRYABLE_METHODS
+from src.client.client import SmartServiceClient
+
+__all__ = ['ChannelPool', 'SmartServiceClient', 'build_service_config', 'RETRYABLE_METHODS']
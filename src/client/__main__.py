@@ -0,0 +1,39 @@
+import asyncio
+import os
+
+import grpc
+
+from src.client import SmartServiceClient
+
+
+async def run():
+    async with SmartServiceClient(os.getenv('SMART_SERVICE_TARGET', 'localhost:50051'), user_id='demo') as client:
+        try:
+            print("\n1. Smart Model Oluşturuluyor...")
+            model = await client.create_model({
+                'name': "Akıllı Kamera",
+                'type': "DEVICE",
+                'category': "camera",
+                'description': "360 derece dönebilen güvenlik kamerası"
+            })
+            print(f"Model oluşturuldu: ID = {model.id}")
+
+            print("\n2. Model Bilgileri Alınıyor...")
+            model = await client.get_model(model.id)
+            print(f"Model bulundu: {model.name}")
+
+            print("\n3. Kameralar Listeleniyor...")
+            response = await client.search_models(category="camera")
+            for found in response.models:
+                print(f"- {found.name} ({found.type}): {found.description}")
+
+            print("\n4. Model Durumu Alınıyor...")
+            status = await client.get_model_status(model.id)
+            print(f"Durum: {status.status}")
+
+        except grpc.aio.AioRpcError as e:
+            print(f"Hata oluştu: {e.details()}")
+
+
+if __name__ == '__main__':
+    asyncio.run(run())
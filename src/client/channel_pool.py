@@ -0,0 +1,108 @@
+import asyncio
+import itertools
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import grpc
+
+from src import smart_service_pb2
+from src import smart_service_pb2_grpc as pb2_grpc
+
+SERVICE_NAME = smart_service_pb2.DESCRIPTOR.services_by_name['SmartService'].full_name
+
+# Safe to replay: reads, plus StreamModels before its first chunk arrives
+RETRYABLE_METHODS = (
+    'GetModel', 'BatchGetModels', 'SearchModels', 'StreamModels', 'TextSearchModels', 'GetModelStatus'
+)
+
+
+def build_service_config(
+        max_attempts: int = 4,
+        initial_backoff: float = 0.1,
+        max_backoff: float = 2.0,
+        backoff_multiplier: float = 2.0,
+        retryable_status_codes: Sequence[str] = ('UNAVAILABLE', 'RESOURCE_EXHAUSTED'),
+        methods: Sequence[str] = RETRYABLE_METHODS
+) -> Dict[str, Any]:
+    """gRPC service config retrying idempotent RPCs with exponential backoff.
+
+    Retry throttling stops retries once too many calls fail, so an overloaded
+    server isn't hit with extra attempts on top of the load that broke it.
+    """
+    return {
+        'methodConfig': [{
+            'name': [{'service': SERVICE_NAME, 'method': method} for method in methods],
+            'retryPolicy': {
+                'maxAttempts': max_attempts,
+                'initialBackoff': f'{initial_backoff}s',
+                'maxBackoff': f'{max_backoff}s',
+                'backoffMultiplier': backoff_multiplier,
+                'retryableStatusCodes': list(retryable_status_codes),
+            },
+        }],
+        'retryThrottling': {'maxTokens': 100, 'tokenRatio': 0.1},
+    }
+
+
+class ChannelPool:
+    """Fixed set of channels to one target, handed out round-robin.
+
+    One HTTP/2 connection caps concurrent streams (typically 100) and is
+    served by a single server worker; several channels, each with its own
+    connection, spread load across both. Channels are created lazily by
+    gRPC, so an unused pool opens no connections.
+    """
+
+    def __init__(
+            self,
+            target: str,
+            size: int = 4,
+            credentials: Optional[grpc.ChannelCredentials] = None,
+            service_config: Optional[Dict[str, Any]] = None,
+            compression: Optional[grpc.Compression] = None,
+            options: Sequence[Tuple[str, Any]] = ()
+    ):
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        self.target = target
+        channel_options = self._channel_options(service_config, options)
+        self._channels: List[grpc.aio.Channel] = [
+            grpc.aio.secure_channel(target, credentials, options=channel_options, compression=compression)
+            if credentials is not None else
+            grpc.aio.insecure_channel(target, options=channel_options, compression=compression)
+            for _ in range(size)
+        ]
+        self._stubs = [pb2_grpc.SmartServiceStub(channel) for channel in self._channels]
+        self._next = itertools.cycle(range(size))
+
+    @staticmethod
+    def _channel_options(service_config, options) -> List[Tuple[str, Any]]:
+        channel_options = [
+            # Without this, channels with identical arguments share one connection
+            ('grpc.use_local_subchannel_pool', 1),
+            # Within the server's min ping interval (GRPC_MIN_PING_INTERVAL_MS)
+            ('grpc.keepalive_time_ms', 30_000),
+            ('grpc.keepalive_timeout_ms', 10_000),
+        ]
+        if service_config is not None:
+            channel_options += [
+                ('grpc.enable_retries', 1),
+                ('grpc.service_config', json.dumps(service_config)),
+            ]
+        return channel_options + list(options)
+
+    @property
+    def size(self) -> int:
+        return len(self._channels)
+
+    def stub(self) -> pb2_grpc.SmartServiceStub:
+        return self._stubs[next(self._next)]
+
+    async def wait_until_ready(self, timeout: Optional[float] = None):
+        """Connect every channel up front instead of on the first calls"""
+        for channel in self._channels:
+            await asyncio.wait_for(channel.channel_ready(), timeout)
+
+    async def close(self, grace: Optional[float] = None):
+        for channel in self._channels:
+            await channel.close(grace)
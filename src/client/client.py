@@ -0,0 +1,286 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Union
+
+import grpc
+
+from google.protobuf import field_mask_pb2
+
+from src import smart_service_pb2 as pb2
+from src.client.channel_pool import ChannelPool, build_service_config
+
+logger = logging.getLogger(__name__)
+
+# Per-call deadlines in seconds; RPCs not listed use the client's default timeout
+DEFAULT_TIMEOUTS = {
+    'BatchGetModels': 10.0,
+    'BatchCreateModels': 30.0,
+    'StreamModels': 300.0,
+}
+
+# Server-side limits (MAX_BATCH_GET_IDS); batch helpers split larger inputs
+MAX_BATCH_GET_IDS = 1000
+DEFAULT_BATCH_CREATE_SIZE = 500
+
+ModelRequest = Union[pb2.CreateModelRequest, Dict[str, Any]]
+
+
+class SmartServiceClient:
+    """asyncio client for SmartService.
+
+    Calls are spread round-robin over a pool of channels, every unary call
+    carries a deadline, and reads are retried on UNAVAILABLE/RESOURCE_EXHAUSTED
+    through the channels' service config. After a successful write, calls
+    for the same user carry the write's time (``x-read-after``) so the server
+    serves them from the primary database rather than a lagging replica, on
+    whichever worker they land. Use it as an async context manager or call
+    close() when done::
+
+        async with SmartServiceClient('smart-service:50051', user_id='svc-reports') as client:
+            models = await client.get_models(ids)
+    """
+
+    def __init__(
+            self,
+            target: str = 'localhost:50051',
+            pool_size: int = 4,
+            timeout: float = 5.0,
+            timeouts: Optional[Dict[str, float]] = None,
+            user_id: Optional[str] = None,
+            retry_policy: Optional[Dict[str, Any]] = None,
+            retries: bool = True,
+            compression: Optional[grpc.Compression] = None,
+            credentials: Optional[grpc.ChannelCredentials] = None,
+            options: Sequence = ()
+    ):
+        self.timeout = timeout
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.user_id = user_id
+        # User id -> Unix time of that user's last successful write through this client
+        self._last_writes: Dict[Optional[str], float] = {}
+        service_config = (retry_policy or build_service_config()) if retries else None
+        self.pool = ChannelPool(
+            target,
+            size=pool_size,
+            credentials=credentials,
+            service_config=service_config,
+            compression=compression,
+            options=options
+        )
+
+    async def __aenter__(self) -> 'SmartServiceClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self, grace: Optional[float] = None):
+        await self.pool.close(grace)
+
+    def _call_options(self, method: str, timeout: Optional[float], user_id: Optional[str]) -> Dict[str, Any]:
+        user_id = user_id or self.user_id
+        options = {'timeout': timeout if timeout is not None else self.timeouts.get(method, self.timeout)}
+        metadata = []
+        if user_id:
+            metadata.append(('x-user-id', user_id))
+        if user_id in self._last_writes:
+            metadata.append(('x-read-after', f'{self._last_writes[user_id]:.6f}'))
+        if metadata:
+            options['metadata'] = tuple(metadata)
+        return options
+
+    def _record_write(self, user_id: Optional[str]):
+        self._last_writes[user_id or self.user_id] = time.time()
+
+    # Models
+
+    async def create_model(self, model: ModelRequest, timeout: Optional[float] = None,
+                           user_id: Optional[str] = None) -> pb2.SmartModel:
+        request = self._create_request(model)
+        if not request.user_id and (user_id or self.user_id):
+            request.user_id = user_id or self.user_id
+        model = await self.pool.stub().CreateModel(request, **self._call_options('CreateModel', timeout, user_id))
+        self._record_write(user_id)
+        return model
+
+    async def get_model(self, model_id: str, timeout: Optional[float] = None,
+                        user_id: Optional[str] = None, *,
+                        fields: Optional[Sequence[str]] = None) -> Optional[pb2.SmartModel]:
+        """The model, or None if it doesn't exist; ``fields`` limits what the server loads and sends"""
+        try:
+            return await self.pool.stub().GetModel(
+                pb2.GetModelRequest(id=model_id, read_mask=_read_mask(fields)),
+                **self._call_options('GetModel', timeout, user_id)
+            )
+        except grpc.aio.AioRpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                return None
+            raise
+
+    async def delete_model(self, model_id: str, timeout: Optional[float] = None,
+                           user_id: Optional[str] = None) -> bool:
+        """Soft-delete a model; False if it was already gone"""
+        try:
+            await self.pool.stub().DeleteModel(
+                pb2.DeleteModelRequest(model_id=model_id, user_id=user_id or self.user_id or ''),
+                **self._call_options('DeleteModel', timeout, user_id)
+            )
+            self._record_write(user_id)
+            return True
+        except grpc.aio.AioRpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                return False
+            raise
+
+    async def search_models(self, type: Optional[str] = None, category: Optional[str] = None,
+                            status: Optional[int] = None, capabilities: Sequence[str] = (),
+                            page: int = 0, size: int = 20, timeout: Optional[float] = None,
+                            user_id: Optional[str] = None, *,
+                            fields: Optional[Sequence[str]] = None, cursor: Optional[str] = None,
+                            count_mode: int = pb2.COUNT_EXACT) -> pb2.SearchModelsResponse:
+        """One page of matching models; pass the response's ``next_cursor`` back as ``cursor`` for the next one"""
+        request = pb2.SearchModelsRequest(
+            type=type or '', category=category or '', capabilities=capabilities, page=page, size=size,
+            read_mask=_read_mask(fields), cursor=cursor or '', count_mode=count_mode
+        )
+        if status is not None:
+            request.status = status
+        return await self.pool.stub().SearchModels(request, **self._call_options('SearchModels', timeout, user_id))
+
+    async def text_search_models(self, query: str, page: int = 0, size: int = 20,
+                                 timeout: Optional[float] = None, user_id: Optional[str] = None, *,
+                                 fields: Optional[Sequence[str]] = None) -> pb2.SearchModelsResponse:
+        return await self.pool.stub().TextSearchModels(
+            pb2.TextSearchModelsRequest(query=query, page=page, size=size, read_mask=_read_mask(fields)),
+            **self._call_options('TextSearchModels', timeout, user_id)
+        )
+
+    async def stream_models(self, type: Optional[str] = None, category: Optional[str] = None,
+                            status: Optional[int] = None, capabilities: Sequence[str] = (),
+                            chunk_size: int = 0, timeout: Optional[float] = None,
+                            user_id: Optional[str] = None, *,
+                            fields: Optional[Sequence[str]] = None) -> AsyncIterator[pb2.SmartModel]:
+        """Every matching model, received in server-sized chunks; the deadline covers the whole stream"""
+        request = pb2.StreamModelsRequest(
+            type=type or '', category=category or '', capabilities=capabilities, chunk_size=chunk_size,
+            read_mask=_read_mask(fields)
+        )
+        if status is not None:
+            request.status = status
+        call = self.pool.stub().StreamModels(request, **self._call_options('StreamModels', timeout, user_id))
+        try:
+            async for chunk in call:
+                for model in chunk.models:
+                    yield model
+        finally:
+            call.cancel()
+
+    # Batch helpers
+
+    async def get_models(self, model_ids: Sequence[str], concurrency: int = 4,
+                         timeout: Optional[float] = None, user_id: Optional[str] = None, *,
+                         fields: Optional[Sequence[str]] = None) -> List[Optional[pb2.SmartModel]]:
+        """Models in the order of ``model_ids`` (None where missing).
+
+        Ids are deduplicated and split into BatchGetModels calls of at most
+        MAX_BATCH_GET_IDS, ``concurrency`` of them in flight at once.
+        """
+        unique_ids = list(dict.fromkeys(model_ids))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(chunk: List[str]) -> pb2.BatchGetModelsResponse:
+            async with semaphore:
+                return await self.pool.stub().BatchGetModels(
+                    pb2.BatchGetModelsRequest(ids=chunk, read_mask=_read_mask(fields)),
+                    **self._call_options('BatchGetModels', timeout, user_id)
+                )
+
+        responses = await asyncio.gather(*(fetch(chunk) for chunk in _chunks(unique_ids, MAX_BATCH_GET_IDS)))
+        found = {
+            result.id: result.model
+            for response in responses
+            for result in response.results
+            if result.found
+        }
+        return [found.get(model_id) for model_id in model_ids]
+
+    async def create_models(self, models: Iterable[ModelRequest], batch_size: int = DEFAULT_BATCH_CREATE_SIZE,
+                            concurrency: int = 4, timeout: Optional[float] = None,
+                            user_id: Optional[str] = None) -> List[pb2.BatchCreateModelResult]:
+        """Create many models through BatchCreateModels; one result per input, indexed into ``models``"""
+        requests = [self._create_request(model) for model in models]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def create(offset: int, chunk: List[pb2.CreateModelRequest]) -> List[pb2.BatchCreateModelResult]:
+            async with semaphore:
+                response = await self.pool.stub().BatchCreateModels(
+                    pb2.BatchCreateModelsRequest(models=chunk, user_id=user_id or self.user_id or ''),
+                    **self._call_options('BatchCreateModels', timeout, user_id)
+                )
+            if any(result.success for result in response.results):
+                self._record_write(user_id)
+            for result in response.results:
+                result.index += offset
+            return list(response.results)
+
+        batches = await asyncio.gather(*(
+            create(offset, requests[offset:offset + batch_size])
+            for offset in range(0, len(requests), batch_size)
+        ))
+        return [result for batch in batches for result in batch]
+
+    # Status
+
+    async def get_model_status(self, model_id: str, timeout: Optional[float] = None,
+                               user_id: Optional[str] = None) -> pb2.ModelStatusResponse:
+        return await self.pool.stub().GetModelStatus(
+            pb2.GetModelStatusRequest(model_id=model_id), **self._call_options('GetModelStatus', timeout, user_id)
+        )
+
+    async def watch_model_status(self, model_ids: Sequence[str], user_id: Optional[str] = None,
+                                 reconnect: bool = True, reconnect_delay: float = 1.0,
+                                 max_reconnect_delay: float = 30.0) -> AsyncIterator[pb2.ModelStatusUpdate]:
+        """Status snapshots then changes for ``model_ids``; runs until cancelled, so no deadline.
+
+        Servers end long-lived streams with UNAVAILABLE when they recycle the
+        connection (GRPC_MAX_CONNECTION_AGE_MS) or shut down. With ``reconnect``
+        the watch then re-subscribes, backing off from ``reconnect_delay`` while
+        the server stays unreachable. A re-subscription starts again with
+        ``snapshot`` updates, so changes missed in between are covered by them.
+        """
+        options = self._call_options('WatchModelStatus', None, user_id)
+        options['timeout'] = None
+        delay = reconnect_delay
+        while True:
+            call = self.pool.stub().WatchModelStatus(pb2.WatchModelStatusRequest(model_ids=model_ids), **options)
+            try:
+                async for update in call:
+                    delay = reconnect_delay
+                    yield update
+                return
+            except grpc.aio.AioRpcError as e:
+                if not reconnect or e.code() != grpc.StatusCode.UNAVAILABLE:
+                    raise
+                logger.warning(f"WatchModelStatus stream lost ({e.details()}), re-subscribing in {delay:.1f}s")
+            finally:
+                call.cancel()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_reconnect_delay)
+
+    @staticmethod
+    def _create_request(model: ModelRequest) -> pb2.CreateModelRequest:
+        if isinstance(model, pb2.CreateModelRequest):
+            request = pb2.CreateModelRequest()
+            request.CopyFrom(model)
+            return request
+        return pb2.CreateModelRequest(**model)
+
+
+def _read_mask(fields: Optional[Sequence[str]]) -> Optional[field_mask_pb2.FieldMask]:
+    return field_mask_pb2.FieldMask(paths=fields) if fields else None
+
+
+def _chunks(items: List[str], size: int) -> Iterable[List[str]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
@@ -43,8 +43,12 @@ class IntegrationManager:
 
     async def health_check_all(self) -> Dict[str, bool]:
         health_status = {}
-        for int_id, integration in self.active_integrations.items():
-            health_status[int_id] = await integration.health_check()
+        for int_id, integration in list(self.active_integrations.items()):
+            try:
+                health_status[int_id] = bool(await integration.health_check())
+            except Exception as e:
+                logger.error(f"Health check failed for {int_id}: {str(e)}")
+                health_status[int_id] = False
         return health_status
 
     async def cleanup(self):
@@ -1,14 +1,15 @@
 from sqlalchemy import (
     Column, String, JSON, DateTime, Text, ForeignKey,
-    Enum, Boolean, Integer, Float, Table
+    Enum, Boolean, Integer, Float, Table, Index, DDL, event, text
 )
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncAttrs
+from sqlalchemy.orm import declarative_base, relationship
 from datetime import datetime
 import uuid
 from enum import Enum as PyEnum
 
-Base = declarative_base()
+Base = declarative_base(cls=AsyncAttrs)
 
 model_tags = Table('model_tags', Base.metadata,
                    Column('model_id', String(36), ForeignKey('smart_models.id')),
@@ -77,7 +78,7 @@ class SmartModel(Base):
     description = Column(Text)
     meta_info = Column(JSON)
     configuration = Column(JSON)
-    capabilities = Column(JSON)
+    capabilities = Column(JSON().with_variant(JSONB(), 'postgresql'))
 
     security_level = Column(Enum(SecurityLevel), default=SecurityLevel.MEDIUM)
     authentication_required = Column(Boolean, default=True)
@@ -86,10 +87,30 @@ class SmartModel(Base):
     updated_at = Column(DateTime, onupdate=datetime.utcnow)
     created_by = Column(String(255))
     is_active = Column(Boolean, default=True)
+    deleted_at = Column(DateTime)
 
     features = relationship("SmartFeature", back_populates="model", cascade="all, delete-orphan")
     integrations = relationship("ModelIntegration", back_populates="model", cascade="all, delete-orphan")
     tags = relationship("Tag", secondary=model_tags, backref="models")
+    capability_entries = relationship("ModelCapability", cascade="all, delete-orphan")
+    status_projection = relationship(
+        "ModelStatusProjection", uselist=False, cascade="all, delete-orphan"
+    )
+
+    __table_args__ = (
+        # Sort key for keyset pagination
+        Index('ix_smart_models_created_at_id', 'created_at', 'id'),
+        # SearchModels filters, followed by the sort key so pages come straight off the index
+        Index('ix_smart_models_search', 'type', 'category', 'status', 'created_at', 'id'),
+        # Capability containment (@>) on Postgres
+        Index('ix_smart_models_capabilities', 'capabilities', postgresql_using='gin').ddl_if(dialect='postgresql'),
+        # Purge job scan over soft-deleted models
+        Index(
+            'ix_smart_models_deleted_at', 'deleted_at',
+            postgresql_where=text('NOT is_active'),
+            sqlite_where=text('NOT is_active')
+        ),
+    )
 
     def __init__(self, **kwargs):
         kwargs.setdefault('status', ModelStatus.DRAFT)
@@ -103,6 +124,73 @@ class SmartModel(Base):
         super(SmartModel, self).__init__(**kwargs)
 
 
+# Full-text search over name, category and description. Postgres keeps a weighted
+# tsvector in a generated column; SQLite mirrors the columns into an FTS5 table.
+SEARCH_DDL = [
+    DDL(
+        "ALTER TABLE smart_models ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english'::regconfig, coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(category, '')), 'B') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'C')"
+        ") STORED"
+    ).execute_if(dialect='postgresql'),
+    DDL(
+        "CREATE INDEX ix_smart_models_search_vector ON smart_models USING gin (search_vector)"
+    ).execute_if(dialect='postgresql'),
+    DDL(
+        "CREATE VIRTUAL TABLE smart_models_fts USING fts5("
+        "name, category, description, content='smart_models', content_rowid='rowid')"
+    ).execute_if(dialect='sqlite'),
+    DDL(
+        "CREATE TRIGGER smart_models_fts_insert AFTER INSERT ON smart_models BEGIN "
+        "INSERT INTO smart_models_fts(rowid, name, category, description) "
+        "VALUES (new.rowid, new.name, new.category, new.description); END"
+    ).execute_if(dialect='sqlite'),
+    DDL(
+        "CREATE TRIGGER smart_models_fts_delete AFTER DELETE ON smart_models BEGIN "
+        "INSERT INTO smart_models_fts(smart_models_fts, rowid, name, category, description) "
+        "VALUES ('delete', old.rowid, old.name, old.category, old.description); END"
+    ).execute_if(dialect='sqlite'),
+    DDL(
+        "CREATE TRIGGER smart_models_fts_update AFTER UPDATE ON smart_models BEGIN "
+        "INSERT INTO smart_models_fts(smart_models_fts, rowid, name, category, description) "
+        "VALUES ('delete', old.rowid, old.name, old.category, old.description); "
+        "INSERT INTO smart_models_fts(rowid, name, category, description) "
+        "VALUES (new.rowid, new.name, new.category, new.description); END"
+    ).execute_if(dialect='sqlite'),
+]
+
+for ddl in SEARCH_DDL:
+    event.listen(SmartModel.__table__, 'after_create', ddl)
+
+
+class ModelCapability(Base):
+    """Capability lookup table for databases without JSONB containment (SQLite)"""
+    __tablename__ = "model_capabilities"
+
+    model_id = Column(String(36), ForeignKey('smart_models.id'), primary_key=True)
+    capability = Column(String(100), primary_key=True, index=True)
+
+
+class ModelStatusProjection(Base):
+    """Denormalized read model behind GetModelStatus, kept current by writes and health checks"""
+    __tablename__ = "model_status_projections"
+
+    model_id = Column(String(36), ForeignKey('smart_models.id'), primary_key=True)
+    model_status = Column(Enum(ModelStatus), nullable=False)
+    # feature id -> {"status": ..., "last_updated": ...}
+    feature_status = Column(JSON)
+    # integration id -> "HEALTHY" / "UNHEALTHY"
+    integration_status = Column(JSON)
+    integrations_checked_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('feature_status', {})
+        kwargs.setdefault('integration_status', {})
+        super(ModelStatusProjection, self).__init__(**kwargs)
+
+
 class SmartFeature(Base):
     __tablename__ = "smart_features"
 
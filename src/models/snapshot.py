@@ -0,0 +1,233 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import msgpack
+
+from src.models.models import (
+    SmartModel, SmartFeature, ModelIntegration,
+    ModelType, ModelStatus, SecurityLevel, FeatureType
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the field layout below changes; entries written with another
+# version are treated as misses instead of being decoded wrongly.
+SNAPSHOT_VERSION = 1
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass
+class TagSnapshot:
+    id: str
+    name: str
+    category: Optional[str] = None
+
+
+@dataclass
+class FeatureSnapshot:
+    id: str
+    model_id: str
+    name: str
+    description: Optional[str]
+    feature_type: FeatureType
+    parameters: Dict[str, Any]
+    response_schema: Dict[str, Any]
+    constraints: Dict[str, Any]
+    is_active: bool
+    requires_auth: bool
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    created_by: Optional[str]
+
+
+@dataclass
+class IntegrationSnapshot:
+    id: str
+    model_id: str
+    name: str
+    integration_type: str
+    config: Dict[str, Any]
+    status: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
+@dataclass
+class ModelSnapshot:
+    """Detached, read-only copy of a SmartModel loaded with the "full" fetch plan"""
+    id: str
+    name: str
+    type: ModelType
+    status: Optional[ModelStatus]
+    version: str
+    revision: int
+    category: Optional[str]
+    vendor: Optional[str]
+    description: Optional[str]
+    meta_info: Any
+    configuration: Any
+    capabilities: Any
+    security_level: Optional[SecurityLevel]
+    authentication_required: Optional[bool]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    created_by: Optional[str]
+    is_active: Optional[bool]
+    features: List[FeatureSnapshot]
+    integrations: List[IntegrationSnapshot]
+    tags: List[TagSnapshot]
+
+
+def model_cache_key(model_id: str) -> str:
+    return f"model:{model_id}"
+
+
+def _encode_datetime(value: Optional[datetime]) -> Optional[int]:
+    return None if value is None else (value - _EPOCH) // _MICROSECOND
+
+
+def _decode_datetime(value: Optional[int]) -> Optional[datetime]:
+    return None if value is None else _EPOCH + value * _MICROSECOND
+
+
+def _encode_enum(value) -> Optional[str]:
+    return None if value is None else value.value
+
+
+def _decode_enum(enum_type, value):
+    return None if value is None else enum_type(value)
+
+
+class ModelSnapshotCodec:
+    """msgpack encoding of models as positional arrays (no field names on the wire)"""
+
+    @staticmethod
+    def encode(model: SmartModel) -> bytes:
+        return msgpack.packb([
+            SNAPSHOT_VERSION,
+            model.id,
+            model.name,
+            _encode_enum(model.type),
+            _encode_enum(model.status),
+            model.version,
+            model.revision,
+            model.category,
+            model.vendor,
+            model.description,
+            model.meta_info,
+            model.configuration,
+            model.capabilities,
+            _encode_enum(model.security_level),
+            model.authentication_required,
+            _encode_datetime(model.created_at),
+            _encode_datetime(model.updated_at),
+            model.created_by,
+            model.is_active,
+            [ModelSnapshotCodec._encode_feature(f) for f in model.features],
+            [ModelSnapshotCodec._encode_integration(i) for i in model.integrations],
+            [[t.id, t.name, t.category] for t in model.tags],
+        ], use_bin_type=True)
+
+    @staticmethod
+    def decode(payload: bytes) -> Optional[ModelSnapshot]:
+        try:
+            fields = msgpack.unpackb(payload, raw=False)
+            if not fields or fields[0] != SNAPSHOT_VERSION:
+                return None
+            (_, id_, name, type_, status, version, revision, category, vendor, description,
+             meta_info, configuration, capabilities, security_level, authentication_required,
+             created_at, updated_at, created_by, is_active, features, integrations, tags) = fields
+            return ModelSnapshot(
+                id=id_,
+                name=name,
+                type=_decode_enum(ModelType, type_),
+                status=_decode_enum(ModelStatus, status),
+                version=version,
+                revision=revision,
+                category=category,
+                vendor=vendor,
+                description=description,
+                meta_info=meta_info,
+                configuration=configuration,
+                capabilities=capabilities,
+                security_level=_decode_enum(SecurityLevel, security_level),
+                authentication_required=authentication_required,
+                created_at=_decode_datetime(created_at),
+                updated_at=_decode_datetime(updated_at),
+                created_by=created_by,
+                is_active=is_active,
+                features=[ModelSnapshotCodec._decode_feature(f) for f in features],
+                integrations=[ModelSnapshotCodec._decode_integration(i) for i in integrations],
+                tags=[TagSnapshot(*t) for t in tags]
+            )
+        except (ValueError, TypeError, msgpack.UnpackException) as e:
+            logger.error(f"Model snapshot decode failed: {str(e)}")
+            return None
+
+    @staticmethod
+    def _encode_feature(feature: SmartFeature) -> Tuple:
+        return (
+            feature.id,
+            feature.model_id,
+            feature.name,
+            feature.description,
+            _encode_enum(feature.feature_type),
+            feature.parameters,
+            feature.response_schema,
+            feature.constraints,
+            feature.is_active,
+            feature.requires_auth,
+            _encode_datetime(feature.created_at),
+            _encode_datetime(feature.updated_at),
+            feature.created_by,
+        )
+
+    @staticmethod
+    def _decode_feature(fields) -> FeatureSnapshot:
+        (id_, model_id, name, description, feature_type, parameters, response_schema,
+         constraints, is_active, requires_auth, created_at, updated_at, created_by) = fields
+        return FeatureSnapshot(
+            id=id_,
+            model_id=model_id,
+            name=name,
+            description=description,
+            feature_type=_decode_enum(FeatureType, feature_type),
+            parameters=parameters or {},
+            response_schema=response_schema or {},
+            constraints=constraints or {},
+            is_active=is_active,
+            requires_auth=requires_auth,
+            created_at=_decode_datetime(created_at),
+            updated_at=_decode_datetime(updated_at),
+            created_by=created_by
+        )
+
+    @staticmethod
+    def _encode_integration(integration: ModelIntegration) -> Tuple:
+        return (
+            integration.id,
+            integration.model_id,
+            integration.name,
+            integration.integration_type,
+            integration.config,
+            integration.status,
+            _encode_datetime(integration.created_at),
+            _encode_datetime(integration.updated_at),
+        )
+
+    @staticmethod
+    def _decode_integration(fields) -> IntegrationSnapshot:
+        (id_, model_id, name, integration_type, config, status, created_at, updated_at) = fields
+        return IntegrationSnapshot(
+            id=id_,
+            model_id=model_id,
+            name=name,
+            integration_type=integration_type,
+            config=config or {},
+            status=status,
+            created_at=_decode_datetime(created_at),
+            updated_at=_decode_datetime(updated_at)
+        )
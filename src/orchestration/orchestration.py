@@ -1,11 +1,12 @@
 from typing import Dict, Any, List
+import asyncio
 import logging
-from datetime import datetime
 from ..services.model_service import ModelService
 from ..services.feature_service import FeatureService
 from ..integrations.manager import IntegrationManager
 from ..domain.events import ModelCreated, FeatureAdded
 from ..utils.monitoring import monitor
+from ..utils.database import unit_of_work
 
 logger = logging.getLogger(__name__)
 
@@ -21,15 +22,17 @@ class ModelOrchestrator:
         self.model_service = model_service
         self.feature_service = feature_service
         self.integration_manager = integration_manager
+        self.session_factory = model_service.session_factory
 
     @monitor("provision_model")
+    @unit_of_work
     async def provision_model(
             self,
             model_data: Dict[str, Any],
             user_id: str
     ) -> Dict[str, Any]:
         try:
-            model = self.model_service.create_model(model_data, user_id)
+            model = await self.model_service.create_model(model_data, user_id)
 
             integration_results = await self._setup_integrations(
                 model.id,
@@ -100,6 +103,7 @@ class ModelOrchestrator:
         return results
 
     @monitor("model_update")
+    @unit_of_work
     async def update_model_configuration(
             self,
             model_id: str,
@@ -109,7 +113,7 @@ class ModelOrchestrator:
         try:
             health_status = await self.integration_manager.health_check_all()
 
-            updated_model = self.model_service.update_model(
+            updated_model = await self.model_service.update_model(
                 model_id,
                 config_updates,
                 user_id
@@ -134,34 +138,51 @@ class ModelOrchestrator:
         try:
             await self.integration_manager.cleanup()
 
-            self.model_service.delete_model(model_id)
+            await self.model_service.delete_model(model_id, hard=True)
 
         except Exception as e:
             logger.error(f"Cleanup failed: {str(e)}")
 
     @monitor("model_status_check")
+    @unit_of_work(read_only=True)
     async def check_model_status(self, model_id: str) -> Dict[str, Any]:
         try:
-            model = self.model_service.get_model(model_id)
-            if not model:
+            status = await self.model_service.get_model_status(model_id)
+            if not status:
                 raise ValueError(f"Model not found: {model_id}")
-
-            integration_status = await self.integration_manager.health_check_all()
-
-            feature_status = {}
-            for feature in model.features:
-                feature_status[feature.id] = {
-                    "status": feature.status,
-                    "last_updated": feature.updated_at
-                }
-
-            return {
-                "model_status": model.status,
-                "integrations": integration_status,
-                "features": feature_status,
-                "last_checked": datetime.utcnow()
-            }
+            return status
 
         except Exception as e:
             logger.error(f"Status check failed: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    @monitor("integration_health_refresh")
+    async def refresh_integration_health(self) -> Dict[str, bool]:
+        health = await self.integration_manager.health_check_all()
+        await self.model_service.record_integration_health(health)
+        return health
+
+    @monitor("connect_active_integrations")
+    async def connect_active_integrations(self, concurrency: int = 10) -> Dict[str, bool]:
+        """Open connections for every ACTIVE integration not connected yet, ``concurrency`` at a time"""
+        integrations = [
+            integration for integration in await self.model_service.list_active_integrations()
+            if integration.id not in self.integration_manager.active_integrations
+        ]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def connect(integration):
+            async with semaphore:
+                return await self.integration_manager.setup_integration(integration)
+
+        results = await asyncio.gather(*(connect(i) for i in integrations))
+        return {integration.id: result for integration, result in zip(integrations, results)}
+
+    async def run_health_checks(self, interval: float = 60):
+        """Periodically probe integrations and fold the results into the status projections"""
+        while True:
+            try:
+                await self.refresh_integration_health()
+            except Exception as e:
+                logger.error(f"Integration health refresh failed: {str(e)}")
+            await asyncio.sleep(interval)
@@ -0,0 +1,64 @@
+import asyncio
+import logging
+from typing import Any, Dict, Sequence
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .orchestration import ModelOrchestrator
+from ..utils.database import warm_pool
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceWarmup:
+    """Startup warm-up run before the server reports itself ready.
+
+    Fills the database pools, preloads ACTIVE models into the cache and
+    connects active integrations, concurrently and bounded by ``timeout``.
+    A failing or slow step is logged and skipped: serving cold beats never
+    becoming ready.
+    """
+
+    def __init__(
+            self,
+            orchestrator: ModelOrchestrator,
+            engines: Sequence[AsyncEngine] = (),
+            model_limit: int = 1000,
+            integration_concurrency: int = 10,
+            timeout: float = 60.0
+    ):
+        self.orchestrator = orchestrator
+        self.engines = list(engines)
+        self.model_limit = model_limit
+        self.integration_concurrency = integration_concurrency
+        self.timeout = timeout
+
+    async def run(self) -> Dict[str, Any]:
+        steps = {
+            'db_connections': self._warm_pools(),
+            'cached_models': self.orchestrator.model_service.warm_cache(limit=self.model_limit),
+            'integrations': self._connect_integrations(),
+        }
+        tasks = {name: asyncio.ensure_future(step) for name, step in steps.items()}
+        done, pending = await asyncio.wait(tasks.values(), timeout=self.timeout)
+        for task in pending:
+            task.cancel()
+
+        summary = {}
+        for name, task in tasks.items():
+            if task in pending:
+                logger.error(f"Warm-up step {name} timed out after {self.timeout}s")
+            elif task.exception() is not None:
+                logger.error(f"Warm-up step {name} failed: {str(task.exception())}")
+            else:
+                summary[name] = task.result()
+
+        logger.info(f"Warm-up finished: {summary}")
+        return summary
+
+    async def _warm_pools(self) -> int:
+        opened = await asyncio.gather(*(warm_pool(engine) for engine in self.engines))
+        return sum(opened)
+
+    async def _connect_integrations(self) -> int:
+        results = await self.orchestrator.connect_active_integrations(self.integration_concurrency)
+        return sum(1 for connected in results.values() if connected)
@@ -1,28 +1,63 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
-from sqlalchemy.orm import Session
+from typing import Dict, Any, Optional
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 import logging
 
+from src.models.snapshot import model_cache_key
+from src.services.status_projection import StatusProjector
+from src.utils.database import current_session, session_scope
+
 logger = logging.getLogger(__name__)
 
 class BaseService(ABC):
-    def __init__(self, session: Session, cache=None):
-        self.session = session
+    def __init__(self, session_factory: async_sessionmaker, cache=None, status_hub=None):
+        self.session_factory = session_factory
         self.cache = cache
+        self.status_hub = status_hub
+
+    @property
+    def session(self) -> AsyncSession:
+        """Session of the unit of work the current call is running in"""
+        return current_session()
 
-    def commit(self):
+    def session_scope(self):
+        return session_scope(self.session_factory)
+
+    async def commit(self):
         try:
-            self.session.commit()
+            await self.session.commit()
         except Exception as e:
-            self.session.rollback()
+            await self.session.rollback()
+            StatusProjector.take_pending_deltas(self.session)
             logger.error(f"Transaction failed: {str(e)}")
             raise
 
+        deltas = StatusProjector.take_pending_deltas(self.session)
+        if deltas and self.status_hub is not None:
+            await self.status_hub.publish(deltas)
+
+    async def invalidate_model(self, model_id: str, revision: Optional[int] = None):
+        """Evict a model's cached snapshot on every replica after a committed write.
+
+        ``revision`` is the model's revision after the write; snapshots older
+        than it are refused if a slow reader tries to cache them afterwards.
+        """
+        if self.cache:
+            await self.cache.invalidate(model_cache_key(model_id), revision)
+
+    async def invalidate_models(self, revisions: Dict[str, Optional[int]]):
+        """invalidate_model for many models at once, keyed by model id"""
+        if self.cache:
+            await self.cache.invalidate_many(
+                (model_cache_key(model_id), revision) for model_id, revision in revisions.items()
+            )
+
     @abstractmethod
     def validate(self, data: Dict[str, Any]) -> bool:
         pass
 
-    def handle_error(self, error: Exception, context: Dict[str, Any] = None):
-        self.session.rollback()
+    async def handle_error(self, error: Exception, context: Dict[str, Any] = None):
+        await self.session.rollback()
+        StatusProjector.take_pending_deltas(self.session)
         logger.error(f"Service error: {str(error)}, Context: {context}")
-        raise error
\ No newline at end of file
+        raise error
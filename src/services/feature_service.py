@@ -1,15 +1,19 @@
 from typing import Dict, Any, Optional
-from sqlalchemy.orm import Session
-from src.models.models import SmartFeature, FeatureType
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from src.models.models import SmartModel, SmartFeature, FeatureType
 from src.services.base import BaseService
+from src.services.status_projection import StatusProjector
 from src.utils.monitoring import monitor
+from src.utils.database import unit_of_work
 
 
 class FeatureService(BaseService):
-    def __init__(self, session: Session, cache=None):
-        super().__init__(session, cache)
+    def __init__(self, session_factory: async_sessionmaker, cache=None, status_hub=None):
+        super().__init__(session_factory, cache, status_hub)
 
     @monitor("add_feature")
+    @unit_of_work
     async def add_feature(
             self,
             model_id: str,
@@ -31,17 +35,32 @@ class FeatureService(BaseService):
             )
 
             self.session.add(feature)
-            self.commit()
+            await self.session.flush()
+            await StatusProjector.feature_changed(self.session, feature)
+            revision = await self._bump_model_revision(model_id)
+            await self.commit()
+            await self.invalidate_model(model_id, revision)
 
             return feature
 
         except Exception as e:
-            self.handle_error(e, context={
+            await self.handle_error(e, context={
                 'model_id': model_id,
                 'data': data,
                 'user_id': user_id
             })
 
+    async def _bump_model_revision(self, model_id: str) -> Optional[int]:
+        """Features are part of the cached model, so changing one is a new model revision"""
+        result = await self.session.execute(
+            update(SmartModel)
+            .where(SmartModel.id == model_id)
+            .values(revision=SmartModel.revision + 1)
+            .returning(SmartModel.revision)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none()
+
     def validate(self, data: Dict[str, Any]) -> bool:
         required_fields = ['name', 'feature_type']
         for field in required_fields:
@@ -1,38 +1,301 @@
-from typing import Dict, Any, Optional
-from sqlalchemy.orm import Session
+import logging
+import os
+import re
+import uuid
+from dataclasses import dataclass
+from collections import defaultdict
+from datetime import datetime
+from functools import partial
+from typing import Dict, Any, AsyncIterator, Optional, Iterable, List, Tuple, Union
+from sqlalchemy import column, func, insert, literal_column, select, table, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import load_only, selectinload
 from src.domain.rules import BusinessRuleValidationError
-from src.models.models import SmartModel, ModelType
+from src.models.models import (
+    SmartModel, SmartFeature, ModelType, ModelStatus, FeatureType, ModelCapability,
+    ModelIntegration, ModelStatusProjection
+)
+from src.models.snapshot import ModelSnapshot, ModelSnapshotCodec, model_cache_key
 from src.services.base import BaseService
+from src.services.purge import model_delete_statements
+from src.services.status_projection import StatusProjector
+from src.utils.cache import TOMBSTONE
 from src.utils.monitoring import monitor
+from src.utils.database import session_scope, unit_of_work
+from src.utils.pagination import PaginatedResult, PaginationParams, QueryPaginator
+
+logger = logging.getLogger(__name__)
+
+# Fields update_model may change; everything else is owned by the service
+UPDATABLE_FIELDS = ('name', 'category', 'vendor', 'description', 'version', 'meta_info', 'configuration', 'capabilities')
+
+# Entries are invalidated on write across replicas, so this can be long
+MODEL_CACHE_TTL = int(os.getenv('MODEL_CACHE_TTL', '86400'))
+# Tombstones for unknown ids; short, they are only cleared by creates
+MODEL_NEGATIVE_CACHE_TTL = int(os.getenv('MODEL_NEGATIVE_CACHE_TTL', '30'))
+
+# Named relationship loading strategies. Each relationship in a plan costs one
+# extra SELECT ... IN query for the whole result, however many models it holds.
+FETCH_PLANS = {
+    'summary': (),
+    'status': (
+        selectinload(SmartModel.features),
+    ),
+    'features': (
+        selectinload(SmartModel.features),
+    ),
+    'integrations': (
+        selectinload(SmartModel.integrations),
+    ),
+    'full': (
+        selectinload(SmartModel.features),
+        selectinload(SmartModel.integrations),
+        selectinload(SmartModel.tags),
+    ),
+}
+
+# Proto SmartModel fields that map one-to-one onto SmartModel columns; features
+# and integrations come from relationships picked by fetch_plan_for_fields.
+MODEL_COLUMN_FIELDS = frozenset({
+    'id', 'name', 'type', 'category', 'description', 'status', 'version',
+    'configuration', 'created_by', 'created_at', 'updated_at',
+})
+
+
+def fetch_plan_for_fields(fields: Optional[Iterable[str]]) -> str:
+    """Smallest fetch plan loading the relationships behind ``fields`` (None means every field)"""
+    if fields is None:
+        return 'full'
+    features, integrations = 'features' in fields, 'integrations' in fields
+    if features and integrations:
+        return 'full'
+    if features:
+        return 'features'
+    return 'integrations' if integrations else 'summary'
+
+
+@dataclass
+class BatchItemResult:
+    index: int
+    model_id: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
 
 class ModelService(BaseService):
-    def __init__(self, session: Session, cache=None):
-        super().__init__(session, cache)
+    def __init__(self, session_factory: async_sessionmaker, cache=None, status_hub=None):
+        super().__init__(session_factory, cache, status_hub)
 
     @monitor("create_model")
+    @unit_of_work
     async def create_model(self, data: Dict[str, Any], user_id: str) -> SmartModel:
         try:
             self.validate(data)
 
-            model = SmartModel(
-                name=data['name'],
-                type=ModelType(data['type']),
-                category=data.get('category'),
-                description=data.get('description'),
-                version=data.get('version', '1.0'),
-                meta_info=data.get('meta_info', {}),
-                configuration=data.get('configuration', {}),
-                capabilities=data.get('capabilities', []),
-                created_by=user_id
-            )
+            # Id assigned up front so the status delta can name the model before the flush
+            model = SmartModel(id=str(uuid.uuid4()), **self._model_values(data, user_id))
+            self._index_capabilities(model)
+            model.status_projection = StatusProjector.build(model)
+            StatusProjector.model_created(self.session, model.status_projection)
 
             self.session.add(model)
-            self.commit()
+            await self.commit()
+            # Clears a tombstone cached while the id didn't exist yet
+            await self.invalidate_model(model.id, model.revision)
+
+            return model
+
+        except Exception as e:
+            await self.handle_error(e, context={'data': data, 'user_id': user_id})
+
+    @monitor("create_models")
+    @unit_of_work
+    async def create_models(self, items: List[Dict[str, Any]], user_id: str) -> List[BatchItemResult]:
+        """Validate every item, then insert all valid models and features in one transaction.
+
+        Rows go out as multi-row INSERTs instead of one flush per object. Items
+        failing validation are reported individually; if the insert itself fails
+        every valid item is reported with that error.
+        """
+        results = []
+        model_rows, feature_rows, capability_rows = [], [], []
+
+        for index, data in enumerate(items):
+            try:
+                self.validate(data)
+                model_row = {'id': str(uuid.uuid4()), **self._model_values(data, user_id)}
+                features = [
+                    self._feature_row(model_row['id'], feature_data, user_id)
+                    for feature_data in data.get('features', [])
+                ]
+            except (BusinessRuleValidationError, ValueError) as e:
+                results.append(BatchItemResult(index=index, error=str(e)))
+                continue
+
+            model_rows.append(model_row)
+            feature_rows.extend(features)
+            if isinstance(model_row['capabilities'], list):
+                capability_rows.extend(
+                    {'model_id': model_row['id'], 'capability': capability}
+                    for capability in set(model_row['capabilities'])
+                )
+            results.append(BatchItemResult(index=index, model_id=model_row['id']))
+
+        if not model_rows:
+            return results
+
+        try:
+            await self.session.execute(insert(SmartModel), model_rows)
+            if feature_rows:
+                await self.session.execute(insert(SmartFeature), feature_rows)
+            if capability_rows and not self._supports_jsonb():
+                await self.session.execute(insert(ModelCapability), capability_rows)
+            projection_rows = StatusProjector.rows_for_batch(model_rows, feature_rows)
+            await self.session.execute(insert(ModelStatusProjection), projection_rows)
+            for row in projection_rows:
+                StatusProjector.model_created(self.session, ModelStatusProjection(**row))
+            await self.commit()
+        except Exception as e:
+            # Drop the partial inserts so a caller sharing this session can't commit them
+            await self.session.rollback()
+            StatusProjector.take_pending_deltas(self.session)
+            logger.error(f"Batch create failed for {len(model_rows)} models: {str(e)}")
+            for result in results:
+                if result.success:
+                    result.model_id = None
+                    result.error = f"Batch insert failed: {str(e)}"
+            return results
+
+        await self.invalidate_models({row['id']: row.get('revision') or 1 for row in model_rows})
+        return results
+
+    @monitor("update_model")
+    @unit_of_work
+    async def update_model(self, model_id: str, updates: Dict[str, Any], user_id: str) -> SmartModel:
+        try:
+            result = await self.session.execute(
+                self._live_models()
+                .where(SmartModel.id == model_id)
+                .options(selectinload(SmartModel.capability_entries))
+            )
+            model = result.scalars().first()
+            if model is None:
+                raise ValueError(f"Model not found: {model_id}")
+
+            for field in UPDATABLE_FIELDS:
+                if field in updates:
+                    setattr(model, field, updates[field])
+            if 'capabilities' in updates:
+                self._index_capabilities(model)
+
+            if 'status' in updates:
+                status = ModelStatus(updates['status'])
+                if status != model.status:
+                    model.status = status
+                    await StatusProjector.model_status_changed(self.session, model.id, status)
+
+            model.revision = (model.revision or 1) + 1
+            await self.commit()
+            await self.invalidate_model(model.id, model.revision)
 
             return model
 
         except Exception as e:
-            self.handle_error(e, context={'data': data, 'user_id': user_id})
+            await self.handle_error(e, context={'model_id': model_id, 'updates': updates, 'user_id': user_id})
+
+    @monitor("delete_model")
+    @unit_of_work
+    async def delete_model(self, model_id: str, user_id: str = None, hard: bool = False) -> bool:
+        """Soft-delete a model; the purge job removes it and its children later.
+
+        ``hard`` deletes the model and its rows immediately, meant for undoing
+        a model that was never exposed (e.g. a failed provision).
+        """
+        try:
+            model = await self.session.get(SmartModel, model_id)
+            if model is None or (not hard and not model.is_active):
+                return False
+
+            # Also the floor after a hard delete, so a snapshot read just before it can't be cached again
+            revision = (model.revision or 1) + 1
+            if hard:
+                for statement in model_delete_statements([model_id]):
+                    await self.session.execute(statement.execution_options(synchronize_session=False))
+            else:
+                model.is_active = False
+                model.deleted_at = datetime.utcnow()
+                model.revision = revision
+                projection = await self.session.get(ModelStatusProjection, model_id)
+                if projection is not None:
+                    await self.session.delete(projection)
+            StatusProjector.model_deleted(self.session, model_id)
+            await self.commit()
+            await self.invalidate_model(model_id, revision)
+
+            return True
+
+        except Exception as e:
+            await self.handle_error(e, context={'model_id': model_id, 'user_id': user_id, 'hard': hard})
+
+    @monitor("get_model_status")
+    @unit_of_work(read_only=True)
+    async def get_model_status(self, model_id: str) -> Optional[Dict[str, Any]]:
+        """Status from the projection: one primary-key read instead of walking the model"""
+        projection = await self.session.get(ModelStatusProjection, model_id)
+        if projection is None:
+            projection = await self._rebuild_status_projection(model_id)
+            if projection is None:
+                return None
+
+        return {
+            "model_status": projection.model_status,
+            "integrations": projection.integration_status or {},
+            "features": projection.feature_status or {},
+            "last_checked": projection.integrations_checked_at or projection.updated_at
+        }
+
+    @monitor("record_integration_health")
+    @unit_of_work
+    async def record_integration_health(self, health: Dict[str, bool]):
+        """Write health check results into the projections of the models owning the integrations"""
+        if not health:
+            return
+
+        result = await self.session.execute(
+            select(ModelIntegration.id, ModelIntegration.model_id)
+            .where(ModelIntegration.id.in_(list(health)))
+        )
+        by_model = defaultdict(dict)
+        for integration_id, model_id in result.all():
+            by_model[model_id][integration_id] = health[integration_id]
+
+        for model_id, model_health in by_model.items():
+            await StatusProjector.integrations_checked(self.session, model_id, model_health)
+        await self.commit()
+
+    async def _rebuild_status_projection(self, model_id: str) -> Optional[ModelStatusProjection]:
+        """Build the projection of a model created before projections existed.
+
+        Runs in a session of its own on the primary: the read-only unit of work
+        that found the gap may be on a lagging replica and must not write.
+        Concurrent rebuilds of one model skip the conflicting insert and all
+        re-read the row that won.
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                self._apply_fetch_plan(self._live_models().where(SmartModel.id == model_id), 'status')
+            )
+            model = result.scalars().first()
+            if model is None:
+                return None
+
+            await StatusProjector.insert_if_absent(session, StatusProjector.build(model, model.features))
+            await session.commit()
+            return await session.get(ModelStatusProjection, model_id)
 
     def validate(self, data: Dict[str, Any]) -> bool:
         required_fields = ['name', 'type']
@@ -48,30 +311,356 @@ class ModelService(BaseService):
 
         return True
 
+    @staticmethod
+    def _model_values(data: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+        return {
+            'name': data['name'],
+            'type': ModelType(data['type']),
+            'category': data.get('category'),
+            'description': data.get('description'),
+            'version': data.get('version', '1.0'),
+            'meta_info': data.get('meta_info', {}),
+            'configuration': data.get('configuration', {}),
+            'capabilities': data.get('capabilities', []),
+            'created_by': user_id
+        }
+
+    @staticmethod
+    def _feature_row(model_id: str, data: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+        for field in ['name', 'feature_type']:
+            if field not in data:
+                raise BusinessRuleValidationError(f"Missing required field: {field}")
+        try:
+            feature_type = FeatureType(data['feature_type'])
+        except ValueError:
+            raise BusinessRuleValidationError(f"Invalid feature type: {data['feature_type']}")
+
+        return {
+            'id': str(uuid.uuid4()),
+            'model_id': model_id,
+            'name': data['name'],
+            'feature_type': feature_type,
+            'description': data.get('description'),
+            'parameters': data.get('parameters', {}),
+            'response_schema': data.get('response_schema', {}),
+            'constraints': data.get('constraints', {}),
+            'created_by': user_id
+        }
+
     @monitor("get_model")
-    async def get_model(self, model_id: str) -> Optional[SmartModel]:
+    @unit_of_work(read_only=True)
+    async def get_model(
+            self,
+            model_id: str,
+            fetch_plan: str = 'summary',
+            fields: Optional[Iterable[str]] = None
+    ) -> Optional[Union[SmartModel, ModelSnapshot]]:
+        """Model by id; with a cache configured this is a detached ModelSnapshot.
+
+        Cached entries always hold the "full" plan so one entry serves every
+        fetch plan, misses therefore load the full plan too. Concurrent misses
+        for the same id share a single load. ``fields`` limits the columns read
+        on the uncached path, see _apply_fetch_plan.
+        """
         if self.cache:
-            cached = self.cache.get(f"model:{model_id}")
-            if cached:
-                return cached
+            key = model_cache_key(model_id)
+            loader = partial(self._load_snapshot, model_id)
+            payload = await self.cache.get_or_load(
+                key, loader, expire=MODEL_CACHE_TTL, negative_ttl=MODEL_NEGATIVE_CACHE_TTL
+            )
+            snapshot = ModelSnapshotCodec.decode(payload) if payload else None
+            if payload and snapshot is None:
+                # Written by another snapshot version, replace it
+                payload = await self.cache.get_or_load(
+                    key, loader, expire=MODEL_CACHE_TTL, force=True, negative_ttl=MODEL_NEGATIVE_CACHE_TTL
+                )
+                snapshot = ModelSnapshotCodec.decode(payload) if payload else None
+            return snapshot
 
-        model = self.session.query(SmartModel).filter(
-            SmartModel.id == model_id
-        ).first()
+        result = await self.session.execute(
+            self._apply_fetch_plan(
+                self._live_models().where(SmartModel.id == model_id),
+                fetch_plan,
+                fields
+            )
+        )
+        return result.scalars().first()
+
+    @monitor("get_models")
+    @unit_of_work(read_only=True)
+    async def get_models(self, model_ids: List[str]) -> List[Optional[Union[SmartModel, ModelSnapshot]]]:
+        """Models for ``model_ids`` in request order, None where an id doesn't exist.
+
+        Cached ids come from one multi-get (tombstones answer known misses), the
+        rest from a single IN query whose results are written back to the cache.
+        """
+        found: Dict[str, Union[SmartModel, ModelSnapshot, None]] = {}
+        pending = list(dict.fromkeys(model_ids))
+
+        if self.cache and pending:
+            cached = await self.cache.get_many(model_cache_key(model_id) for model_id in pending)
+            for model_id in pending:
+                payload = cached.get(model_cache_key(model_id))
+                if payload == TOMBSTONE:
+                    found[model_id] = None
+                elif payload:
+                    snapshot = ModelSnapshotCodec.decode(payload)
+                    if snapshot is not None:
+                        found[model_id] = snapshot
+            pending = [model_id for model_id in pending if model_id not in found]
+
+        if pending:
+            if self.cache:
+                # Soft-deleted rows are read too, their tombstones need the delete's revision
+                result = await self.session.execute(
+                    select(SmartModel.id, SmartModel.revision)
+                    .where(SmartModel.id.in_(pending), SmartModel.is_active.is_(False))
+                )
+                deleted = dict(result.all())
+            result = await self.session.execute(
+                self._apply_fetch_plan(self._live_models().where(SmartModel.id.in_(pending)), 'full')
+            )
+            models = result.scalars().all()
+            if self.cache:
+                payloads = [(model_cache_key(m.id), ModelSnapshotCodec.encode(m), m.revision) for m in models]
+                await self.cache.set_many(payloads, expire=MODEL_CACHE_TTL)
+                found.update(
+                    (model.id, ModelSnapshotCodec.decode(payload))
+                    for model, (_, payload, _) in zip(models, payloads)
+                )
+                missing = set(pending) - {m.id for m in models}
+                await self.cache.set_many(
+                    [(model_cache_key(model_id), TOMBSTONE, deleted.get(model_id, 0)) for model_id in missing],
+                    expire=MODEL_NEGATIVE_CACHE_TTL
+                )
+            else:
+                found.update((m.id, m) for m in models)
 
-        if model and self.cache:
-            self.cache.set(f"model:{model_id}", model)
+        return [found.get(model_id) for model_id in model_ids]
+
+    @monitor("warm_model_cache")
+    @unit_of_work(read_only=True)
+    async def warm_cache(self, limit: int = 1000, batch_size: int = 200) -> int:
+        """Preload snapshots of the most recently changed ACTIVE models, returns how many"""
+        if not self.cache:
+            return 0
+
+        result = await self.session.execute(
+            self._live_models()
+            .with_only_columns(SmartModel.id)
+            .where(SmartModel.status == ModelStatus.ACTIVE)
+            .order_by(func.coalesce(SmartModel.updated_at, SmartModel.created_at).desc())
+            .limit(limit)
+        )
+        model_ids = list(result.scalars().all())
+
+        warmed = 0
+        for start in range(0, len(model_ids), batch_size):
+            result = await self.session.execute(
+                self._apply_fetch_plan(
+                    self._live_models().where(SmartModel.id.in_(model_ids[start:start + batch_size])),
+                    'full'
+                )
+            )
+            models = result.scalars().all()
+            await self.cache.set_many(
+                [(model_cache_key(m.id), ModelSnapshotCodec.encode(m), m.revision) for m in models],
+                expire=MODEL_CACHE_TTL
+            )
+            warmed += len(models)
+        return warmed
 
-        return model
+    @unit_of_work(read_only=True)
+    async def list_active_integrations(self) -> List[ModelIntegration]:
+        """ACTIVE integrations of models that have not been deleted"""
+        result = await self.session.execute(
+            select(ModelIntegration)
+            .join(SmartModel, SmartModel.id == ModelIntegration.model_id)
+            .where(SmartModel.is_active.is_(True), ModelIntegration.status == 'ACTIVE')
+        )
+        return list(result.scalars().all())
+
+    async def _load_snapshot(self, model_id: str) -> Optional[Tuple[Optional[bytes], int]]:
+        """Encoded "full" snapshot and revision of a model, for the cache loader.
+
+        A soft-deleted model loads as ``(None, revision)`` so its tombstone
+        carries the revision the delete raised the cache floor to.
+        """
+        result = await self.session.execute(
+            self._apply_fetch_plan(select(SmartModel).where(SmartModel.id == model_id), 'full')
+        )
+        model = result.scalars().first()
+        if model is None:
+            return None
+        if not model.is_active:
+            return None, model.revision
+        return ModelSnapshotCodec.encode(model), model.revision
 
     @monitor("list_models")
-    async def list_models(self, filters: Dict[str, Any] = None) -> list[SmartModel]:
-        query = self.session.query(SmartModel)
+    @unit_of_work(read_only=True)
+    async def list_models(
+            self,
+            filters: Dict[str, Any] = None,
+            fetch_plan: str = 'summary',
+            fields: Optional[Iterable[str]] = None
+    ) -> list[SmartModel]:
+        query = self._apply_fetch_plan(self._filter_query(filters), fetch_plan, fields)
+
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def stream_models(
+            self,
+            filters: Dict[str, Any] = None,
+            chunk_size: int = 100,
+            fetch_plan: str = 'full',
+            fields: Optional[Iterable[str]] = None
+    ) -> AsyncIterator[List[SmartModel]]:
+        """Yield live models matching ``filters`` in lists of up to ``chunk_size``.
+
+        Rows are read through a server-side cursor (yield_per), with the fetch
+        plan's relationships loaded per chunk, so memory stays bounded by one
+        chunk however many rows match. Close the iterator (await .aclose())
+        in the task that consumes it, it holds a unit of work open.
+        """
+        query = (
+            self._apply_fetch_plan(self._filter_query(filters), fetch_plan, fields)
+            .order_by(SmartModel.created_at, SmartModel.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        async with session_scope(self.session_factory, read_only=True) as session:
+            result = await session.stream(query)
+            async for models in result.scalars().partitions():
+                yield models
+
+    @monitor("search_models")
+    @unit_of_work(read_only=True)
+    async def search_models(
+            self,
+            filters: Dict[str, Any],
+            params: PaginationParams,
+            fetch_plan: str = 'summary',
+            fields: Optional[Iterable[str]] = None
+    ) -> PaginatedResult[SmartModel]:
+        """Matching models ordered by (created_at, id).
+
+        The first page and any page requested by cursor are read by keyset and
+        carry a ``next_cursor``; ``params.page`` past 0 without a cursor falls
+        back to OFFSET for callers still paging by number.
+        """
+        query = self._filter_query(filters)
+        keys = (SmartModel.created_at, SmartModel.id)
+        if fields is not None:
+            # The sort key is read off the last row to build the cursor
+            fields = {*fields, 'created_at'}
+        page_query = self._apply_fetch_plan(query, fetch_plan, fields)
+
+        if params.cursor or params.page == 0:
+            return await QueryPaginator.paginate_keyset(self.session, page_query, params, keys, count_query=query)
+        return await QueryPaginator.paginate(self.session, page_query.order_by(*keys), params, count_query=query)
+
+    @monitor("text_search_models")
+    @unit_of_work(read_only=True)
+    async def text_search_models(
+            self,
+            text_query: str,
+            params: PaginationParams,
+            fetch_plan: str = 'summary',
+            fields: Optional[Iterable[str]] = None
+    ) -> PaginatedResult[SmartModel]:
+        """Ranked full-text search over model name, category and description"""
+        terms = re.findall(r'\w+', text_query or '')
+        if not terms:
+            raise ValueError("Search query must contain at least one word")
+
+        dialect = self._dialect()
+        if dialect == 'postgresql':
+            ts_query = func.websearch_to_tsquery('english', text_query)
+            vector = literal_column('smart_models.search_vector')
+            query = self._live_models().where(vector.op('@@')(ts_query))
+            ranked = query.order_by(func.ts_rank_cd(vector, ts_query).desc(), SmartModel.id)
+        elif dialect == 'sqlite':
+            fts = table('smart_models_fts', column('rowid'))
+            # Quote every term so user input cannot inject FTS5 query syntax
+            match = ' '.join(f'"{term}"' for term in terms)
+            query = (
+                self._live_models()
+                .join(fts, fts.c.rowid == literal_column('smart_models.rowid'))
+                .where(literal_column('smart_models_fts').op('MATCH')(match))
+            )
+            # bm25 is lower-is-better; weight name > category > description like the tsvector
+            bm25 = func.bm25(literal_column('smart_models_fts'), 10.0, 5.0, 1.0)
+            ranked = query.order_by(bm25, SmartModel.id)
+        else:
+            raise NotImplementedError(f"Full-text search is not supported on {dialect}")
+
+        return await QueryPaginator.paginate(
+            self.session,
+            self._apply_fetch_plan(ranked, fetch_plan, fields),
+            params,
+            count_query=query
+        )
+
+    @staticmethod
+    def _live_models():
+        """Models that have not been soft-deleted"""
+        return select(SmartModel).where(SmartModel.is_active.is_(True))
+
+    def _filter_query(self, filters: Optional[Dict[str, Any]]):
+        query = self._live_models()
+        if not filters:
+            return query
+
+        if 'type' in filters:
+            query = query.where(SmartModel.type == filters['type'])
+        if 'category' in filters:
+            query = query.where(SmartModel.category == filters['category'])
+        if 'status' in filters:
+            query = query.where(SmartModel.status == filters['status'])
+        if filters.get('capabilities'):
+            query = query.where(self._capability_filter(filters['capabilities']))
+
+        return query
+
+    def _capability_filter(self, capabilities: Iterable[str]):
+        """Models having every capability in ``capabilities``"""
+        capabilities = sorted(set(capabilities))
+        if self._supports_jsonb():
+            return type_coerce(SmartModel.capabilities, JSONB).contains(capabilities)
+
+        matching = (
+            select(ModelCapability.model_id)
+            .where(ModelCapability.capability.in_(capabilities))
+            .group_by(ModelCapability.model_id)
+            .having(func.count() == len(capabilities))
+        )
+        return SmartModel.id.in_(matching)
+
+    def _index_capabilities(self, model: SmartModel):
+        if self._supports_jsonb():
+            return
+        capabilities = model.capabilities if isinstance(model.capabilities, list) else []
+        model.capability_entries = [
+            ModelCapability(capability=capability) for capability in set(capabilities)
+        ]
+
+    def _supports_jsonb(self) -> bool:
+        return self._dialect() == 'postgresql'
+
+    def _dialect(self) -> str:
+        return self.session.get_bind().dialect.name
 
-        if filters:
-            if 'type' in filters:
-                query = query.filter(SmartModel.type == filters['type'])
-            if 'category' in filters:
-                query = query.filter(SmartModel.category == filters['category'])
+    @staticmethod
+    def _apply_fetch_plan(query, fetch_plan: str, fields: Optional[Iterable[str]] = None):
+        """Add the plan's relationship loaders; with ``fields``, also read only the columns behind them.
 
-        return query.all()
\ No newline at end of file
+        Columns left out are not loaded at all, so models read with ``fields``
+        must only be used for those fields and never cached.
+        """
+        if fetch_plan not in FETCH_PLANS:
+            raise ValueError(f"Unknown fetch plan: {fetch_plan}")
+        query = query.options(*FETCH_PLANS[fetch_plan])
+        if fields is not None:
+            columns = {'id', *MODEL_COLUMN_FIELDS.intersection(fields)}
+            query = query.options(load_only(*(getattr(SmartModel, name) for name in sorted(columns))))
+        return query
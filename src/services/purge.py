@@ -0,0 +1,135 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.models.models import (
+    SmartModel, SmartFeature, ModelIntegration, ModelCapability, ModelStatusProjection,
+    ModelStatus, model_tags, model_dependencies
+)
+from src.models.snapshot import model_cache_key
+from src.services.status_hub import StatusDelta, StatusHub
+from src.utils.cache import Cache
+from src.utils.database import current_session, unit_of_work
+from src.utils.monitoring import monitor, PURGED_MODELS
+
+logger = logging.getLogger(__name__)
+
+
+def model_delete_statements(model_ids: Sequence[str]) -> List:
+    """Set-based DELETEs removing models and every row that references them, children first"""
+    ids = list(model_ids)
+    return [
+        delete(model_tags).where(model_tags.c.model_id.in_(ids)),
+        delete(model_dependencies).where(or_(
+            model_dependencies.c.dependent_model_id.in_(ids),
+            model_dependencies.c.dependency_model_id.in_(ids)
+        )),
+        delete(ModelCapability).where(ModelCapability.model_id.in_(ids)),
+        delete(ModelStatusProjection).where(ModelStatusProjection.model_id.in_(ids)),
+        delete(SmartFeature).where(SmartFeature.model_id.in_(ids)),
+        delete(ModelIntegration).where(ModelIntegration.model_id.in_(ids)),
+        delete(SmartModel).where(SmartModel.id.in_(ids)),
+    ]
+
+
+class ModelPurgeJob:
+    """Removes soft-deleted (and optionally long-deprecated) models in paced batches.
+
+    Each batch is one short transaction over at most ``batch_size`` models, so a
+    large cleanup never holds many row locks at once, and ``batch_pause`` between
+    batches caps how much write load the job puts next to live traffic. With a
+    ``cache``, purged models are evicted from it, which matters for deprecated
+    models: those are still active and may be cached until the moment they go.
+    For the same reason their deletion is announced on ``status_hub``.
+    """
+
+    def __init__(
+            self,
+            session_factory: async_sessionmaker,
+            retention: timedelta = timedelta(days=7),
+            deprecated_retention: Optional[timedelta] = None,
+            batch_size: int = 500,
+            batch_pause: float = 1.0,
+            max_batches_per_run: int = 100,
+            cache: Optional[Cache] = None,
+            status_hub: Optional[StatusHub] = None
+    ):
+        self.session_factory = session_factory
+        self.cache = cache
+        self.status_hub = status_hub
+        self.retention = retention
+        self.deprecated_retention = deprecated_retention
+        self.batch_size = batch_size
+        self.batch_pause = batch_pause
+        self.max_batches_per_run = max_batches_per_run
+
+    @monitor("purge_batch")
+    @unit_of_work
+    async def purge_batch(self) -> int:
+        session = current_session()
+        result = await session.execute(self._candidates())
+        rows = result.all()
+        revisions = {model_id: revision for model_id, revision, _ in rows}
+        if not revisions:
+            return 0
+
+        for statement in model_delete_statements(list(revisions)):
+            await session.execute(statement.execution_options(synchronize_session=False))
+        await session.commit()
+
+        if self.cache:
+            # Floor past the last revision so a snapshot read just before the purge can't be cached again
+            await self.cache.invalidate_many(
+                (model_cache_key(model_id), (revision or 0) + 1) for model_id, revision in revisions.items()
+            )
+
+        if self.status_hub:
+            # Soft-deleted models were announced when they were deleted
+            await self.status_hub.publish([
+                StatusDelta(model_id=model_id, deleted=True) for model_id, _, is_active in rows if is_active
+            ])
+
+        PURGED_MODELS.inc(len(revisions))
+        return len(revisions)
+
+    async def run_once(self) -> int:
+        purged = 0
+        for _ in range(self.max_batches_per_run):
+            count = await self.purge_batch()
+            purged += count
+            if count < self.batch_size:
+                break
+            await asyncio.sleep(self.batch_pause)
+
+        if purged:
+            logger.info(f"Purged {purged} models")
+        return purged
+
+    async def run(self, interval: float = 3600):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Model purge failed: {str(e)}")
+            await asyncio.sleep(interval)
+
+    def _candidates(self):
+        now = datetime.utcnow()
+        condition = and_(
+            SmartModel.is_active.is_(False),
+            SmartModel.deleted_at < now - self.retention
+        )
+        if self.deprecated_retention is not None:
+            condition = or_(condition, and_(
+                SmartModel.status == ModelStatus.DEPRECATED,
+                func.coalesce(SmartModel.updated_at, SmartModel.created_at) < now - self.deprecated_retention
+            ))
+
+        query = select(SmartModel.id, SmartModel.revision, SmartModel.is_active).where(condition).limit(self.batch_size)
+        if current_session().get_bind().dialect.name == 'postgresql':
+            # Let concurrent purgers (one per replica) take disjoint batches
+            query = query.with_for_update(skip_locked=True)
+        return query
@@ -0,0 +1,35 @@
+from typing import FrozenSet, Optional
+
+from google.protobuf import field_mask_pb2
+
+from src import smart_service_pb2 as pb2
+
+
+class ModelReadMask:
+    """A request's FieldMask over SmartModel, resolved once per call.
+
+    ``fields`` holds the top-level fields the paths touch; those decide what
+    gets loaded and converted. Paths into a sub-message (e.g.
+    ``configuration.settings``) are applied afterwards by trim().
+    """
+
+    def __init__(self, mask: field_mask_pb2.FieldMask):
+        if not mask.IsValidForDescriptor(pb2.SmartModel.DESCRIPTOR):
+            raise ValueError(f"Invalid read_mask for SmartModel: {', '.join(mask.paths)}")
+        self.mask = mask
+        self.fields: FrozenSet[str] = frozenset(path.split('.', 1)[0] for path in mask.paths)
+        self._nested = any('.' in path for path in mask.paths)
+
+    @classmethod
+    def from_request(cls, request) -> Optional['ModelReadMask']:
+        """None when the request has no read_mask or an empty one, meaning every field"""
+        if not request.HasField('read_mask') or not request.read_mask.paths:
+            return None
+        return cls(request.read_mask)
+
+    def trim(self, message: pb2.SmartModel) -> pb2.SmartModel:
+        if not self._nested:
+            return message
+        trimmed = pb2.SmartModel()
+        self.mask.MergeMessage(message, trimmed)
+        return trimmed
@@ -1,51 +1,280 @@
 import grpc
 from typing import Dict, Any
 import logging
+from google.protobuf import empty_pb2
 
 from src import smart_service_pb2 as pb2
 from src import smart_service_pb2_grpc as pb2_grpc
+from src.models.models import SmartModel, SmartFeature, ModelIntegration, ModelType, ModelStatus
+from src.services.model_service import fetch_plan_for_fields
+from src.services.read_mask import ModelReadMask
+from src.utils.pagination import CountMode, PaginationParams
 from src.utils.monitoring import monitor
+from src.utils.database import bind_read_after, bind_user, unit_of_work
 
 logger = logging.getLogger(__name__)
 
+# StreamModels chunk size when the request leaves it unset, and its upper bound
+DEFAULT_STREAM_CHUNK_SIZE = 100
+MAX_STREAM_CHUNK_SIZE = 1000
+# Upper bound on ids per BatchGetModels call
+MAX_BATCH_GET_IDS = 1000
+# Upper bound on models one WatchModelStatus call can watch
+MAX_WATCHED_MODELS = 1000
+
+# SearchModelsRequest.count_mode -> how the paginator computes the total
+COUNT_MODES = {
+    pb2.COUNT_EXACT: CountMode.EXACT,
+    pb2.COUNT_ESTIMATE: CountMode.ESTIMATE,
+    pb2.COUNT_NONE: CountMode.NONE,
+}
+
+# Builds each proto SmartModel field from a model; read masks pick a subset
+MODEL_FIELD_CONVERTERS = {
+    'id': lambda servicer, model: model.id,
+    'name': lambda servicer, model: model.name,
+    'type': lambda servicer, model: model.type.value,
+    'category': lambda servicer, model: model.category or '',
+    'description': lambda servicer, model: model.description or '',
+    'status': lambda servicer, model: servicer._convert_status(model.status),
+    'version': lambda servicer, model: model.version or '',
+    'configuration': lambda servicer, model: servicer._convert_config(model.configuration),
+    'features': lambda servicer, model: [servicer._convert_to_proto_feature(f) for f in model.features],
+    'integrations': lambda servicer, model: [
+        servicer._convert_to_proto_integration(i) for i in model.integrations
+    ],
+    'created_by': lambda servicer, model: model.created_by or '',
+    'created_at': lambda servicer, model: servicer._format_timestamp(model.created_at),
+    'updated_at': lambda servicer, model: servicer._format_timestamp(model.updated_at),
+}
+
 class SmartServiceServicer(pb2_grpc.SmartServiceServicer):
-    def __init__(self, model_service=None, feature_service=None, orchestrator=None):
+    def __init__(self, model_service=None, feature_service=None, orchestrator=None, session_factory=None,
+                 status_hub=None):
         self.model_service = model_service
         self.feature_service = feature_service
         self.orchestrator = orchestrator
+        self.session_factory = session_factory
+        self.status_hub = status_hub
 
     @monitor("grpc_create_model")
+    @unit_of_work
     async def CreateModel(self, request, context):
         try:
+            self._bind_user(context, request.user_id)
             result = await self.orchestrator.provision_model(
-                {
-                    'name': request.name,
-                    'type': request.type,
-                    'category': request.category,
-                    'description': request.description,
-                    'configuration': self._convert_config(request.configuration),
-                    'integrations': list(request.integrations),
-                    'features': list(request.features)
-                },
+                self._model_request_to_dict(request),
                 request.user_id
             )
-            return self._convert_to_proto_model(result['model'])
+            model = await self.model_service.get_model(result['model'].id, fetch_plan='full')
+            return self._convert_to_proto_model(model)
         except Exception as e:
             logger.error(f"CreateModel failed: {str(e)}")
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
             return pb2.SmartModel()
 
+    @monitor("grpc_batch_create_models")
+    @unit_of_work
+    async def BatchCreateModels(self, request, context):
+        try:
+            self._bind_user(context, request.user_id)
+            results = await self.model_service.create_models(
+                [self._model_request_to_dict(item) for item in request.models],
+                request.user_id
+            )
+            created = sum(1 for r in results if r.success)
+            return pb2.BatchCreateModelsResponse(
+                results=[
+                    pb2.BatchCreateModelResult(
+                        index=r.index,
+                        success=r.success,
+                        model_id=r.model_id or '',
+                        error=r.error or ''
+                    )
+                    for r in results
+                ],
+                created=created,
+                failed=len(results) - created
+            )
+        except Exception as e:
+            logger.error(f"BatchCreateModels failed: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return pb2.BatchCreateModelsResponse()
+
+    @monitor("grpc_get_model")
+    @unit_of_work(read_only=True)
+    async def GetModel(self, request, context):
+        try:
+            self._bind_user(context)
+            read_mask = ModelReadMask.from_request(request)
+            fields = read_mask.fields if read_mask else None
+            model = await self.model_service.get_model(
+                request.id, fetch_plan=fetch_plan_for_fields(fields), fields=fields
+            )
+            if not model:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(f"Model not found: {request.id}")
+                return pb2.SmartModel()
+            return self._convert_to_proto_model(model, read_mask)
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return pb2.SmartModel()
+        except Exception as e:
+            logger.error(f"GetModel failed: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return pb2.SmartModel()
+
+    @monitor("grpc_batch_get_models")
+    @unit_of_work(read_only=True)
+    async def BatchGetModels(self, request, context):
+        try:
+            self._bind_user(context)
+            if len(request.ids) > MAX_BATCH_GET_IDS:
+                raise ValueError(f"At most {MAX_BATCH_GET_IDS} ids per call, got {len(request.ids)}")
+            read_mask = ModelReadMask.from_request(request)
+            models = await self.model_service.get_models(list(request.ids))
+            return pb2.BatchGetModelsResponse(results=[
+                pb2.BatchGetModelResult(id=model_id, found=False) if model is None
+                else pb2.BatchGetModelResult(
+                    id=model_id, found=True, model=self._convert_to_proto_model(model, read_mask)
+                )
+                for model_id, model in zip(request.ids, models)
+            ])
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return pb2.BatchGetModelsResponse()
+        except Exception as e:
+            logger.error(f"BatchGetModels failed: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return pb2.BatchGetModelsResponse()
+
+    @monitor("grpc_delete_model")
+    @unit_of_work
+    async def DeleteModel(self, request, context):
+        try:
+            self._bind_user(context, request.user_id)
+            deleted = await self.model_service.delete_model(request.model_id, request.user_id)
+            if not deleted:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(f"Model not found: {request.model_id}")
+            return empty_pb2.Empty()
+        except Exception as e:
+            logger.error(f"DeleteModel failed: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return empty_pb2.Empty()
+
+    @monitor("grpc_search_models")
+    @unit_of_work(read_only=True)
+    async def SearchModels(self, request, context):
+        try:
+            self._bind_user(context)
+            read_mask = ModelReadMask.from_request(request)
+            fields = read_mask.fields if read_mask else None
+            result = await self.model_service.search_models(
+                self._model_filters(request),
+                PaginationParams(
+                    page=request.page,
+                    size=request.size or 10,
+                    cursor=request.cursor,
+                    count_mode=COUNT_MODES.get(request.count_mode, CountMode.EXACT)
+                ),
+                fetch_plan=fetch_plan_for_fields(fields),
+                fields=fields
+            )
+            return pb2.SearchModelsResponse(
+                models=[self._convert_to_proto_model(m, read_mask) for m in result.items],
+                total=result.metadata.total_items,
+                next_cursor=result.metadata.next_cursor or '',
+                total_is_estimate=result.metadata.total_is_estimate
+            )
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return pb2.SearchModelsResponse()
+        except Exception as e:
+            logger.error(f"SearchModels failed: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return pb2.SearchModelsResponse()
+
+    async def StreamModels(self, request, context):
+        """Stream every matching model in chunks.
+
+        grpc.aio only pulls the next chunk once the previous one has been
+        accepted by HTTP/2 flow control, so a slow client slows the database
+        cursor down instead of making the server buffer the result.
+        """
+        try:
+            chunk_size = min(request.chunk_size or DEFAULT_STREAM_CHUNK_SIZE, MAX_STREAM_CHUNK_SIZE)
+            if chunk_size < 1:
+                raise ValueError(f"Invalid chunk size: {request.chunk_size}")
+            read_mask = ModelReadMask.from_request(request)
+            fields = read_mask.fields if read_mask else None
+            chunks = self.model_service.stream_models(
+                self._model_filters(request), chunk_size, fetch_plan=fetch_plan_for_fields(fields), fields=fields
+            )
+            try:
+                async for models in chunks:
+                    yield pb2.ModelChunk(models=[self._convert_to_proto_model(m, read_mask) for m in models])
+            finally:
+                # Release the database cursor right away when the client goes away mid-stream
+                await chunks.aclose()
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+        except Exception as e:
+            logger.error(f"StreamModels failed: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+
+    @monitor("grpc_text_search_models")
+    @unit_of_work(read_only=True)
+    async def TextSearchModels(self, request, context):
+        try:
+            self._bind_user(context)
+            read_mask = ModelReadMask.from_request(request)
+            fields = read_mask.fields if read_mask else None
+            result = await self.model_service.text_search_models(
+                request.query,
+                PaginationParams(page=request.page, size=request.size or 10),
+                fetch_plan=fetch_plan_for_fields(fields),
+                fields=fields
+            )
+            return pb2.SearchModelsResponse(
+                models=[self._convert_to_proto_model(m, read_mask) for m in result.items],
+                total=result.metadata.total_items
+            )
+        except ValueError as e:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return pb2.SearchModelsResponse()
+        except Exception as e:
+            logger.error(f"TextSearchModels failed: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return pb2.SearchModelsResponse()
+
     @monitor("grpc_get_model_status")
+    @unit_of_work(read_only=True)
     async def GetModelStatus(self, request, context):
         try:
+            self._bind_user(context)
             status = await self.orchestrator.check_model_status(request.model_id)
             return pb2.ModelStatusResponse(
                 model_id=request.model_id,
-                status=status['model_status'],
-                integration_status=status['integrations'],
-                feature_status=status['features'],
-                last_checked=status['last_checked'].isoformat()
+                status=self._convert_status(status['model_status']),
+                integration_status=self._convert_string_map(status['integrations']),
+                feature_status={
+                    feature_id: entry['status'] for feature_id, entry in status['features'].items()
+                },
+                last_checked=self._format_timestamp(status['last_checked'])
             )
         except Exception as e:
             logger.error(f"GetModelStatus failed: {str(e)}")
@@ -53,29 +282,179 @@ class SmartServiceServicer(pb2_grpc.SmartServiceServicer):
             context.set_details(str(e))
             return pb2.ModelStatusResponse()
 
-    def _convert_to_proto_model(self, model: Dict[str, Any]) -> pb2.SmartModel:
-        """Convert model dictionary to proto message"""
-        return pb2.SmartModel(
-            id=model['id'],
-            name=model['name'],
-            type=model['type'],
-            category=model['category'],
-            description=model['description'],
-            status=model['status'],
-            version=model['version'],
-            configuration=self._convert_config(model['configuration']),
-            features=[self._convert_to_proto_feature(f) for f in model['features']],
-            integrations=[self._convert_to_proto_integration(i) for i in model['integrations']],
-            created_by=model['created_by'],
-            created_at=model['created_at'].isoformat(),
-            updated_at=model['updated_at'].isoformat()
+    async def WatchModelStatus(self, request, context):
+        """Push status changes of the requested models instead of having clients poll.
+
+        Subscribes before reading the initial snapshots so nothing committed in
+        between is missed. Updates arriving while the client is still receiving
+        are merged per model, so a slow client gets fewer messages, not a backlog.
+        """
+        model_ids = list(dict.fromkeys(request.model_ids))
+        if not model_ids or len(model_ids) > MAX_WATCHED_MODELS:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(f"Watch between 1 and {MAX_WATCHED_MODELS} models, got {len(model_ids)}")
+            return
+
+        subscription = self.status_hub.subscribe(model_ids)
+        try:
+            for model_id in model_ids:
+                status = await self.model_service.get_model_status(model_id)
+                if status is None:
+                    continue
+                yield pb2.ModelStatusUpdate(
+                    model_id=model_id,
+                    status=self._convert_status(status['model_status']),
+                    integration_status=self._convert_string_map(status['integrations']),
+                    feature_status={
+                        feature_id: entry['status'] for feature_id, entry in status['features'].items()
+                    },
+                    updated_at=self._format_timestamp(status['last_checked']),
+                    snapshot=True
+                )
+
+            while True:
+                for delta in await subscription.next_batch():
+                    update = pb2.ModelStatusUpdate(
+                        model_id=delta.model_id,
+                        integration_status=delta.integration_status,
+                        feature_status=delta.feature_status,
+                        updated_at=self._format_timestamp(delta.updated_at),
+                        deleted=delta.deleted
+                    )
+                    if delta.model_status is not None:
+                        update.status = self._convert_status(delta.model_status)
+                    yield update
+        except Exception as e:
+            logger.error(f"WatchModelStatus failed: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+        finally:
+            subscription.close()
+
+    @staticmethod
+    def _bind_user(context, user_id: str = None):
+        """Attach the calling user to this RPC's unit of work (request field or x-user-id metadata).
+
+        An ``x-read-after`` header (Unix time of the caller's last write) is
+        attached too, so the caller reads its own writes on any worker.
+        """
+        metadata = dict(context.invocation_metadata() or ())
+        bind_user(user_id or metadata.get('x-user-id'))
+        try:
+            bind_read_after(float(metadata['x-read-after']))
+        except (KeyError, ValueError):
+            pass
+
+    @staticmethod
+    def _model_filters(request) -> Dict[str, Any]:
+        """Search filters shared by SearchModels and StreamModels requests"""
+        filters = {}
+        if request.type:
+            filters['type'] = ModelType(request.type)
+        if request.category:
+            filters['category'] = request.category
+        if request.HasField('status'):
+            filters['status'] = ModelStatus(pb2.ModelStatus.Name(request.status))
+        if request.capabilities:
+            filters['capabilities'] = list(request.capabilities)
+        return filters
+
+    def _model_request_to_dict(self, request) -> Dict[str, Any]:
+        """Convert a CreateModelRequest to the dictionary ModelService expects"""
+        return {
+            'name': request.name,
+            'type': request.type,
+            'category': request.category,
+            'description': request.description,
+            'configuration': {
+                'settings': dict(request.configuration.settings),
+                'capabilities': list(request.configuration.capabilities),
+                'metadata': dict(request.configuration.metadata)
+            },
+            'capabilities': list(request.configuration.capabilities),
+            'integrations': [
+                {
+                    'type': integration.type,
+                    'base_url': integration.base_url,
+                    'auth_type': integration.auth_type,
+                    'settings': dict(integration.settings)
+                }
+                for integration in request.integrations
+            ],
+            'features': [
+                {
+                    'name': feature.name,
+                    'feature_type': feature.feature_type,
+                    'description': feature.description,
+                    'parameters': {p.name: p.type for p in feature.parameters},
+                    'response_schema': dict(feature.response_schema),
+                    'constraints': dict(feature.constraints)
+                }
+                for feature in request.features
+            ]
+        }
+
+    def _convert_to_proto_model(self, model: SmartModel, read_mask: ModelReadMask = None) -> pb2.SmartModel:
+        """Convert a model to a proto message, building only the fields ``read_mask`` selects.
+
+        The model must have loaded those fields; the "full" fetch plan covers every field.
+        """
+        if read_mask is None:
+            return pb2.SmartModel(**{
+                name: convert(self, model) for name, convert in MODEL_FIELD_CONVERTERS.items()
+            })
+        message = pb2.SmartModel(**{name: MODEL_FIELD_CONVERTERS[name](self, model) for name in read_mask.fields})
+        return read_mask.trim(message)
+
+    def _convert_to_proto_feature(self, feature: SmartFeature) -> pb2.SmartFeature:
+        return pb2.SmartFeature(
+            id=feature.id,
+            model_id=feature.model_id,
+            name=feature.name,
+            description=feature.description or '',
+            feature_type=feature.feature_type.value,
+            parameters=[
+                pb2.FeatureParameter(name=name, type=str(type_))
+                for name, type_ in (feature.parameters or {}).items()
+            ],
+            response_schema=self._convert_string_map(feature.response_schema),
+            constraints=self._convert_string_map(feature.constraints),
+            requires_auth=bool(feature.requires_auth),
+            status="ACTIVE" if feature.is_active else "INACTIVE",
+            created_by=feature.created_by or '',
+            created_at=self._format_timestamp(feature.created_at),
+            updated_at=self._format_timestamp(feature.updated_at)
         )
 
+    def _convert_to_proto_integration(self, integration: ModelIntegration) -> pb2.IntegrationConfig:
+        config = integration.config or {}
+        return pb2.IntegrationConfig(
+            type=integration.integration_type,
+            base_url=config.get('base_url', ''),
+            auth_type=config.get('auth_type', ''),
+            settings=self._convert_string_map(config.get('settings'))
+        )
+
+    @staticmethod
+    def _convert_status(status) -> int:
+        # The proto enum has no IN_REVIEW, report those models as drafts
+        if status is None or status.value not in pb2.ModelStatus.keys():
+            return pb2.DRAFT
+        return pb2.ModelStatus.Value(status.value)
+
+    @staticmethod
+    def _convert_string_map(values) -> Dict[str, str]:
+        return {str(k): str(v) for k, v in (values or {}).items()}
+
+    @staticmethod
+    def _format_timestamp(value) -> str:
+        return value.isoformat() if value else ''
+
     def _convert_config(self, config) -> pb2.ModelConfiguration:
         if not config:
             return pb2.ModelConfiguration()
         return pb2.ModelConfiguration(
-            settings=config.get('settings', {}),
+            settings=self._convert_string_map(config.get('settings')),
             capabilities=config.get('capabilities', []),
-            metadata=config.get('metadata', {})
+            metadata=self._convert_string_map(config.get('metadata'))
         )
\ No newline at end of file
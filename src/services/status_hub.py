@@ -0,0 +1,162 @@
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.models.models import ModelStatus
+from src.utils.monitoring import STATUS_UPDATES_COALESCED, STATUS_WATCHERS
+
+logger = logging.getLogger(__name__)
+
+STATUS_CHANNEL = 'status:changes'
+
+
+@dataclass
+class StatusDelta:
+    """Change to one model's status; only the fields and entries that changed are set.
+
+    ``deleted`` marks the model's last delta: it was deleted and won't change again.
+    """
+    model_id: str
+    model_status: Optional[ModelStatus] = None
+    feature_status: Dict[str, str] = field(default_factory=dict)
+    integration_status: Dict[str, str] = field(default_factory=dict)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+    deleted: bool = False
+
+    def merge(self, newer: 'StatusDelta') -> 'StatusDelta':
+        return StatusDelta(
+            model_id=self.model_id,
+            model_status=newer.model_status or self.model_status,
+            feature_status={**self.feature_status, **newer.feature_status},
+            integration_status={**self.integration_status, **newer.integration_status},
+            updated_at=max(self.updated_at, newer.updated_at),
+            deleted=self.deleted or newer.deleted
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            'model_id': self.model_id,
+            'model_status': self.model_status.value if self.model_status else None,
+            'feature_status': self.feature_status,
+            'integration_status': self.integration_status,
+            'updated_at': self.updated_at.isoformat(),
+            'deleted': self.deleted
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StatusDelta':
+        return cls(
+            model_id=data['model_id'],
+            model_status=ModelStatus(data['model_status']) if data.get('model_status') else None,
+            feature_status=data.get('feature_status') or {},
+            integration_status=data.get('integration_status') or {},
+            updated_at=datetime.fromisoformat(data['updated_at']),
+            deleted=data.get('deleted', False)
+        )
+
+
+class StatusSubscription:
+    """One watcher's pending updates, at most one merged delta per model.
+
+    A subscriber that reads slower than updates arrive gets fewer, merged
+    deltas instead of a growing backlog.
+    """
+
+    def __init__(self, hub: 'StatusHub', model_ids: Iterable[str]):
+        self.hub = hub
+        self.model_ids = set(model_ids)
+        self._pending: Dict[str, StatusDelta] = {}
+        self._ready = asyncio.Event()
+
+    def offer(self, delta: StatusDelta):
+        pending = self._pending.get(delta.model_id)
+        if pending is not None:
+            STATUS_UPDATES_COALESCED.inc()
+            delta = pending.merge(delta)
+        self._pending[delta.model_id] = delta
+        self._ready.set()
+
+    async def next_batch(self) -> List[StatusDelta]:
+        """Wait for at least one update, then take everything pending"""
+        await self._ready.wait()
+        self._ready.clear()
+        batch = list(self._pending.values())
+        self._pending.clear()
+        return batch
+
+    def close(self):
+        self.hub.unsubscribe(self)
+
+
+class StatusHub:
+    """Fans status changes out to WatchModelStatus subscribers.
+
+    With a Redis client, changes go through the ``status:changes`` channel so
+    watchers on every replica see writes made on any of them; without one
+    they are dispatched in-process only.
+    """
+
+    def __init__(self, redis_client=None, channel: str = STATUS_CHANNEL):
+        self.redis = redis_client
+        self.channel = channel
+        self._subscribers: Dict[str, Set[StatusSubscription]] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    def subscribe(self, model_ids: Iterable[str]) -> StatusSubscription:
+        subscription = StatusSubscription(self, model_ids)
+        for model_id in subscription.model_ids:
+            self._subscribers.setdefault(model_id, set()).add(subscription)
+        STATUS_WATCHERS.inc()
+        return subscription
+
+    def unsubscribe(self, subscription: StatusSubscription):
+        for model_id in subscription.model_ids:
+            subscribers = self._subscribers.get(model_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[model_id]
+        STATUS_WATCHERS.dec()
+
+    async def publish(self, deltas: List[StatusDelta]):
+        if not deltas:
+            return
+        if self.redis is not None and self._listener is not None:
+            try:
+                await self.redis.publish(self.channel, json.dumps([d.to_dict() for d in deltas]))
+                return
+            except Exception as e:
+                logger.error(f"Status publish failed, dispatching locally: {str(e)}")
+        self.dispatch(deltas)
+
+    def dispatch(self, deltas: Iterable[StatusDelta]):
+        for delta in deltas:
+            for subscription in self._subscribers.get(delta.model_id, ()):
+                subscription.offer(delta)
+
+    def start(self, retry_interval: float = 1.0):
+        """Start relaying changes published by every replica (needs a running loop)"""
+        if self.redis is None or self._listener is not None:
+            return
+        self._listener = asyncio.create_task(self._listen(retry_interval))
+
+    def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+
+    async def _listen(self, retry_interval: float):
+        while True:
+            try:
+                async with self.redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        self.dispatch(StatusDelta.from_dict(d) for d in json.loads(message['data']))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Status listener error: {str(e)}")
+            await asyncio.sleep(retry_interval)
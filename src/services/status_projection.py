@@ -0,0 +1,150 @@
+from datetime import datetime
+from typing import Dict, Any, Iterable, List
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.models import ModelStatus, ModelStatusProjection, SmartFeature, SmartModel
+from src.services.status_hub import StatusDelta
+
+
+class StatusProjector:
+    """Applies the writes that affect GetModelStatus to model_status_projections.
+
+    Every method works in the caller's session, so the projection commits in the
+    same transaction as the write that changed it. The change is also queued
+    as a StatusDelta on the session, published to watchers once it commits.
+    """
+
+    @staticmethod
+    def pending_deltas(session: AsyncSession) -> List[StatusDelta]:
+        return session.info.setdefault('status_deltas', [])
+
+    @staticmethod
+    def take_pending_deltas(session: AsyncSession) -> List[StatusDelta]:
+        return session.info.pop('status_deltas', [])
+
+    @staticmethod
+    def feature_entry(feature: SmartFeature) -> Dict[str, Any]:
+        last_updated = feature.updated_at or feature.created_at or datetime.utcnow()
+        return {
+            "status": "ACTIVE" if feature.is_active in (None, True) else "INACTIVE",
+            "last_updated": last_updated.isoformat()
+        }
+
+    @staticmethod
+    def build(model: SmartModel, features: Iterable[SmartFeature] = ()) -> ModelStatusProjection:
+        return ModelStatusProjection(
+            model_id=model.id,
+            model_status=model.status,
+            feature_status={f.id: StatusProjector.feature_entry(f) for f in features},
+            updated_at=datetime.utcnow()
+        )
+
+    @staticmethod
+    async def insert_if_absent(session: AsyncSession, projection: ModelStatusProjection):
+        """Insert ``projection`` unless its model already has one; the existing row wins"""
+        values = {c.key: getattr(projection, c.key) for c in ModelStatusProjection.__table__.columns}
+        dialect = session.get_bind().dialect.name
+        if dialect in ('postgresql', 'sqlite'):
+            dialect_insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+            await session.execute(
+                dialect_insert(ModelStatusProjection).values(values).on_conflict_do_nothing(index_elements=['model_id'])
+            )
+            return
+        try:
+            async with session.begin_nested():
+                await session.execute(insert(ModelStatusProjection).values(values))
+        except IntegrityError:
+            pass
+
+    @staticmethod
+    def rows_for_batch(
+            model_rows: List[Dict[str, Any]],
+            feature_rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Projection rows for models inserted through the bulk path"""
+        now = datetime.utcnow()
+        features_by_model: Dict[str, Dict[str, Any]] = {}
+        for row in feature_rows:
+            features_by_model.setdefault(row['model_id'], {})[row['id']] = {
+                "status": "ACTIVE",
+                "last_updated": now.isoformat()
+            }
+
+        return [
+            {
+                'model_id': row['id'],
+                'model_status': ModelStatus.DRAFT,
+                'feature_status': features_by_model.get(row['id'], {}),
+                'integration_status': {},
+                'updated_at': now
+            }
+            for row in model_rows
+        ]
+
+    @staticmethod
+    def model_created(session: AsyncSession, projection: ModelStatusProjection):
+        """Announce a new model with its initial projection"""
+        StatusProjector.pending_deltas(session).append(StatusDelta(
+            model_id=projection.model_id,
+            model_status=projection.model_status,
+            feature_status={
+                feature_id: entry['status'] for feature_id, entry in (projection.feature_status or {}).items()
+            },
+            updated_at=projection.updated_at
+        ))
+
+    @staticmethod
+    def model_deleted(session: AsyncSession, model_id: str):
+        """Tell watchers the model is gone; removing its projection is up to the delete itself"""
+        StatusProjector.pending_deltas(session).append(StatusDelta(model_id=model_id, deleted=True))
+
+    @staticmethod
+    async def feature_changed(session: AsyncSession, feature: SmartFeature):
+        projection = await session.get(ModelStatusProjection, feature.model_id, with_for_update=True)
+        if projection is None:
+            # Models created before projections existed are rebuilt on first read
+            return
+        feature_status = dict(projection.feature_status or {})
+        feature_status[feature.id] = StatusProjector.feature_entry(feature)
+        projection.feature_status = feature_status
+        projection.updated_at = datetime.utcnow()
+        StatusProjector.pending_deltas(session).append(StatusDelta(
+            model_id=feature.model_id,
+            feature_status={feature.id: feature_status[feature.id]['status']},
+            updated_at=projection.updated_at
+        ))
+
+    @staticmethod
+    async def model_status_changed(session: AsyncSession, model_id: str, status: ModelStatus):
+        projection = await session.get(ModelStatusProjection, model_id, with_for_update=True)
+        if projection is None:
+            return
+        projection.model_status = status
+        projection.updated_at = datetime.utcnow()
+        StatusProjector.pending_deltas(session).append(StatusDelta(
+            model_id=model_id, model_status=status, updated_at=projection.updated_at
+        ))
+
+    @staticmethod
+    async def integrations_checked(session: AsyncSession, model_id: str, health: Dict[str, bool]):
+        projection = await session.get(ModelStatusProjection, model_id, with_for_update=True)
+        if projection is None:
+            return
+        previous = projection.integration_status or {}
+        checked = {
+            integration_id: "HEALTHY" if healthy else "UNHEALTHY"
+            for integration_id, healthy in health.items()
+        }
+        projection.integration_status = {**previous, **checked}
+        projection.integrations_checked_at = datetime.utcnow()
+        projection.updated_at = projection.integrations_checked_at
+
+        # Periodic checks mostly confirm what is known, only report real changes
+        changed = {k: v for k, v in checked.items() if previous.get(k) != v}
+        if changed:
+            StatusProjector.pending_deltas(session).append(StatusDelta(
+                model_id=model_id, integration_status=changed, updated_at=projection.updated_at
+            ))
@@ -12,10 +12,11 @@ _sym_db = _symbol_database.Default()
 
 
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13smart_service.proto\x12\rsmart_service\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"\x92\x02\n\x12ModelConfiguration\x12\x41\n\x08settings\x18\x01 \x03(\x0b\x32/.smart_service.ModelConfiguration.SettingsEntry\x12\x14\n\x0c\x63\x61pabilities\x18\x02 \x03(\t\x12\x41\n\x08metadata\x18\x03 \x03(\x0b\x32/.smart_service.ModelConfiguration.MetadataEntry\x1a/\n\rSettingsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xb9\x01\n\x11IntegrationConfig\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x10\n\x08\x62\x61se_url\x18\x02 \x01(\t\x12\x11\n\tauth_type\x18\x03 \x01(\t\x12@\n\x08settings\x18\x04 \x03(\x0b\x32..smart_service.IntegrationConfig.SettingsEntry\x1a/\n\rSettingsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xf5\x02\n\nSmartModel\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x04 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t\x12*\n\x06status\x18\x06 \x01(\x0e\x32\x1a.smart_service.ModelStatus\x12\x0f\n\x07version\x18\x07 \x01(\t\x12\x38\n\rconfiguration\x18\x08 \x01(\x0b\x32!.smart_service.ModelConfiguration\x12-\n\x08\x66\x65\x61tures\x18\t \x03(\x0b\x32\x1b.smart_service.SmartFeature\x12\x36\n\x0cintegrations\x18\n \x03(\x0b\x32 .smart_service.IntegrationConfig\x12\x12\n\ncreated_by\x18\x0b \x01(\t\x12\x12\n\ncreated_at\x18\x0c \x01(\t\x12\x12\n\nupdated_at\x18\r \x01(\t\"\xd2\x01\n\x10\x46\x65\x61tureParameter\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x10\n\x08required\x18\x03 \x01(\x08\x12\x15\n\rdefault_value\x18\x04 \x01(\t\x12\x45\n\x0b\x63onstraints\x18\x05 \x03(\x0b\x32\x30.smart_service.FeatureParameter.ConstraintsEntry\x1a\x32\n\x10\x43onstraintsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xf5\x03\n\x0cSmartFeature\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08model_id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x14\n\x0c\x66\x65\x61ture_type\x18\x05 \x01(\t\x12\x33\n\nparameters\x18\x06 \x03(\x0b\x32\x1f.smart_service.FeatureParameter\x12H\n\x0fresponse_schema\x18\x07 \x03(\x0b\x32/.smart_service.SmartFeature.ResponseSchemaEntry\x12\x41\n\x0b\x63onstraints\x18\x08 \x03(\x0b\x32,.smart_service.SmartFeature.ConstraintsEntry\x12\x15\n\rrequires_auth\x18\t \x01(\x08\x12\x0e\n\x06status\x18\n \x01(\t\x12\x12\n\ncreated_by\x18\x0b \x01(\t\x12\x12\n\ncreated_at\x18\x0c \x01(\t\x12\x12\n\nupdated_at\x18\r \x01(\t\x1a\x35\n\x13ResponseSchemaEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x32\n\x10\x43onstraintsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x89\x02\n\x12\x43reateModelRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x38\n\rconfiguration\x18\x05 \x01(\x0b\x32!.smart_service.ModelConfiguration\x12\x36\n\x0cintegrations\x18\x06 \x03(\x0b\x32 .smart_service.IntegrationConfig\x12-\n\x08\x66\x65\x61tures\x18\x07 \x03(\x0b\x32\x1b.smart_service.SmartFeature\x12\x0f\n\x07user_id\x18\x08 \x01(\t\"\xa9\x01\n\x12UpdateModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x38\n\rconfiguration\x18\x02 \x01(\x0b\x32!.smart_service.ModelConfiguration\x12\x36\n\x0cintegrations\x18\x03 \x03(\x0b\x32 .smart_service.IntegrationConfig\x12\x0f\n\x07user_id\x18\x04 \x01(\t\"\x1d\n\x0fGetModelRequest\x12\n\n\x02id\x18\x01 \x01(\t\"7\n\x12\x44\x65leteModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\"\x93\x01\n\x13SearchModelsRequest\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x02 \x01(\t\x12*\n\x06status\x18\x03 \x01(\x0e\x32\x1a.smart_service.ModelStatus\x12\x14\n\x0c\x63\x61pabilities\x18\x04 \x03(\t\x12\x0c\n\x04page\x18\x05 \x01(\x05\x12\x0c\n\x04size\x18\x06 \x01(\x05\"P\n\x14SearchModelsResponse\x12)\n\x06models\x18\x01 \x03(\x0b\x32\x19.smart_service.SmartModel\x12\r\n\x05total\x18\x02 \x01(\x05\"d\n\x11\x41\x64\x64\x46\x65\x61tureRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12,\n\x07\x66\x65\x61ture\x18\x02 \x01(\x0b\x32\x1b.smart_service.SmartFeature\x12\x0f\n\x07user_id\x18\x03 \x01(\t\")\n\x15GetModelStatusRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\"\xff\x02\n\x13ModelStatusResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12*\n\x06status\x18\x02 \x01(\x0e\x32\x1a.smart_service.ModelStatus\x12U\n\x12integration_status\x18\x03 \x03(\x0b\x32\x39.smart_service.ModelStatusResponse.IntegrationStatusEntry\x12M\n\x0e\x66\x65\x61ture_status\x18\x04 \x03(\x0b\x32\x35.smart_service.ModelStatusResponse.FeatureStatusEntry\x12\x14\n\x0clast_checked\x18\x05 \x01(\t\x1a\x38\n\x16IntegrationStatusEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x34\n\x12\x46\x65\x61tureStatusEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xda\x01\n\x14UpdateFeatureRequest\x12\x12\n\nfeature_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12G\n\nparameters\x18\x04 \x03(\x0b\x32\x33.smart_service.UpdateFeatureRequest.ParametersEntry\x12\x0f\n\x07user_id\x18\x05 \x01(\t\x1a\x31\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\";\n\x14\x44\x65leteFeatureRequest\x12\x12\n\nfeature_id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t*E\n\x0bModelStatus\x12\t\n\x05\x44RAFT\x10\x00\x12\n\n\x06\x41\x43TIVE\x10\x01\x12\x0e\n\nDEPRECATED\x10\x02\x12\x0f\n\x0bMAINTENANCE\x10\x03*B\n\x0fIntegrationType\x12\x0e\n\nIOT_DEVICE\x10\x00\x12\x13\n\x0fWEATHER_SERVICE\x10\x01\x12\n\n\x06\x43USTOM\x10\x02\x32\xdc\x05\n\x0cSmartService\x12K\n\x0b\x43reateModel\x12!.smart_service.CreateModelRequest\x1a\x19.smart_service.SmartModel\x12K\n\x0bUpdateModel\x12!.smart_service.UpdateModelRequest\x1a\x19.smart_service.SmartModel\x12H\n\x0b\x44\x65leteModel\x12!.smart_service.DeleteModelRequest\x1a\x16.google.protobuf.Empty\x12\x45\n\x08GetModel\x12\x1e.smart_service.GetModelRequest\x1a\x19.smart_service.SmartModel\x12W\n\x0cSearchModels\x12\".smart_service.SearchModelsRequest\x1a#.smart_service.SearchModelsResponse\x12K\n\nAddFeature\x12 .smart_service.AddFeatureRequest\x1a\x1b.smart_service.SmartFeature\x12Q\n\rUpdateFeature\x12#.smart_service.UpdateFeatureRequest\x1a\x1b.smart_service.SmartFeature\x12L\n\rDeleteFeature\x12#.smart_service.DeleteFeatureRequest\x1a\x16.google.protobuf.Empty\x12Z\n\x0eGetModelStatus\x12$.smart_service.GetModelStatusRequest\x1a\".smart_service.ModelStatusResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13smart_service.proto\x12\rsmart_service\x1a\x1bgoogle/protobuf/empty.proto\x1a google/protobuf/field_mask.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"\x92\x02\n\x12ModelConfiguration\x12\x41\n\x08settings\x18\x01 \x03(\x0b\x32/.smart_service.ModelConfiguration.SettingsEntry\x12\x14\n\x0c\x63\x61pabilities\x18\x02 \x03(\t\x12\x41\n\x08metadata\x18\x03 \x03(\x0b\x32/.smart_service.ModelConfiguration.MetadataEntry\x1a/\n\rSettingsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xb9\x01\n\x11IntegrationConfig\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x10\n\x08\x62\x61se_url\x18\x02 \x01(\t\x12\x11\n\tauth_type\x18\x03 \x01(\t\x12@\n\x08settings\x18\x04 \x03(\x0b\x32..smart_service.IntegrationConfig.SettingsEntry\x1a/\n\rSettingsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xf5\x02\n\nSmartModel\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x04 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t\x12*\n\x06status\x18\x06 \x01(\x0e\x32\x1a.smart_service.ModelStatus\x12\x0f\n\x07version\x18\x07 \x01(\t\x12\x38\n\rconfiguration\x18\x08 \x01(\x0b\x32!.smart_service.ModelConfiguration\x12-\n\x08\x66\x65\x61tures\x18\t \x03(\x0b\x32\x1b.smart_service.SmartFeature\x12\x36\n\x0cintegrations\x18\n \x03(\x0b\x32 .smart_service.IntegrationConfig\x12\x12\n\ncreated_by\x18\x0b \x01(\t\x12\x12\n\ncreated_at\x18\x0c \x01(\t\x12\x12\n\nupdated_at\x18\r \x01(\t\"\xd2\x01\n\x10\x46\x65\x61tureParameter\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x10\n\x08required\x18\x03 \x01(\x08\x12\x15\n\rdefault_value\x18\x04 \x01(\t\x12\x45\n\x0b\x63onstraints\x18\x05 \x03(\x0b\x32\x30.smart_service.FeatureParameter.ConstraintsEntry\x1a\x32\n\x10\x43onstraintsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xf5\x03\n\x0cSmartFeature\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08model_id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x14\n\x0c\x66\x65\x61ture_type\x18\x05 \x01(\t\x12\x33\n\nparameters\x18\x06 \x03(\x0b\x32\x1f.smart_service.FeatureParameter\x12H\n\x0fresponse_schema\x18\x07 \x03(\x0b\x32/.smart_service.SmartFeature.ResponseSchemaEntry\x12\x41\n\x0b\x63onstraints\x18\x08 \x03(\x0b\x32,.smart_service.SmartFeature.ConstraintsEntry\x12\x15\n\rrequires_auth\x18\t \x01(\x08\x12\x0e\n\x06status\x18\n \x01(\t\x12\x12\n\ncreated_by\x18\x0b \x01(\t\x12\x12\n\ncreated_at\x18\x0c \x01(\t\x12\x12\n\nupdated_at\x18\r \x01(\t\x1a\x35\n\x13ResponseSchemaEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x32\n\x10\x43onstraintsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x89\x02\n\x12\x43reateModelRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x38\n\rconfiguration\x18\x05 \x01(\x0b\x32!.smart_service.ModelConfiguration\x12\x36\n\x0cintegrations\x18\x06 \x03(\x0b\x32 .smart_service.IntegrationConfig\x12-\n\x08\x66\x65\x61tures\x18\x07 \x03(\x0b\x32\x1b.smart_service.SmartFeature\x12\x0f\n\x07user_id\x18\x08 \x01(\t\"\xa9\x01\n\x12UpdateModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x38\n\rconfiguration\x18\x02 \x01(\x0b\x32!.smart_service.ModelConfiguration\x12\x36\n\x0cintegrations\x18\x03 \x03(\x0b\x32 .smart_service.IntegrationConfig\x12\x0f\n\x07user_id\x18\x04 \x01(\t\"L\n\x0fGetModelRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12-\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"S\n\x15\x42\x61tchGetModelsRequest\x12\x0b\n\x03ids\x18\x01 \x03(\t\x12-\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"Z\n\x13\x42\x61tchGetModelResult\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x66ound\x18\x02 \x01(\x08\x12(\n\x05model\x18\x03 \x01(\x0b\x32\x19.smart_service.SmartModel\"M\n\x16\x42\x61tchGetModelsResponse\x12\x33\n\x07results\x18\x01 \x03(\x0b\x32\".smart_service.BatchGetModelResult\"7\n\x12\x44\x65leteModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\"\x90\x02\n\x13SearchModelsRequest\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x02 \x01(\t\x12/\n\x06status\x18\x03 \x01(\x0e\x32\x1a.smart_service.ModelStatusH\x00\x88\x01\x01\x12\x14\n\x0c\x63\x61pabilities\x18\x04 \x03(\t\x12\x0c\n\x04page\x18\x05 \x01(\x05\x12\x0c\n\x04size\x18\x06 \x01(\x05\x12-\n\tread_mask\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12\x0e\n\x06\x63ursor\x18\x08 \x01(\t\x12,\n\ncount_mode\x18\t \x01(\x0e\x32\x18.smart_service.CountModeB\t\n\x07_status\"\xca\x01\n\x13StreamModelsRequest\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x02 \x01(\t\x12/\n\x06status\x18\x03 \x01(\x0e\x32\x1a.smart_service.ModelStatusH\x00\x88\x01\x01\x12\x14\n\x0c\x63\x61pabilities\x18\x04 \x03(\t\x12\x12\n\nchunk_size\x18\x05 \x01(\x05\x12-\n\tread_mask\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.FieldMaskB\t\n\x07_status\"7\n\nModelChunk\x12)\n\x06models\x18\x01 \x03(\x0b\x32\x19.smart_service.SmartModel\"s\n\x17TextSearchModelsRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12\x0c\n\x04page\x18\x02 \x01(\x05\x12\x0c\n\x04size\x18\x03 \x01(\x05\x12-\n\tread_mask\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"^\n\x18\x42\x61tchCreateModelsRequest\x12\x31\n\x06models\x18\x01 \x03(\x0b\x32!.smart_service.CreateModelRequest\x12\x0f\n\x07user_id\x18\x02 \x01(\t\"Y\n\x16\x42\x61tchCreateModelResult\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x10\n\x08model_id\x18\x03 \x01(\t\x12\r\n\x05\x65rror\x18\x04 \x01(\t\"t\n\x19\x42\x61tchCreateModelsResponse\x12\x36\n\x07results\x18\x01 \x03(\x0b\x32%.smart_service.BatchCreateModelResult\x12\x0f\n\x07\x63reated\x18\x02 \x01(\x05\x12\x0e\n\x06\x66\x61iled\x18\x03 \x01(\x05\"\x8f\x01\n\x14SearchModelsResponse\x12)\n\x06models\x18\x01 \x03(\x0b\x32\x19.smart_service.SmartModel\x12\x12\n\x05total\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\x13\n\x0bnext_cursor\x18\x03 \x01(\t\x12\x19\n\x11total_is_estimate\x18\x04 \x01(\x08\x42\x08\n\x06_total\"d\n\x11\x41\x64\x64\x46\x65\x61tureRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12,\n\x07\x66\x65\x61ture\x18\x02 \x01(\x0b\x32\x1b.smart_service.SmartFeature\x12\x0f\n\x07user_id\x18\x03 \x01(\t\")\n\x15GetModelStatusRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\"\xff\x02\n\x13ModelStatusResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12*\n\x06status\x18\x02 \x01(\x0e\x32\x1a.smart_service.ModelStatus\x12U\n\x12integration_status\x18\x03 \x03(\x0b\x32\x39.smart_service.ModelStatusResponse.IntegrationStatusEntry\x12M\n\x0e\x66\x65\x61ture_status\x18\x04 \x03(\x0b\x32\x35.smart_service.ModelStatusResponse.FeatureStatusEntry\x12\x14\n\x0clast_checked\x18\x05 \x01(\t\x1a\x38\n\x16IntegrationStatusEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x34\n\x12\x46\x65\x61tureStatusEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\",\n\x17WatchModelStatusRequest\x12\x11\n\tmodel_ids\x18\x01 \x03(\t\"\xaa\x03\n\x11ModelStatusUpdate\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12/\n\x06status\x18\x02 \x01(\x0e\x32\x1a.smart_service.ModelStatusH\x00\x88\x01\x01\x12S\n\x12integration_status\x18\x03 \x03(\x0b\x32\x37.smart_service.ModelStatusUpdate.IntegrationStatusEntry\x12K\n\x0e\x66\x65\x61ture_status\x18\x04 \x03(\x0b\x32\x33.smart_service.ModelStatusUpdate.FeatureStatusEntry\x12\x12\n\nupdated_at\x18\x05 \x01(\t\x12\x10\n\x08snapshot\x18\x06 \x01(\x08\x12\x0f\n\x07\x64\x65leted\x18\x07 \x01(\x08\x1a\x38\n\x16IntegrationStatusEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x34\n\x12\x46\x65\x61tureStatusEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\t\n\x07_status\"\xda\x01\n\x14UpdateFeatureRequest\x12\x12\n\nfeature_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12G\n\nparameters\x18\x04 \x03(\x0b\x32\x33.smart_service.UpdateFeatureRequest.ParametersEntry\x12\x0f\n\x07user_id\x18\x05 \x01(\t\x1a\x31\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\";\n\x14\x44\x65leteFeatureRequest\x12\x12\n\nfeature_id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t*E\n\x0bModelStatus\x12\t\n\x05\x44RAFT\x10\x00\x12\n\n\x06\x41\x43TIVE\x10\x01\x12\x0e\n\nDEPRECATED\x10\x02\x12\x0f\n\x0bMAINTENANCE\x10\x03*@\n\tCountMode\x12\x0f\n\x0b\x43OUNT_EXACT\x10\x00\x12\x12\n\x0e\x43OUNT_ESTIMATE\x10\x01\x12\x0e\n\nCOUNT_NONE\x10\x02*B\n\x0fIntegrationType\x12\x0e\n\nIOT_DEVICE\x10\x00\x12\x13\n\x0fWEATHER_SERVICE\x10\x01\x12\n\n\x06\x43USTOM\x10\x02\x32\xb5\t\n\x0cSmartService\x12K\n\x0b\x43reateModel\x12!.smart_service.CreateModelRequest\x1a\x19.smart_service.SmartModel\x12K\n\x0bUpdateModel\x12!.smart_service.UpdateModelRequest\x1a\x19.smart_service.SmartModel\x12H\n\x0b\x44\x65leteModel\x12!.smart_service.DeleteModelRequest\x1a\x16.google.protobuf.Empty\x12\x45\n\x08GetModel\x12\x1e.smart_service.GetModelRequest\x1a\x19.smart_service.SmartModel\x12]\n\x0e\x42\x61tchGetModels\x12$.smart_service.BatchGetModelsRequest\x1a%.smart_service.BatchGetModelsResponse\x12W\n\x0cSearchModels\x12\".smart_service.SearchModelsRequest\x1a#.smart_service.SearchModelsResponse\x12O\n\x0cStreamModels\x12\".smart_service.StreamModelsRequest\x1a\x19.smart_service.ModelChunk0\x01\x12_\n\x10TextSearchModels\x12&.smart_service.TextSearchModelsRequest\x1a#.smart_service.SearchModelsResponse\x12\x66\n\x11\x42\x61tchCreateModels\x12\'.smart_service.BatchCreateModelsRequest\x1a(.smart_service.BatchCreateModelsResponse\x12K\n\nAddFeature\x12 .smart_service.AddFeatureRequest\x1a\x1b.smart_service.SmartFeature\x12Q\n\rUpdateFeature\x12#.smart_service.UpdateFeatureRequest\x1a\x1b.smart_service.SmartFeature\x12L\n\rDeleteFeature\x12#.smart_service.DeleteFeatureRequest\x1a\x16.google.protobuf.Empty\x12Z\n\x0eGetModelStatus\x12$.smart_service.GetModelStatusRequest\x1a\".smart_service.ModelStatusResponse\x12^\n\x10WatchModelStatus\x12&.smart_service.WatchModelStatusRequest\x1a .smart_service.ModelStatusUpdate0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -38,62 +39,94 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _MODELSTATUSRESPONSE_INTEGRATIONSTATUSENTRY._serialized_options = b'8\001'
   _MODELSTATUSRESPONSE_FEATURESTATUSENTRY._options = None
   _MODELSTATUSRESPONSE_FEATURESTATUSENTRY._serialized_options = b'8\001'
+  _MODELSTATUSUPDATE_INTEGRATIONSTATUSENTRY._options = None
+  _MODELSTATUSUPDATE_INTEGRATIONSTATUSENTRY._serialized_options = b'8\001'
+  _MODELSTATUSUPDATE_FEATURESTATUSENTRY._options = None
+  _MODELSTATUSUPDATE_FEATURESTATUSENTRY._serialized_options = b'8\001'
   _UPDATEFEATUREREQUEST_PARAMETERSENTRY._options = None
   _UPDATEFEATUREREQUEST_PARAMETERSENTRY._serialized_options = b'8\001'
-  _globals['_MODELSTATUS']._serialized_start=3231
-  _globals['_MODELSTATUS']._serialized_end=3300
-  _globals['_INTEGRATIONTYPE']._serialized_start=3302
-  _globals['_INTEGRATIONTYPE']._serialized_end=3368
-  _globals['_MODELCONFIGURATION']._serialized_start=101
-  _globals['_MODELCONFIGURATION']._serialized_end=375
-  _globals['_MODELCONFIGURATION_SETTINGSENTRY']._serialized_start=279
-  _globals['_MODELCONFIGURATION_SETTINGSENTRY']._serialized_end=326
-  _globals['_MODELCONFIGURATION_METADATAENTRY']._serialized_start=328
-  _globals['_MODELCONFIGURATION_METADATAENTRY']._serialized_end=375
-  _globals['_INTEGRATIONCONFIG']._serialized_start=378
-  _globals['_INTEGRATIONCONFIG']._serialized_end=563
-  _globals['_INTEGRATIONCONFIG_SETTINGSENTRY']._serialized_start=279
-  _globals['_INTEGRATIONCONFIG_SETTINGSENTRY']._serialized_end=326
-  _globals['_SMARTMODEL']._serialized_start=566
-  _globals['_SMARTMODEL']._serialized_end=939
-  _globals['_FEATUREPARAMETER']._serialized_start=942
-  _globals['_FEATUREPARAMETER']._serialized_end=1152
-  _globals['_FEATUREPARAMETER_CONSTRAINTSENTRY']._serialized_start=1102
-  _globals['_FEATUREPARAMETER_CONSTRAINTSENTRY']._serialized_end=1152
-  _globals['_SMARTFEATURE']._serialized_start=1155
-  _globals['_SMARTFEATURE']._serialized_end=1656
-  _globals['_SMARTFEATURE_RESPONSESCHEMAENTRY']._serialized_start=1551
-  _globals['_SMARTFEATURE_RESPONSESCHEMAENTRY']._serialized_end=1604
-  _globals['_SMARTFEATURE_CONSTRAINTSENTRY']._serialized_start=1102
-  _globals['_SMARTFEATURE_CONSTRAINTSENTRY']._serialized_end=1152
-  _globals['_CREATEMODELREQUEST']._serialized_start=1659
-  _globals['_CREATEMODELREQUEST']._serialized_end=1924
-  _globals['_UPDATEMODELREQUEST']._serialized_start=1927
-  _globals['_UPDATEMODELREQUEST']._serialized_end=2096
-  _globals['_GETMODELREQUEST']._serialized_start=2098
-  _globals['_GETMODELREQUEST']._serialized_end=2127
-  _globals['_DELETEMODELREQUEST']._serialized_start=2129
-  _globals['_DELETEMODELREQUEST']._serialized_end=2184
-  _globals['_SEARCHMODELSREQUEST']._serialized_start=2187
-  _globals['_SEARCHMODELSREQUEST']._serialized_end=2334
-  _globals['_SEARCHMODELSRESPONSE']._serialized_start=2336
-  _globals['_SEARCHMODELSRESPONSE']._serialized_end=2416
-  _globals['_ADDFEATUREREQUEST']._serialized_start=2418
-  _globals['_ADDFEATUREREQUEST']._serialized_end=2518
-  _globals['_GETMODELSTATUSREQUEST']._serialized_start=2520
-  _globals['_GETMODELSTATUSREQUEST']._serialized_end=2561
-  _globals['_MODELSTATUSRESPONSE']._serialized_start=2564
-  _globals['_MODELSTATUSRESPONSE']._serialized_end=2947
-  _globals['_MODELSTATUSRESPONSE_INTEGRATIONSTATUSENTRY']._serialized_start=2837
-  _globals['_MODELSTATUSRESPONSE_INTEGRATIONSTATUSENTRY']._serialized_end=2893
-  _globals['_MODELSTATUSRESPONSE_FEATURESTATUSENTRY']._serialized_start=2895
-  _globals['_MODELSTATUSRESPONSE_FEATURESTATUSENTRY']._serialized_end=2947
-  _globals['_UPDATEFEATUREREQUEST']._serialized_start=2950
-  _globals['_UPDATEFEATUREREQUEST']._serialized_end=3168
-  _globals['_UPDATEFEATUREREQUEST_PARAMETERSENTRY']._serialized_start=3119
-  _globals['_UPDATEFEATUREREQUEST_PARAMETERSENTRY']._serialized_end=3168
-  _globals['_DELETEFEATUREREQUEST']._serialized_start=3170
-  _globals['_DELETEFEATUREREQUEST']._serialized_end=3229
-  _globals['_SMARTSERVICE']._serialized_start=3371
-  _globals['_SMARTSERVICE']._serialized_end=4103
+  _globals['_MODELSTATUS']._serialized_start=4916
+  _globals['_MODELSTATUS']._serialized_end=4985
+  _globals['_COUNTMODE']._serialized_start=4987
+  _globals['_COUNTMODE']._serialized_end=5051
+  _globals['_INTEGRATIONTYPE']._serialized_start=5053
+  _globals['_INTEGRATIONTYPE']._serialized_end=5119
+  _globals['_MODELCONFIGURATION']._serialized_start=135
+  _globals['_MODELCONFIGURATION']._serialized_end=409
+  _globals['_MODELCONFIGURATION_SETTINGSENTRY']._serialized_start=313
+  _globals['_MODELCONFIGURATION_SETTINGSENTRY']._serialized_end=360
+  _globals['_MODELCONFIGURATION_METADATAENTRY']._serialized_start=362
+  _globals['_MODELCONFIGURATION_METADATAENTRY']._serialized_end=409
+  _globals['_INTEGRATIONCONFIG']._serialized_start=412
+  _globals['_INTEGRATIONCONFIG']._serialized_end=597
+  _globals['_INTEGRATIONCONFIG_SETTINGSENTRY']._serialized_start=313
+  _globals['_INTEGRATIONCONFIG_SETTINGSENTRY']._serialized_end=360
+  _globals['_SMARTMODEL']._serialized_start=600
+  _globals['_SMARTMODEL']._serialized_end=973
+  _globals['_FEATUREPARAMETER']._serialized_start=976
+  _globals['_FEATUREPARAMETER']._serialized_end=1186
+  _globals['_FEATUREPARAMETER_CONSTRAINTSENTRY']._serialized_start=1136
+  _globals['_FEATUREPARAMETER_CONSTRAINTSENTRY']._serialized_end=1186
+  _globals['_SMARTFEATURE']._serialized_start=1189
+  _globals['_SMARTFEATURE']._serialized_end=1690
+  _globals['_SMARTFEATURE_RESPONSESCHEMAENTRY']._serialized_start=1585
+  _globals['_SMARTFEATURE_RESPONSESCHEMAENTRY']._serialized_end=1638
+  _globals['_SMARTFEATURE_CONSTRAINTSENTRY']._serialized_start=1136
+  _globals['_SMARTFEATURE_CONSTRAINTSENTRY']._serialized_end=1186
+  _globals['_CREATEMODELREQUEST']._serialized_start=1693
+  _globals['_CREATEMODELREQUEST']._serialized_end=1958
+  _globals['_UPDATEMODELREQUEST']._serialized_start=1961
+  _globals['_UPDATEMODELREQUEST']._serialized_end=2130
+  _globals['_GETMODELREQUEST']._serialized_start=2132
+  _globals['_GETMODELREQUEST']._serialized_end=2208
+  _globals['_BATCHGETMODELSREQUEST']._serialized_start=2210
+  _globals['_BATCHGETMODELSREQUEST']._serialized_end=2293
+  _globals['_BATCHGETMODELRESULT']._serialized_start=2295
+  _globals['_BATCHGETMODELRESULT']._serialized_end=2385
+  _globals['_BATCHGETMODELSRESPONSE']._serialized_start=2387
+  _globals['_BATCHGETMODELSRESPONSE']._serialized_end=2464
+  _globals['_DELETEMODELREQUEST']._serialized_start=2466
+  _globals['_DELETEMODELREQUEST']._serialized_end=2521
+  _globals['_SEARCHMODELSREQUEST']._serialized_start=2524
+  _globals['_SEARCHMODELSREQUEST']._serialized_end=2796
+  _globals['_STREAMMODELSREQUEST']._serialized_start=2799
+  _globals['_STREAMMODELSREQUEST']._serialized_end=3001
+  _globals['_MODELCHUNK']._serialized_start=3003
+  _globals['_MODELCHUNK']._serialized_end=3058
+  _globals['_TEXTSEARCHMODELSREQUEST']._serialized_start=3060
+  _globals['_TEXTSEARCHMODELSREQUEST']._serialized_end=3175
+  _globals['_BATCHCREATEMODELSREQUEST']._serialized_start=3177
+  _globals['_BATCHCREATEMODELSREQUEST']._serialized_end=3271
+  _globals['_BATCHCREATEMODELRESULT']._serialized_start=3273
+  _globals['_BATCHCREATEMODELRESULT']._serialized_end=3362
+  _globals['_BATCHCREATEMODELSRESPONSE']._serialized_start=3364
+  _globals['_BATCHCREATEMODELSRESPONSE']._serialized_end=3480
+  _globals['_SEARCHMODELSRESPONSE']._serialized_start=3483
+  _globals['_SEARCHMODELSRESPONSE']._serialized_end=3626
+  _globals['_ADDFEATUREREQUEST']._serialized_start=3628
+  _globals['_ADDFEATUREREQUEST']._serialized_end=3728
+  _globals['_GETMODELSTATUSREQUEST']._serialized_start=3730
+  _globals['_GETMODELSTATUSREQUEST']._serialized_end=3771
+  _globals['_MODELSTATUSRESPONSE']._serialized_start=3774
+  _globals['_MODELSTATUSRESPONSE']._serialized_end=4157
+  _globals['_MODELSTATUSRESPONSE_INTEGRATIONSTATUSENTRY']._serialized_start=4047
+  _globals['_MODELSTATUSRESPONSE_INTEGRATIONSTATUSENTRY']._serialized_end=4103
+  _globals['_MODELSTATUSRESPONSE_FEATURESTATUSENTRY']._serialized_start=4105
+  _globals['_MODELSTATUSRESPONSE_FEATURESTATUSENTRY']._serialized_end=4157
+  _globals['_WATCHMODELSTATUSREQUEST']._serialized_start=4159
+  _globals['_WATCHMODELSTATUSREQUEST']._serialized_end=4203
+  _globals['_MODELSTATUSUPDATE']._serialized_start=4206
+  _globals['_MODELSTATUSUPDATE']._serialized_end=4632
+  _globals['_MODELSTATUSUPDATE_INTEGRATIONSTATUSENTRY']._serialized_start=4047
+  _globals['_MODELSTATUSUPDATE_INTEGRATIONSTATUSENTRY']._serialized_end=4103
+  _globals['_MODELSTATUSUPDATE_FEATURESTATUSENTRY']._serialized_start=4105
+  _globals['_MODELSTATUSUPDATE_FEATURESTATUSENTRY']._serialized_end=4157
+  _globals['_UPDATEFEATUREREQUEST']._serialized_start=4635
+  _globals['_UPDATEFEATUREREQUEST']._serialized_end=4853
+  _globals['_UPDATEFEATUREREQUEST_PARAMETERSENTRY']._serialized_start=4804
+  _globals['_UPDATEFEATUREREQUEST_PARAMETERSENTRY']._serialized_end=4853
+  _globals['_DELETEFEATUREREQUEST']._serialized_start=4855
+  _globals['_DELETEFEATUREREQUEST']._serialized_end=4914
+  _globals['_SMARTSERVICE']._serialized_start=5122
+  _globals['_SMARTSERVICE']._serialized_end=6327
 # @@protoc_insertion_point(module_scope)
@@ -36,11 +36,31 @@ class SmartServiceStub(object):
                 request_serializer=smart__service__pb2.GetModelRequest.SerializeToString,
                 response_deserializer=smart__service__pb2.SmartModel.FromString,
                 )
+        self.BatchGetModels = channel.unary_unary(
+                '/smart_service.SmartService/BatchGetModels',
+                request_serializer=smart__service__pb2.BatchGetModelsRequest.SerializeToString,
+                response_deserializer=smart__service__pb2.BatchGetModelsResponse.FromString,
+                )
         self.SearchModels = channel.unary_unary(
                 '/smart_service.SmartService/SearchModels',
                 request_serializer=smart__service__pb2.SearchModelsRequest.SerializeToString,
                 response_deserializer=smart__service__pb2.SearchModelsResponse.FromString,
                 )
+        self.StreamModels = channel.unary_stream(
+                '/smart_service.SmartService/StreamModels',
+                request_serializer=smart__service__pb2.StreamModelsRequest.SerializeToString,
+                response_deserializer=smart__service__pb2.ModelChunk.FromString,
+                )
+        self.TextSearchModels = channel.unary_unary(
+                '/smart_service.SmartService/TextSearchModels',
+                request_serializer=smart__service__pb2.TextSearchModelsRequest.SerializeToString,
+                response_deserializer=smart__service__pb2.SearchModelsResponse.FromString,
+                )
+        self.BatchCreateModels = channel.unary_unary(
+                '/smart_service.SmartService/BatchCreateModels',
+                request_serializer=smart__service__pb2.BatchCreateModelsRequest.SerializeToString,
+                response_deserializer=smart__service__pb2.BatchCreateModelsResponse.FromString,
+                )
         self.AddFeature = channel.unary_unary(
                 '/smart_service.SmartService/AddFeature',
                 request_serializer=smart__service__pb2.AddFeatureRequest.SerializeToString,
@@ -61,6 +81,11 @@ class SmartServiceStub(object):
                 request_serializer=smart__service__pb2.GetModelStatusRequest.SerializeToString,
                 response_deserializer=smart__service__pb2.ModelStatusResponse.FromString,
                 )
+        self.WatchModelStatus = channel.unary_stream(
+                '/smart_service.SmartService/WatchModelStatus',
+                request_serializer=smart__service__pb2.WatchModelStatusRequest.SerializeToString,
+                response_deserializer=smart__service__pb2.ModelStatusUpdate.FromString,
+                )
 
 
 class SmartServiceServicer(object):
@@ -92,12 +117,36 @@ class SmartServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchGetModels(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def SearchModels(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamModels(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def TextSearchModels(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchCreateModels(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def AddFeature(self, request, context):
         """Feature operations
         """
@@ -124,6 +173,12 @@ class SmartServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchModelStatus(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_SmartServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -147,11 +202,31 @@ def add_SmartServiceServicer_to_server(servicer, server):
                     request_deserializer=smart__service__pb2.GetModelRequest.FromString,
                     response_serializer=smart__service__pb2.SmartModel.SerializeToString,
             ),
+            'BatchGetModels': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGetModels,
+                    request_deserializer=smart__service__pb2.BatchGetModelsRequest.FromString,
+                    response_serializer=smart__service__pb2.BatchGetModelsResponse.SerializeToString,
+            ),
             'SearchModels': grpc.unary_unary_rpc_method_handler(
                     servicer.SearchModels,
                     request_deserializer=smart__service__pb2.SearchModelsRequest.FromString,
                     response_serializer=smart__service__pb2.SearchModelsResponse.SerializeToString,
             ),
+            'StreamModels': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamModels,
+                    request_deserializer=smart__service__pb2.StreamModelsRequest.FromString,
+                    response_serializer=smart__service__pb2.ModelChunk.SerializeToString,
+            ),
+            'TextSearchModels': grpc.unary_unary_rpc_method_handler(
+                    servicer.TextSearchModels,
+                    request_deserializer=smart__service__pb2.TextSearchModelsRequest.FromString,
+                    response_serializer=smart__service__pb2.SearchModelsResponse.SerializeToString,
+            ),
+            'BatchCreateModels': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchCreateModels,
+                    request_deserializer=smart__service__pb2.BatchCreateModelsRequest.FromString,
+                    response_serializer=smart__service__pb2.BatchCreateModelsResponse.SerializeToString,
+            ),
             'AddFeature': grpc.unary_unary_rpc_method_handler(
                     servicer.AddFeature,
                     request_deserializer=smart__service__pb2.AddFeatureRequest.FromString,
@@ -172,6 +247,11 @@ def add_SmartServiceServicer_to_server(servicer, server):
                     request_deserializer=smart__service__pb2.GetModelStatusRequest.FromString,
                     response_serializer=smart__service__pb2.ModelStatusResponse.SerializeToString,
             ),
+            'WatchModelStatus': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchModelStatus,
+                    request_deserializer=smart__service__pb2.WatchModelStatusRequest.FromString,
+                    response_serializer=smart__service__pb2.ModelStatusUpdate.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'smart_service.SmartService', rpc_method_handlers)
@@ -251,6 +331,23 @@ class SmartService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def BatchGetModels(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/smart_service.SmartService/BatchGetModels',
+            smart__service__pb2.BatchGetModelsRequest.SerializeToString,
+            smart__service__pb2.BatchGetModelsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def SearchModels(request,
             target,
@@ -268,6 +365,57 @@ class SmartService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def StreamModels(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/smart_service.SmartService/StreamModels',
+            smart__service__pb2.StreamModelsRequest.SerializeToString,
+            smart__service__pb2.ModelChunk.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def TextSearchModels(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/smart_service.SmartService/TextSearchModels',
+            smart__service__pb2.TextSearchModelsRequest.SerializeToString,
+            smart__service__pb2.SearchModelsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def BatchCreateModels(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/smart_service.SmartService/BatchCreateModels',
+            smart__service__pb2.BatchCreateModelsRequest.SerializeToString,
+            smart__service__pb2.BatchCreateModelsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def AddFeature(request,
             target,
@@ -335,3 +483,20 @@ class SmartService(object):
             smart__service__pb2.ModelStatusResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def WatchModelStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/smart_service.SmartService/WatchModelStatus',
+            smart__service__pb2.WatchModelStatusRequest.SerializeToString,
+            smart__service__pb2.ModelStatusUpdate.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
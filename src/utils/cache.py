@@ -1,10 +1,203 @@
-import redis
+import os
+import asyncio
+import contextvars
+import hashlib
+import inspect
+import math
+import random
+import redis.asyncio as redis
 import json
-from functools import wraps
+import threading
+import time
+from collections import OrderedDict
+from functools import partial, wraps
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
 import logging
 
+from src.utils.monitoring import (
+    CACHE_HITS, CACHE_MISSES, CACHE_EVICTIONS, CACHE_COALESCED_LOADS, CACHE_EARLY_REFRESHES,
+    CACHE_NEGATIVE_HITS, CACHE_STALE_HITS
+)
+
 logger = logging.getLogger(__name__)
 
+Payload = Union[str, bytes]
+
+INVALIDATION_CHANNEL = 'cache:invalidate'
+
+# Cached "does not exist" marker. 0xc1 is never used by msgpack and is not
+# valid JSON, so no real payload can look like it.
+TOMBSTONE = b"\xc1"
+# Revision floors outlive the entries they guard
+REVISION_FLOOR_TTL = 7 * 24 * 3600
+
+# KEYS: entry, revision floor  ARGV: payload, revision, ttl
+_SET_IF_CURRENT = """
+local floor = tonumber(redis.call('GET', KEYS[2]) or '0')
+if tonumber(ARGV[2]) < floor then
+    return 0
+end
+redis.call('SETEX', KEYS[1], ARGV[3], ARGV[1])
+return 1
+"""
+
+# KEYS: entry, revision floor  ARGV: revision, floor ttl
+_RAISE_FLOOR = """
+local floor = tonumber(redis.call('GET', KEYS[2]) or '0')
+if tonumber(ARGV[1]) > floor then
+    redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[2])
+end
+redis.call('DEL', KEYS[1])
+return 1
+"""
+
+
+# Assumed cost of recomputing a key this process has never loaded itself
+DEFAULT_LOAD_SECONDS = 0.05
+
+
+class SingleFlight:
+    """Coalesces concurrent async loads of the same key into one call.
+
+    The first caller runs the loader, everyone arriving while it is in flight
+    awaits the same result (or exception). If the leading caller is cancelled
+    the waiters retry rather than failing with it.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._flights
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._flights.get(key)
+        if flight is not None:
+            CACHE_COALESCED_LOADS.inc()
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+            return await self.do(key, loader)
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        try:
+            result = await loader()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            # Retrieved here so a flight without waiters doesn't log a warning
+            flight.exception()
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+
+class LocalCache:
+    """Bounded in-process LRU tier kept in front of Redis.
+
+    Entries hold the serialized payload, so the byte bound is exact and every
+    hit hands the caller a fresh copy. Expired entries are dropped lazily when
+    read or when they reach the cold end of the LRU order. Besides its local
+    expiry each entry remembers the deadline of the value itself (its Redis
+    expiry), which early expiration works against.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024,
+                 ttl: float = 60.0, tier: str = 'l1'):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.tier = tier
+        self._entries: 'OrderedDict[str, Tuple[Payload, float, float]]' = OrderedDict()
+        self._bytes = 0
+        # Lowest revision still acceptable per key, raised by invalidations
+        self._floors: 'OrderedDict[str, int]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[Payload]:
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[Payload, float]]:
+        """Payload and value deadline (monotonic seconds) of ``key``"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                self._remove(key)
+                CACHE_EVICTIONS.labels(tier=self.tier, reason='expired').inc()
+                entry = None
+            if entry is None:
+                CACHE_MISSES.labels(tier=self.tier).inc()
+                return None
+            self._entries.move_to_end(key)
+            CACHE_HITS.labels(tier=self.tier).inc()
+            return entry[0], entry[2]
+
+    def set(self, key: str, payload: Payload, ttl: Optional[float] = None, revision: Optional[int] = None):
+        size = len(payload)
+        now = time.monotonic()
+        deadline = now + (self.ttl if ttl is None else ttl)
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self._lock:
+            if revision is not None and revision < self._floors.get(key, 0):
+                # Loaded before an invalidation we've already seen, don't resurrect it
+                return
+            self._remove(key)
+            if size > self.max_bytes or ttl <= 0:
+                return
+            self._entries[key] = (payload, now + ttl, deadline)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest, (_, expires_at, _) = next(iter(self._entries.items()))
+                self._remove(oldest)
+                reason = 'expired' if expires_at <= time.monotonic() else 'size'
+                CACHE_EVICTIONS.labels(tier=self.tier, reason=reason).inc()
+
+    def delete(self, key: str):
+        with self._lock:
+            self._remove(key)
+
+    def invalidate(self, key: str, revision: Optional[int] = None):
+        """Drop ``key`` and, given a revision, refuse to cache anything older later on"""
+        with self._lock:
+            self._remove(key)
+            if revision is None:
+                return
+            self._floors[key] = max(self._floors.get(key, 0), revision)
+            self._floors.move_to_end(key)
+            while len(self._floors) > self.max_entries:
+                self._floors.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._floors.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[0])
+
 
 class Cache:
     _instance = None
@@ -16,53 +209,366 @@ class Cache:
         return cls._instance
 
     def init_cache(self):
+        self.local = LocalCache(
+            max_entries=int(os.getenv('CACHE_L1_MAX_ENTRIES', '10000')),
+            max_bytes=int(os.getenv('CACHE_L1_MAX_BYTES', str(64 * 1024 * 1024))),
+            ttl=float(os.getenv('CACHE_L1_TTL', '60'))
+        )
+        self.early_expiration_beta = float(os.getenv('CACHE_EARLY_EXPIRATION_BETA', '1.0'))
+        self._flights = SingleFlight()
+        self._load_seconds: 'OrderedDict[str, float]' = OrderedDict()
+        self._refreshes = set()
         try:
-            self.client = redis.Redis(
-                host='localhost',
-                port=6379,
-                db=0,
-                decode_responses=True
+            # Callers wait up to REDIS_POOL_TIMEOUT for a free connection instead of failing
+            self.pool = redis.BlockingConnectionPool.from_url(
+                os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+                max_connections=int(os.getenv('REDIS_MAX_CONNECTIONS', '50')),
+                timeout=float(os.getenv('REDIS_POOL_TIMEOUT', '5'))
             )
+            self.client = redis.Redis(connection_pool=self.pool)
+            self._set_if_current = self.client.register_script(_SET_IF_CURRENT)
+            self._raise_floor = self.client.register_script(_RAISE_FLOOR)
         except Exception as e:
             logger.error(f"Cache initialization error: {e}")
             self.client = None
+        self._listener = None
 
-    def get(self, key: str):
+    async def get(self, key: str):
+        data = await self.get_raw(key)
         try:
-            if not self.client:
-                return None
-            data = self.client.get(key)
             return json.loads(data) if data else None
-        except Exception as e:
+        except ValueError as e:
             logger.error(f"Cache get error: {e}")
             return None
 
-    def set(self, key: str, value, expire=3600):
+    async def set(self, key: str, value, expire=3600):
+        try:
+            data = json.dumps(value).encode('utf-8')
+        except (TypeError, ValueError) as e:
+            logger.error(f"Cache set error: {e}")
+            return
+        await self.set_raw(key, data, expire)
+
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        """Serialized payload stored under ``key``, for callers with their own encoding"""
+        return (await self._lookup(key))[0]
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        """Payloads of every cached key, local hits first and the rest in one round trip.
+
+        Keys cached as missing map to ``TOMBSTONE``.
+        """
+        found: Dict[str, bytes] = {}
+        missing: List[str] = []
+        for key in dict.fromkeys(keys):
+            entry = self.local.get_entry(key)
+            if entry is not None:
+                found[key] = entry[0]
+            else:
+                missing.append(key)
+
+        if not missing or not self.client:
+            return found
         try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.mget(missing)
+            for key in missing:
+                pipe.pttl(key)
+            values, *ttls = await pipe.execute()
+        except Exception as e:
+            logger.error(f"Cache get_many error: {e}")
+            return found
+
+        for key, data, ttl_ms in zip(missing, values, ttls):
+            if not data:
+                CACHE_MISSES.labels(tier='redis').inc()
+                continue
+            CACHE_HITS.labels(tier='redis').inc()
+            self.local.set(key, data, ttl=ttl_ms / 1000 if ttl_ms and ttl_ms > 0 else None)
+            found[key] = data
+        return found
+
+    async def set_raw(self, key: str, data: bytes, expire=3600, revision: Optional[int] = None):
+        """Store ``data``; with a revision the write is dropped if a newer one was invalidated"""
+        await self.set_many([(key, data, revision)], expire)
+
+    async def set_many(self, items: Iterable[Tuple[str, bytes, Optional[int]]], expire=3600):
+        """Store ``(key, payload, revision)`` items, pipelined into one Redis round trip"""
+        items = list(items)
+        for key, data, revision in items:
+            self.local.set(key, data, ttl=expire, revision=revision)
+        if not items or not self.client:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, data, revision in items:
+                if revision is None:
+                    pipe.setex(key, expire, data)
+                else:
+                    await self._set_if_current(
+                        keys=[key, self._floor_key(key)], args=[data, revision, expire], client=pipe
+                    )
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Cache set error: {e}")
+
+    async def get_or_load(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[Optional[Tuple[Optional[bytes], Optional[int]]]]],
+            expire: int = 3600,
+            force: bool = False,
+            negative_ttl: Optional[int] = None,
+            stale_ttl: int = 0
+    ) -> Optional[bytes]:
+        """Cached payload of ``key``, loading it once per key on a miss.
+
+        ``loader`` returns ``(payload, revision)``, or None when the key does not
+        exist. ``(None, revision)`` reports a key that no longer exists as of
+        ``revision`` (e.g. a deleted row), which outranks the floor its deletion
+        raised. With ``negative_ttl`` a miss is cached as a tombstone for that
+        long, so repeated lookups of a missing key cost one cache read.
+        Concurrent misses share one loader call. A hit may still be
+        refreshed early, with a probability rising towards its expiry (XFetch:
+        ``now - load_time * beta * ln(rand) >= deadline``), so hot keys are
+        usually recomputed by a single caller before they expire for everyone.
+
+        With ``stale_ttl`` entries are kept that much longer than ``expire``. A
+        hit in that window returns the stale payload right away and reloads it
+        in the background (stale-while-revalidate). The background load runs
+        in an empty context, so it never reuses the caller's unit of work.
+        """
+        load = partial(self._load, key, loader, expire, negative_ttl, stale_ttl)
+        if not force:
+            data, deadline = await self._lookup(key)
+            if data == TOMBSTONE:
+                CACHE_NEGATIVE_HITS.inc()
+                return None
+            if data is not None:
+                fresh_until = deadline - stale_ttl if deadline is not None else None
+                if stale_ttl and fresh_until is not None and time.monotonic() >= fresh_until:
+                    CACHE_STALE_HITS.inc()
+                    self._refresh_in_background(key, load)
+                    return data
+                if not self._expires_early(key, fresh_until):
+                    return data
+                CACHE_EARLY_REFRESHES.inc()
+        return await self._flights.do(key, load)
+
+    async def delete(self, key: str):
+        try:
+            self.local.delete(key)
             if not self.client:
                 return
-            self.client.setex(key, expire, json.dumps(value))
+            await self.client.delete(key)
         except Exception as e:
-            logger.error(f"Cache set error: {e}")
+            logger.error(f"Cache delete error: {e}")
+
+    async def invalidate(self, key: str, revision: Optional[int] = None):
+        """Evict ``key`` here, in Redis and in every replica's local tier"""
+        await self.invalidate_many([(key, revision)])
+
+    async def invalidate_many(self, entries: Iterable[Tuple[str, Optional[int]]]):
+        """Evict ``(key, revision)`` entries with one pipeline and one published message"""
+        entries = list(entries)
+        if not entries:
+            return
+        try:
+            for key, revision in entries:
+                self.local.invalidate(key, revision)
+            if not self.client:
+                return
+            pipe = self.client.pipeline(transaction=False)
+            for key, revision in entries:
+                if revision is None:
+                    pipe.delete(key)
+                else:
+                    await self._raise_floor(
+                        keys=[key, self._floor_key(key)], args=[revision, REVISION_FLOOR_TTL], client=pipe
+                    )
+            pipe.publish(INVALIDATION_CHANNEL, json.dumps({'entries': entries}))
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Cache invalidate error: {e}")
+
+    def start_invalidation_listener(self, retry_interval: float = 1.0):
+        """Apply invalidations published by other replicas to the local tier (needs a running loop)"""
+        if not self.client or self._listener is not None:
+            return
+        self._listener = asyncio.create_task(self._listen_for_invalidations(retry_interval))
+
+    def stop_invalidation_listener(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+
+    async def close(self):
+        self.stop_invalidation_listener()
+        if self.client:
+            await self.client.aclose()
+
+    async def _listen_for_invalidations(self, retry_interval: float):
+        while True:
+            try:
+                async with self.client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    async for message in pubsub.listen():
+                        self._on_invalidation(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Whatever was published meanwhile is lost, start from a clean local tier
+                logger.error(f"Cache invalidation listener error: {e}")
+                self.local.clear()
+            await asyncio.sleep(retry_interval)
+
+    def _on_invalidation(self, message):
+        try:
+            data = json.loads(message['data'])
+            for key, revision in data['entries']:
+                self.local.invalidate(key, revision)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error(f"Invalid cache invalidation message: {e}")
+
+    def _refresh_in_background(self, key: str, load):
+        if key in self._flights:
+            return
+        # A fresh context so the reload opens its own unit of work instead of joining the caller's
+        task = contextvars.Context().run(asyncio.create_task, self._flights.do(key, load))
+        self._refreshes.add(task)
+        task.add_done_callback(self._refresh_done)
+
+    def _refresh_done(self, task: asyncio.Task):
+        self._refreshes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Cache background refresh failed: {task.exception()}")
 
+    async def _load(self, key: str, loader, expire: int, negative_ttl: Optional[int],
+                    stale_ttl: int = 0) -> Optional[bytes]:
+        started = time.monotonic()
+        loaded = await loader()
+        self._load_seconds[key] = time.monotonic() - started
+        self._load_seconds.move_to_end(key)
+        while len(self._load_seconds) > self.local.max_entries:
+            self._load_seconds.popitem(last=False)
 
-def cached(prefix):
+        data, revision = loaded if loaded is not None else (None, 0)
+        if data is None:
+            if negative_ttl:
+                # Revision 0 loses against the floor any create raises, so a
+                # tombstone computed just before the row appeared is dropped
+                await self.set_raw(key, TOMBSTONE, negative_ttl, revision=revision or 0)
+            return None
+        await self.set_raw(key, data, expire + stale_ttl, revision=revision)
+        return data
+
+    async def _lookup(self, key: str) -> Tuple[Optional[bytes], Optional[float]]:
+        """Payload and value deadline, from the local tier or else Redis"""
+        try:
+            entry = self.local.get_entry(key)
+            if entry is not None:
+                return entry
+            if not self.client:
+                return None, None
+            data, ttl_ms = await self.client.pipeline(transaction=False).get(key).pttl(key).execute()
+            if not data:
+                CACHE_MISSES.labels(tier='redis').inc()
+                return None, None
+            CACHE_HITS.labels(tier='redis').inc()
+            ttl = ttl_ms / 1000 if ttl_ms and ttl_ms > 0 else None
+            self.local.set(key, data, ttl=ttl)
+            return data, (time.monotonic() + ttl if ttl else None)
+        except Exception as e:
+            logger.error(f"Cache get error: {e}")
+            return None, None
+
+    def _expires_early(self, key: str, deadline: Optional[float]) -> bool:
+        if self.early_expiration_beta <= 0 or deadline is None:
+            return False
+        load_seconds = self._load_seconds.get(key, DEFAULT_LOAD_SECONDS)
+        jitter = -load_seconds * self.early_expiration_beta * math.log(1.0 - random.random())
+        return time.monotonic() + jitter >= deadline
+
+    @staticmethod
+    def _floor_key(key: str) -> str:
+        return f"{key}:revision"
+
+
+def default_key_builder(prefix: str, signature: inspect.Signature, *args, **kwargs) -> str:
+    """``prefix:<digest>`` over every bound argument except ``self``/``cls``.
+
+    Defaults are applied first, so ``f(1)`` and ``f(id=1)`` share a key.
+    Arguments should be JSON-serializable, anything else is keyed by repr().
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = {
+        name: value for name, value in bound.arguments.items()
+        if name not in ('self', 'cls')
+    }
+    raw = json.dumps(arguments, sort_keys=True, default=repr).encode('utf-8')
+    return f"{prefix}:{hashlib.blake2b(raw, digest_size=16).hexdigest()}"
+
+
+def cached(prefix, expire=3600, negative_ttl=60, stale_ttl=0, key_builder=None):
+    """Cache a function's JSON-serializable result.
+
+    Keys come from ``key_builder(*args, **kwargs)``, by default a digest of
+    all arguments. None results are cached as tombstones for ``negative_ttl``
+    seconds (0 to disable); other falsy results are cached like any value.
+    With ``stale_ttl`` an expired result is still returned for that long
+    while a background call refreshes it.
+
+    Coroutine functions use both tiers. The Redis client is asyncio-only, so
+    plain functions are cached in the in-process tier, for at most its TTL,
+    and can't use ``stale_ttl``.
+    """
     def decorator(func):
+        build_key = key_builder or partial(default_key_builder, prefix, inspect.signature(func))
+        if not asyncio.iscoroutinefunction(func):
+            if stale_ttl:
+                raise TypeError(f"stale_ttl needs an async function, got {func.__qualname__}")
+            return _cached_sync(func, build_key, expire, negative_ttl)
+
         @wraps(func)
-        def wrapper(*args, **kwargs):
+        async def wrapper(*args, **kwargs):
             cache = Cache()
-            key = f"{prefix}:{kwargs.get('id', '')}"
-
-            result = cache.get(key)
-            if result:
-                return result
 
-            result = func(*args, **kwargs)
-            if result:
-                cache.set(key, result)
+            async def load():
+                result = await func(*args, **kwargs)
+                return None if result is None else (json.dumps(result).encode('utf-8'), None)
 
-            return result
+            data = await cache.get_or_load(
+                build_key(*args, **kwargs),
+                load,
+                expire=expire,
+                negative_ttl=negative_ttl,
+                stale_ttl=stale_ttl
+            )
+            return json.loads(data) if data is not None else None
 
         return wrapper
 
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+def _cached_sync(func, build_key, expire, negative_ttl):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        local = Cache().local
+        key = build_key(*args, **kwargs)
+        data = local.get(key)
+        if data == TOMBSTONE:
+            CACHE_NEGATIVE_HITS.inc()
+            return None
+        if data is not None:
+            return json.loads(data)
+
+        result = func(*args, **kwargs)
+        if result is not None:
+            local.set(key, json.dumps(result).encode('utf-8'), expire)
+        elif negative_ttl:
+            local.set(key, TOMBSTONE, negative_ttl)
+        return result
+
+    return wrapper
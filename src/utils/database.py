@@ -0,0 +1,288 @@
+import asyncio
+import functools
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.sql.dml import UpdateBase
+
+from src.models.models import Base
+from src.utils.monitoring import DB_POOL_CHECKOUT_WAIT
+
+logger = logging.getLogger(__name__)
+
+# Session bound to the unit of work running in the current task
+_current_session: ContextVar[Optional[AsyncSession]] = ContextVar('current_session', default=None)
+
+# Engine options that only apply to queue-based pools
+QUEUE_POOL_OPTIONS = ('pool_size', 'max_overflow', 'pool_timeout')
+
+# Sync driver names mapped to their asyncio counterparts
+ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+asyncpg',
+    'postgresql+psycopg2': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite',
+    'sqlite+pysqlite': 'sqlite+aiosqlite',
+}
+
+
+def to_async_url(url: str) -> str:
+    """Rewrite a sync database URL (e.g. postgresql://) to use an asyncio driver"""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.drivername)
+    if driver:
+        parsed = parsed.set(drivername=driver)
+    return parsed.render_as_string(hide_password=False)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection"""
+
+    pool_name = 'primary'
+
+    def _do_get(self):
+        start_time = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(pool=self.pool_name).observe(
+                time.perf_counter() - start_time
+            )
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.pool_name = self.pool_name
+        return pool
+
+
+class ReadYourWritesTracker:
+    """Remembers which users committed a write in the last ``window`` seconds.
+
+    The memory is per process: with several workers or replicas of the service
+    a user's next read may land on a process that never saw the write. Clients
+    close that gap by sending the time of their last write along with the read
+    (``x-read-after``, see bind_read_after()), which any process can check
+    with is_fresh() as long as the clocks agree to well within the window.
+    """
+
+    def __init__(self, window: float = 5.0):
+        self.window = window
+        self._writes: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record_write(self, user_id: Optional[str]):
+        if not user_id or self.window <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._writes[user_id] = now
+            self._writes.move_to_end(user_id)
+            self._prune(now)
+
+    def wrote_recently(self, user_id: Optional[str]) -> bool:
+        if not user_id:
+            return False
+        with self._lock:
+            written_at = self._writes.get(user_id)
+        return written_at is not None and time.monotonic() - written_at < self.window
+
+    def is_fresh(self, written_at: Optional[float]) -> bool:
+        """Whether a write made at ``written_at`` (Unix time) is still inside the window"""
+        if written_at is None:
+            return False
+        # Both directions, so a caller whose clock runs ahead is still pinned
+        return abs(time.time() - written_at) < self.window
+
+    def _prune(self, now: float):
+        while self._writes:
+            user_id, written_at = next(iter(self._writes.items()))
+            if now - written_at < self.window:
+                break
+            del self._writes[user_id]
+
+
+class RoutingSession(Session):
+    """Sends read-only units of work to a replica and everything else to the primary.
+
+    A session that has written, that runs for a user who committed a write
+    through this process within the read-your-writes window, or whose caller
+    reports a write within the window (``read_after``), stays on the primary.
+    """
+
+    def __init__(
+            self,
+            primary: Engine = None,
+            replicas: Sequence[Engine] = (),
+            tracker: Optional[ReadYourWritesTracker] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.tracker = tracker
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info['wrote'] = True
+            return self.primary
+
+        if self.info.get('read_only') and self.replicas and not self._pinned_to_primary():
+            if 'replica' not in self.info:
+                self.info['replica'] = random.choice(self.replicas)
+            return self.info['replica']
+
+        return self.primary
+
+    def commit(self):
+        super().commit()
+        if self.info.get('wrote') and self.tracker:
+            self.tracker.record_write(self.info.get('user_id'))
+
+    def _pinned_to_primary(self) -> bool:
+        if self.info.get('wrote'):
+            return True
+        if self.tracker is None:
+            return False
+        return self.tracker.wrote_recently(self.info.get('user_id')) or self.tracker.is_fresh(
+            self.info.get('read_after')
+        )
+
+
+def create_engine(url: str, pool_name: str = 'primary', **engine_kwargs: Any) -> AsyncEngine:
+    async_url = to_async_url(url)
+    if make_url(async_url).get_backend_name() == 'sqlite':
+        # SQLite drivers manage their own single-connection pools
+        for option in QUEUE_POOL_OPTIONS:
+            engine_kwargs.pop(option, None)
+    else:
+        engine_kwargs.setdefault('poolclass', TimedQueuePool)
+
+    engine = create_async_engine(async_url, **engine_kwargs)
+    if isinstance(engine.pool, TimedQueuePool):
+        engine.pool.pool_name = pool_name
+    return engine
+
+
+def create_session_factory(
+        engine: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        read_your_writes_window: float = 5.0
+) -> async_sessionmaker:
+    # Objects returned by services outlive the commit, so keep them loaded
+    if not replicas:
+        return async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    return async_sessionmaker(
+        sync_session_class=RoutingSession,
+        expire_on_commit=False,
+        primary=engine.sync_engine,
+        replicas=[replica.sync_engine for replica in replicas],
+        tracker=ReadYourWritesTracker(read_your_writes_window)
+    )
+
+
+async def create_schema(engine: AsyncEngine):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def warm_pool(engine: AsyncEngine, connections: Optional[int] = None) -> int:
+    """Open pooled connections up front so the first requests don't pay for connecting.
+
+    Defaults to the pool's persistent size; returns how many were opened.
+    """
+    if connections is None:
+        size = getattr(engine.sync_engine.pool, 'size', None)
+        connections = size() if callable(size) else 1
+
+    async def open_connection():
+        conn = await engine.connect()
+        await conn.execute(text("SELECT 1"))
+        return conn
+
+    # Hold them all at once, otherwise the pool would keep handing back the same one
+    results = await asyncio.gather(*(open_connection() for _ in range(connections)), return_exceptions=True)
+    opened = [conn for conn in results if not isinstance(conn, BaseException)]
+    for conn in opened:
+        await conn.close()
+
+    errors = [e for e in results if isinstance(e, BaseException)]
+    if errors and not opened:
+        raise errors[0]
+    return len(opened)
+
+
+def current_session() -> AsyncSession:
+    session = _current_session.get()
+    if session is None:
+        raise RuntimeError("No active session, open one with session_scope()")
+    return session
+
+
+def bind_user(user_id: Optional[str]):
+    """Tag the active unit of work with the user it runs for, used for read-your-writes routing"""
+    session = _current_session.get()
+    if session is not None and user_id:
+        session.info['user_id'] = user_id
+
+
+def bind_read_after(written_at: Optional[float]):
+    """Tag the active unit of work with the Unix time of the caller's last write.
+
+    Reads within the read-your-writes window of it go to the primary, whichever
+    process served the write.
+    """
+    session = _current_session.get()
+    if session is not None and written_at is not None:
+        session.info['read_after'] = written_at
+
+
+@asynccontextmanager
+async def session_scope(session_factory: async_sessionmaker, read_only: bool = False):
+    """Unit of work: joins the session already active in this task or opens a new one.
+
+    The outermost scope owns the session and closes it on exit, so nested service
+    calls made while handling one RPC share a single session and identity map.
+    Only the outermost scope decides whether the unit of work is read-only.
+    """
+    session = _current_session.get()
+    if session is not None:
+        yield session
+        return
+
+    session = session_factory()
+    session.info['read_only'] = read_only
+    token = _current_session.set(session)
+    try:
+        yield session
+    finally:
+        _current_session.reset(token)
+        await session.close()
+
+
+def unit_of_work(func: Optional[Callable] = None, *, read_only: bool = False) -> Callable:
+    """Run an async method inside session_scope(self.session_factory).
+
+    Use ``@unit_of_work(read_only=True)`` for methods that may be served by a replica.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if self.session_factory is None:
+                return await func(self, *args, **kwargs)
+            async with session_scope(self.session_factory, read_only=read_only):
+                return await func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
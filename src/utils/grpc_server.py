@@ -0,0 +1,163 @@
+import os
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import grpc
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_ALGORITHMS = {
+    'none': grpc.Compression.NoCompression,
+    'gzip': grpc.Compression.Gzip,
+    'deflate': grpc.Compression.Deflate,
+}
+
+
+def parse_compression(name: Optional[str]) -> grpc.Compression:
+    algorithm = COMPRESSION_ALGORITHMS.get((name or 'none').strip().lower())
+    if algorithm is None:
+        raise ValueError(f"Unknown compression {name!r}, expected one of {sorted(COMPRESSION_ALGORITHMS)}")
+    return algorithm
+
+
+def parse_rpc_compression(spec: str) -> Dict[str, grpc.Compression]:
+    """Parse ``"StreamModels=gzip,GetModel=none"`` into method name -> algorithm"""
+    overrides = {}
+    for entry in filter(None, (part.strip() for part in spec.split(','))):
+        method, sep, name = entry.partition('=')
+        if not sep:
+            raise ValueError(f"Invalid compression override {entry!r}, expected Method=algorithm")
+        overrides[method.strip()] = parse_compression(name)
+    return overrides
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).lower() == 'true'
+
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name, '')
+    return int(value) if value else None
+
+
+@dataclass
+class ServerConfig:
+    """Tuning knobs of the gRPC server; ``None`` leaves the gRPC core default in place"""
+    max_concurrent_rpcs: Optional[int] = None
+    max_message_bytes: int = 50 * 1024 * 1024
+    # Keepalive: how often we ping idle clients and how long we wait for the ack
+    keepalive_time_ms: int = 60_000
+    keepalive_timeout_ms: int = 20_000
+    keepalive_permit_without_calls: bool = True
+    # Client pings closer together than this are answered with GOAWAY
+    min_ping_interval_ms: int = 10_000
+    max_connection_idle_ms: Optional[int] = None
+    max_connection_age_ms: Optional[int] = None
+    max_connection_age_grace_ms: Optional[int] = None
+    # HTTP/2 flow control: BDP probing grows the windows with the measured link;
+    # lookahead_bytes pins the per-stream window when probing is off.
+    http2_bdp_probe: bool = True
+    http2_lookahead_bytes: Optional[int] = None
+    http2_max_frame_size: Optional[int] = None
+    compression: grpc.Compression = grpc.Compression.NoCompression
+    rpc_compression: Dict[str, grpc.Compression] = field(default_factory=dict)
+    # Lets several worker processes bind the same port; off so a stray second
+    # server fails to start instead of silently taking half the traffic
+    so_reuseport: bool = False
+
+    @classmethod
+    def from_env(cls) -> 'ServerConfig':
+        return cls(
+            max_concurrent_rpcs=_env_int('GRPC_MAX_CONCURRENT_RPCS'),
+            max_message_bytes=int(os.getenv('GRPC_MAX_MESSAGE_BYTES', str(50 * 1024 * 1024))),
+            keepalive_time_ms=int(os.getenv('GRPC_KEEPALIVE_TIME_MS', '60000')),
+            keepalive_timeout_ms=int(os.getenv('GRPC_KEEPALIVE_TIMEOUT_MS', '20000')),
+            keepalive_permit_without_calls=_env_bool('GRPC_KEEPALIVE_PERMIT_WITHOUT_CALLS', True),
+            min_ping_interval_ms=int(os.getenv('GRPC_MIN_PING_INTERVAL_MS', '10000')),
+            max_connection_idle_ms=_env_int('GRPC_MAX_CONNECTION_IDLE_MS'),
+            max_connection_age_ms=_env_int('GRPC_MAX_CONNECTION_AGE_MS'),
+            max_connection_age_grace_ms=_env_int('GRPC_MAX_CONNECTION_AGE_GRACE_MS'),
+            http2_bdp_probe=_env_bool('GRPC_HTTP2_BDP_PROBE', True),
+            http2_lookahead_bytes=_env_int('GRPC_HTTP2_LOOKAHEAD_BYTES'),
+            http2_max_frame_size=_env_int('GRPC_HTTP2_MAX_FRAME_SIZE'),
+            compression=parse_compression(os.getenv('GRPC_COMPRESSION', 'none')),
+            rpc_compression=parse_rpc_compression(os.getenv('GRPC_RPC_COMPRESSION', ''))
+        )
+
+    def options(self) -> List[Tuple[str, object]]:
+        options = [
+            ('grpc.max_send_message_length', self.max_message_bytes),
+            ('grpc.max_receive_message_length', self.max_message_bytes),
+            ('grpc.keepalive_time_ms', self.keepalive_time_ms),
+            ('grpc.keepalive_timeout_ms', self.keepalive_timeout_ms),
+            ('grpc.keepalive_permit_without_calls', int(self.keepalive_permit_without_calls)),
+            ('grpc.http2.min_ping_interval_without_data_ms', self.min_ping_interval_ms),
+            ('grpc.http2.max_pings_without_data', 0),
+            ('grpc.http2.bdp_probe', int(self.http2_bdp_probe)),
+            ('grpc.so_reuseport', int(self.so_reuseport)),
+        ]
+        optional = {
+            'grpc.max_connection_idle_ms': self.max_connection_idle_ms,
+            'grpc.max_connection_age_ms': self.max_connection_age_ms,
+            'grpc.max_connection_age_grace_ms': self.max_connection_age_grace_ms,
+            'grpc.http2.lookahead_bytes': self.http2_lookahead_bytes,
+            'grpc.http2.max_frame_size': self.http2_max_frame_size,
+        }
+        options.extend((name, value) for name, value in optional.items() if value is not None)
+        return options
+
+
+class CompressionInterceptor(grpc.aio.ServerInterceptor):
+    """Compress responses of selected RPCs with their own algorithm.
+
+    Keys are bare method names (``StreamModels``); RPCs not listed use the
+    server-wide default.
+    """
+
+    def __init__(self, rpc_compression: Dict[str, grpc.Compression]):
+        self.rpc_compression = rpc_compression
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        method = handler_call_details.method.rsplit('/', 1)[-1]
+        algorithm = self.rpc_compression.get(method)
+        if handler is None or algorithm is None:
+            return handler
+
+        if handler.unary_unary:
+            async def unary_unary(request, context):
+                context.set_compression(algorithm)
+                return await handler.unary_unary(request, context)
+            return handler._replace(unary_unary=unary_unary)
+
+        if handler.unary_stream:
+            async def unary_stream(request, context):
+                context.set_compression(algorithm)
+                async for response in handler.unary_stream(request, context):
+                    yield response
+            return handler._replace(unary_stream=unary_stream)
+
+        return handler
+
+
+def create_server(
+        config: ServerConfig,
+        interceptors: Sequence[grpc.aio.ServerInterceptor] = ()
+) -> grpc.aio.Server:
+    """grpc.aio server configured from ``config``.
+
+    Every handler is a coroutine, so no thread pool is needed; concurrency is
+    bounded by ``max_concurrent_rpcs`` instead (excess calls fail with
+    RESOURCE_EXHAUSTED rather than queueing without limit).
+    """
+    interceptors = list(interceptors)
+    if config.rpc_compression:
+        interceptors.append(CompressionInterceptor(config.rpc_compression))
+
+    return grpc.aio.server(
+        interceptors=interceptors,
+        options=config.options(),
+        maximum_concurrent_rpcs=config.max_concurrent_rpcs,
+        compression=config.compression
+    )
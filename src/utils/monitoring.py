@@ -1,5 +1,6 @@
 import logging
-from prometheus_client import Counter, Histogram, start_http_server
+import os
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, multiprocess, start_http_server
 import functools
 import time
 from typing import Optional, Callable
@@ -19,6 +20,67 @@ REQUEST_LATENCY = Histogram(
     ['method']
 )
 
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    'smart_service_db_pool_checkout_wait_seconds',
+    'Time spent waiting for a database connection from the pool',
+    ['pool'],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+
+PURGED_MODELS = Counter(
+    'smart_service_purged_models_total',
+    'Soft-deleted or deprecated models removed by the purge job'
+)
+
+CACHE_HITS = Counter(
+    'smart_service_cache_hits_total',
+    'Cache lookups answered by a cache tier',
+    ['tier']
+)
+
+CACHE_MISSES = Counter(
+    'smart_service_cache_misses_total',
+    'Cache lookups a cache tier could not answer',
+    ['tier']
+)
+
+CACHE_EVICTIONS = Counter(
+    'smart_service_cache_evictions_total',
+    'Entries dropped from a cache tier before being read again',
+    ['tier', 'reason']
+)
+
+CACHE_COALESCED_LOADS = Counter(
+    'smart_service_cache_coalesced_loads_total',
+    'Cache misses that waited for a load already in flight instead of starting one'
+)
+
+CACHE_EARLY_REFRESHES = Counter(
+    'smart_service_cache_early_refreshes_total',
+    'Cache hits refreshed ahead of expiry by probabilistic early expiration'
+)
+
+CACHE_NEGATIVE_HITS = Counter(
+    'smart_service_cache_negative_hits_total',
+    'Cache lookups answered by a tombstone for a key known not to exist'
+)
+
+CACHE_STALE_HITS = Counter(
+    'smart_service_cache_stale_hits_total',
+    'Expired entries served while a background refresh reloads them'
+)
+
+STATUS_WATCHERS = Gauge(
+    'smart_service_status_watchers',
+    'Open WatchModelStatus subscriptions',
+    multiprocess_mode='livesum'
+)
+
+STATUS_UPDATES_COALESCED = Counter(
+    'smart_service_status_updates_coalesced_total',
+    'Status updates merged into one already pending for a slow watcher'
+)
+
 # Logger setup
 logger = logging.getLogger(__name__)
 
@@ -81,9 +143,15 @@ class MetricsServer:
         return cls._instance
 
     def start(self, port: int = 8000) -> bool:
+        """Serve /metrics; with PROMETHEUS_MULTIPROC_DIR set, aggregates every worker process"""
         if not self.is_running:
             try:
-                start_http_server(port)
+                if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+                    registry = CollectorRegistry()
+                    multiprocess.MultiProcessCollector(registry)
+                    start_http_server(port, registry=registry)
+                else:
+                    start_http_server(port)
                 self.is_running = True
                 logger.info(f"Metrics server started on port {port}")
                 return True
@@ -97,4 +165,10 @@ class MetricsServer:
             'total_requests': REQUEST_COUNT._value.sum(),
             'average_latency': REQUEST_LATENCY._sum.sum() / REQUEST_LATENCY._count.sum()
             if REQUEST_LATENCY._count.sum() > 0 else 0
-        }
\ No newline at end of file
+        }
+
+
+def mark_worker_dead(pid: int):
+    """Drop a finished worker's live gauges from the multiprocess metrics"""
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        multiprocess.mark_process_dead(pid)
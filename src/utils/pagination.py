@@ -1,18 +1,36 @@
+import base64
+import json
+import logging
 from dataclasses import dataclass
-from typing import TypeVar, Generic, List, Optional
-from sqlalchemy.orm import Query
+from datetime import datetime
+from enum import Enum
+from typing import TypeVar, Generic, List, Optional, Sequence, Any
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
 
+class CountMode(str, Enum):
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
 @dataclass
 class PaginationMetadata:
     page: int
     size: int
-    total_items: int
-    total_pages: int
+    total_items: Optional[int]
+    total_pages: Optional[int]
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 @dataclass
@@ -21,33 +39,81 @@ class PaginatedResult(Generic[T]):
     metadata: PaginationMetadata
 
 
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a select, bound and executed like the select itself"""
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(Explain, 'postgresql')
+def _compile_explain(element, compiler, **kw):
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
 class PaginationParams:
     def __init__(
             self,
             page: int = 0,
             size: int = 10,
             max_size: int = 100,
-            min_size: int = 1
+            min_size: int = 1,
+            cursor: Optional[str] = None,
+            count_mode: CountMode = CountMode.EXACT
     ):
         self.page = max(0, page)
         self.size = max(min_size, min(size, max_size))
+        self.cursor = cursor or None
+        self.count_mode = CountMode(count_mode)
 
     @property
     def offset(self) -> int:
         return self.page * self.size
 
 
+class CursorCodec:
+    """Opaque continuation tokens holding the sort key of the last row of a page"""
+
+    @staticmethod
+    def encode(values: Sequence[Any]) -> str:
+        payload = [
+            {'dt': value.isoformat()} if isinstance(value, datetime) else value
+            for value in values
+        ]
+        raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode(cursor: str, expected_length: int) -> List[Any]:
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            values = [
+                datetime.fromisoformat(value['dt']) if isinstance(value, dict) else value
+                for value in payload
+            ]
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f"Invalid pagination cursor: {cursor}") from e
+
+        if len(values) != expected_length:
+            raise ValueError(f"Invalid pagination cursor: {cursor}")
+        return values
+
+
 class QueryPaginator:
     @staticmethod
-    def paginate(
-            query: Query,
+    async def paginate(
+            session: AsyncSession,
+            query: Select,
             params: PaginationParams,
-            count_query: Optional[Query] = None
+            count_query: Optional[Select] = None
     ) -> PaginatedResult[T]:
         """
-        Paginates a SQLAlchemy query and returns results with metadata
+        Paginates a select() with OFFSET/LIMIT and returns results with metadata
 
         Args:
+            session: Session to run the queries in
             query: The base query to paginate
             params: Pagination parameters
             count_query: Optional optimized query for counting total items
@@ -55,19 +121,113 @@ class QueryPaginator:
         Returns:
             PaginatedResult containing items and pagination metadata
         """
-        total = count_query.count() if count_query else query.count()
+        total, is_estimate = await QueryPaginator._count(
+            session,
+            count_query if count_query is not None else query,
+            params.count_mode
+        )
+
+        result = await session.execute(query.offset(params.offset).limit(params.size + 1))
+        items = list(result.scalars().all())
+        has_next = len(items) > params.size
+        items = items[:params.size]
+
+        metadata = PaginationMetadata(
+            page=params.page,
+            size=params.size,
+            total_items=total,
+            total_pages=QueryPaginator._total_pages(total, params.size),
+            has_next=has_next,
+            has_previous=params.page > 0,
+            total_is_estimate=is_estimate
+        )
+
+        return PaginatedResult(items=items, metadata=metadata)
+
+    @staticmethod
+    async def paginate_keyset(
+            session: AsyncSession,
+            query: Select,
+            params: PaginationParams,
+            keys: Sequence[Any],
+            count_query: Optional[Select] = None
+    ) -> PaginatedResult[T]:
+        """
+        Paginates a select() by seeking past the sort key of the previous page
 
-        items = query.offset(params.offset).limit(params.size).all()
+        The query is ordered by ``keys`` (which must be unique together, e.g.
+        created_at + id) and filtered with a row-value comparison, so with an
+        index on the keys every page costs the same as the first one.
 
-        total_pages = (total + params.size - 1) // params.size
+        Args:
+            session: Session to run the queries in
+            query: The base query to paginate, without ORDER BY
+            params: Pagination parameters, ``cursor`` is the token of the previous page
+            keys: Columns forming the sort key
+            count_query: Optional optimized query for counting total items
+
+        Returns:
+            PaginatedResult whose metadata carries the ``next_cursor`` token
+        """
+        total, is_estimate = await QueryPaginator._count(
+            session,
+            count_query if count_query is not None else query,
+            params.count_mode
+        )
+
+        page_query = query.order_by(*keys)
+        if params.cursor:
+            last_values = CursorCodec.decode(params.cursor, len(keys))
+            page_query = page_query.where(tuple_(*keys) > tuple_(*last_values))
+
+        result = await session.execute(page_query.limit(params.size + 1))
+        items = list(result.scalars().all())
+        has_next = len(items) > params.size
+        items = items[:params.size]
+
+        next_cursor = None
+        if has_next:
+            last = items[-1]
+            next_cursor = CursorCodec.encode([getattr(last, key.key) for key in keys])
 
         metadata = PaginationMetadata(
             page=params.page,
             size=params.size,
             total_items=total,
-            total_pages=total_pages,
-            has_next=params.page < total_pages - 1,
-            has_previous=params.page > 0
+            total_pages=QueryPaginator._total_pages(total, params.size),
+            has_next=has_next,
+            has_previous=params.cursor is not None,
+            next_cursor=next_cursor,
+            total_is_estimate=is_estimate
         )
 
-        return PaginatedResult(items=items, metadata=metadata)
\ No newline at end of file
+        return PaginatedResult(items=items, metadata=metadata)
+
+    @staticmethod
+    async def _count(session: AsyncSession, query: Select, count_mode: CountMode):
+        if count_mode == CountMode.NONE:
+            return None, False
+
+        if count_mode == CountMode.ESTIMATE and session.get_bind().dialect.name == 'postgresql':
+            try:
+                # Planner row estimate, avoids scanning every matching row. A
+                # savepoint keeps a failed EXPLAIN from aborting the transaction.
+                async with session.begin_nested():
+                    result = await session.execute(Explain(query.order_by(None)))
+                    plan = result.scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]['Plan']['Plan Rows']), True
+            except Exception as e:
+                logger.error(f"Row estimate failed, counting exactly: {str(e)}")
+
+        result = await session.execute(
+            select(func.count()).select_from(query.order_by(None).subquery())
+        )
+        return result.scalar_one(), False
+
+    @staticmethod
+    def _total_pages(total: Optional[int], size: int) -> Optional[int]:
+        if total is None:
+            return None
+        return (total + size - 1) // size
@@ -0,0 +1,148 @@
+import logging
+import math
+import multiprocessing
+import os
+import signal
+import time
+from multiprocessing.connection import wait
+from typing import Callable, Dict, Optional
+
+from src.utils.monitoring import mark_worker_dead
+
+logger = logging.getLogger(__name__)
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: the cgroup CPU limit if one is set, else the affinity mask"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()
+        if quota != 'max':
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def worker_count(configured: Optional[int] = None) -> int:
+    """Workers to start; 0 or less means one per available CPU"""
+    if configured is None:
+        configured = int(os.getenv('GRPC_WORKERS', '1'))
+    return configured if configured > 0 else available_cpus()
+
+
+class WorkerReadiness:
+    """One warm flag per worker in shared memory.
+
+    Workers share a port through SO_REUSEPORT, so a readiness probe reaches an
+    arbitrary worker. Each worker marks itself warm once its warm-up is done and
+    reports SERVING only while every flag is set; the pod is then ready only
+    when all workers are, and the answer doesn't depend on which one the probe
+    hits. The supervisor clears a worker's flag as soon as it dies, so a
+    restart takes the whole pod out of rotation until the new worker is warm.
+    """
+
+    def __init__(self, workers: int, context=multiprocessing):
+        self._flags = context.Array('b', workers)
+
+    def mark_warm(self, worker_id: int):
+        self._flags[worker_id] = 1
+
+    def mark_cold(self, worker_id: int):
+        self._flags[worker_id] = 0
+
+    def all_warm(self) -> bool:
+        return all(self._flags[:])
+
+
+class WorkerSupervisor:
+    """Runs ``target(worker_id, workers, readiness)`` in N child processes and keeps them alive.
+
+    Workers are spawned rather than forked so none inherits gRPC or event loop
+    state. SIGTERM/SIGINT are forwarded to every worker, which then drains its
+    own server; workers still running after ``shutdown_grace`` are killed.
+    ``readiness`` is the WorkerReadiness shared by all of them.
+    """
+
+    def __init__(
+            self,
+            target: Callable[[int, int, WorkerReadiness], None],
+            workers: int,
+            shutdown_grace: float = 30.0,
+            restart_delay: float = 1.0
+    ):
+        self.target = target
+        self.workers = workers
+        self.shutdown_grace = shutdown_grace
+        self.restart_delay = restart_delay
+        self._context = multiprocessing.get_context('spawn')
+        self.readiness = WorkerReadiness(workers, self._context)
+        self._processes: Dict[int, multiprocessing.Process] = {}
+        self._stopping = False
+
+    def run(self) -> int:
+        previous = {
+            signum: signal.signal(signum, self._request_stop) for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        try:
+            for worker_id in range(self.workers):
+                self._start(worker_id)
+
+            while not self._stopping:
+                sentinels = {p.sentinel: worker_id for worker_id, p in self._processes.items()}
+                for sentinel in wait(list(sentinels), timeout=1.0):
+                    if self._stopping:
+                        break
+                    self._restart(sentinels[sentinel])
+
+            return self._shutdown()
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+    def stop(self):
+        self._stopping = True
+
+    def _request_stop(self, signum, frame):
+        logger.info(f"Received signal {signum}, stopping {len(self._processes)} workers")
+        self.stop()
+
+    def _start(self, worker_id: int):
+        process = self._context.Process(
+            target=self.target, args=(worker_id, self.workers, self.readiness), name=f'worker-{worker_id}'
+        )
+        process.start()
+        self._processes[worker_id] = process
+        logger.info(f"Started worker {worker_id} (pid {process.pid})")
+
+    def _restart(self, worker_id: int):
+        process = self._processes[worker_id]
+        self.readiness.mark_cold(worker_id)
+        process.join()
+        mark_worker_dead(process.pid)
+        logger.error(f"Worker {worker_id} (pid {process.pid}) exited with {process.exitcode}, restarting")
+        time.sleep(self.restart_delay)
+        self._start(worker_id)
+
+    def _shutdown(self) -> int:
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+
+        deadline = time.monotonic() + self.shutdown_grace
+        for process in self._processes.values():
+            process.join(max(0.0, deadline - time.monotonic()))
+        for worker_id, process in self._processes.items():
+            if process.is_alive():
+                logger.error(f"Worker {worker_id} (pid {process.pid}) did not stop in time, killing it")
+                process.kill()
+                process.join()
+            mark_worker_dead(process.pid)
+
+        failed = [p for p in self._processes.values() if p.exitcode not in (0, -signal.SIGTERM)]
+        return 1 if failed else 0
@@ -2,7 +2,8 @@ import pytest
 import pytest_asyncio
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from unittest.mock import MagicMock
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from unittest.mock import MagicMock, patch
 
 from src.models.models import Base, ModelType, FeatureType
 from src.services.model_service import ModelService
@@ -34,19 +35,47 @@ def db_session(engine):
         session.rollback()
         session.close()
 
+@pytest_asyncio.fixture(scope="session")
+async def async_engine():
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+@pytest.fixture
+def session_factory(async_engine):
+    return async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
 @pytest.fixture
 def mock_cache():
     cache = MagicMock(spec=Cache)
     cache.get.return_value = None
+    cache.get_raw.return_value = None
+    cache.get_many.return_value = {}
+
+    async def load_through(key, loader, **kwargs):
+        loaded = await loader()
+        return loaded[0] if loaded else None
+
+    cache.get_or_load.side_effect = load_through
+    return cache
+
+@pytest.fixture
+def local_cache():
+    # Redis-less Cache: only the in-process tier
+    cache = object.__new__(Cache)
+    with patch("src.utils.cache.redis.Redis", side_effect=ConnectionError("no redis")):
+        cache.init_cache()
     return cache
 
 @pytest.fixture
-def model_service(db_session, mock_cache):
-    return ModelService(db_session, mock_cache)
+def model_service(session_factory, mock_cache):
+    return ModelService(session_factory, mock_cache)
 
 @pytest.fixture
-def feature_service(db_session, mock_cache):
-    return FeatureService(db_session, mock_cache)
+def feature_service(session_factory, mock_cache):
+    return FeatureService(session_factory, mock_cache)
 
 @pytest.fixture
 def mock_integration_manager():
@@ -0,0 +1,341 @@
+import asyncio
+import json
+import time
+import uuid
+from datetime import timedelta
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.models.models import ModelStatus
+from src.models.snapshot import ModelSnapshot, ModelSnapshotCodec
+from src.services.model_service import ModelService
+from src.services.purge import ModelPurgeJob
+from src.services.status_hub import StatusHub
+from src.utils.cache import Cache, LocalCache, cached
+
+
+def test_local_cache_evicts_least_recently_used():
+    cache = LocalCache(max_entries=2, ttl=60)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_local_cache_respects_byte_bound():
+    cache = LocalCache(max_bytes=10, ttl=60)
+    cache.set("a", "x" * 6)
+    cache.set("b", "y" * 6)
+
+    assert cache.get("a") is None
+    assert cache.size_bytes == 6
+
+    cache.set("huge", "z" * 11)
+    assert cache.get("huge") is None
+    assert len(cache) == 1
+
+
+def test_local_cache_expires_entries():
+    cache = LocalCache(ttl=60)
+    with patch("src.utils.cache.time.monotonic", return_value=100.0):
+        cache.set("a", "1", ttl=5)
+    with patch("src.utils.cache.time.monotonic", return_value=104.0):
+        assert cache.get("a") == "1"
+    with patch("src.utils.cache.time.monotonic", return_value=106.0):
+        assert cache.get("a") is None
+    assert cache.size_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_get_model_serves_snapshot_from_cache(session_factory, feature_service, local_cache,
+                                                    sample_model_data, sample_feature_data):
+    service = ModelService(session_factory, local_cache)
+    model = await service.create_model(sample_model_data, user_id="test_user")
+    await feature_service.add_feature(model.id, sample_feature_data, user_id="test_user")
+
+    loaded = await service.get_model(model.id)
+    payload = await local_cache.get_raw(f"model:{model.id}")
+    assert isinstance(loaded, ModelSnapshot)
+    assert payload is not None
+
+    with patch.object(ModelService, "_live_models", side_effect=AssertionError("hit the database")):
+        cached = await service.get_model(model.id, fetch_plan='full')
+
+    assert cached == loaded
+    assert cached.features[0].name == sample_feature_data["name"]
+    assert cached.created_at == model.created_at
+
+    as_json = json.dumps({k: str(v) for k, v in vars(cached).items()})
+    assert len(payload) < len(as_json)
+
+    await service.update_model(model.id, {'name': 'Renamed'}, user_id="test_user")
+    assert await local_cache.get_raw(f"model:{model.id}") is None
+    assert (await service.get_model(model.id)).name == 'Renamed'
+
+
+def test_snapshot_version_mismatch_is_a_miss():
+    assert ModelSnapshotCodec.decode(b"\x92\x00\xa1x") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidation_refuses_older_revisions(local_cache):
+    await local_cache.set_raw("model:1", b"v3", revision=3)
+
+    local_cache._on_invalidation({'data': json.dumps({'entries': [["model:1", 4]]})})
+    assert await local_cache.get_raw("model:1") is None
+
+    await local_cache.set_raw("model:1", b"v3", revision=3)
+    assert await local_cache.get_raw("model:1") is None
+
+    await local_cache.set_raw("model:1", b"v4", revision=4)
+    assert await local_cache.get_raw("model:1") == b"v4"
+
+
+@pytest.mark.asyncio
+async def test_adding_feature_invalidates_cached_model(session_factory, feature_service, local_cache,
+                                                       sample_model_data, sample_feature_data):
+    service = ModelService(session_factory, local_cache)
+    feature_service.cache = local_cache
+    model = await service.create_model(sample_model_data, user_id="test_user")
+    assert (await service.get_model(model.id)).features == []
+
+    await feature_service.add_feature(model.id, sample_feature_data, user_id="test_user")
+
+    cached = await service.get_model(model.id)
+    assert cached.revision == model.revision + 1
+    assert [f.name for f in cached.features] == [sample_feature_data["name"]]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load(local_cache):
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b"payload", 1
+
+    results = await asyncio.gather(*[local_cache.get_or_load("hot", loader) for _ in range(20)])
+
+    assert calls == 1
+    assert results == [b"payload"] * 20
+    assert await local_cache.get_or_load("hot", loader) == b"payload"
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_load_propagates_to_waiters(local_cache):
+    async def loader():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("database down")
+
+    results = await asyncio.gather(
+        *[local_cache.get_or_load("broken", loader) for _ in range(3)],
+        return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(local_cache._flights) == 0
+
+
+@pytest.mark.asyncio
+async def test_hits_near_expiry_refresh_early(local_cache):
+    async def loader():
+        return b"fresh", None
+
+    await local_cache.set_raw("warm", b"stale", expire=10)
+    local_cache._load_seconds["warm"] = 1.0
+
+    with patch("src.utils.cache.random.random", return_value=0.5):
+        assert await local_cache.get_or_load("warm", loader) == b"stale"
+
+    # 9.9s into a 10s lifetime a 1s recompute is likely to be chosen
+    with patch("src.utils.cache.time.monotonic", return_value=time.monotonic() + 9.9), \
+            patch("src.utils.cache.random.random", return_value=0.5):
+        assert await local_cache.get_or_load("warm", loader) == b"fresh"
+
+
+@pytest.mark.asyncio
+async def test_get_many_fetches_local_misses_in_one_round_trip(local_cache):
+    await local_cache.set_raw("model:a", b"a")
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[[b"b", None], 5000, -2])
+    local_cache.client = MagicMock()
+    local_cache.client.pipeline.return_value = pipe
+
+    found = await local_cache.get_many(["model:a", "model:b", "model:c", "model:b"])
+
+    assert found == {"model:a": b"a", "model:b": b"b"}
+    pipe.mget.assert_called_once_with(["model:b", "model:c"])
+    pipe.execute.assert_awaited_once()
+    assert local_cache.local.get("model:b") == b"b"
+
+
+@pytest.mark.asyncio
+async def test_missing_models_are_cached_until_created(session_factory, local_cache, sample_model_data):
+    service = ModelService(session_factory, local_cache)
+    loads = 0
+    load_snapshot = service._load_snapshot
+
+    async def counting_load(model_id):
+        nonlocal loads
+        loads += 1
+        return await load_snapshot(model_id)
+
+    service._load_snapshot = counting_load
+    missing_id = "00000000-0000-0000-0000-000000000016"
+
+    assert await service.get_model(missing_id) is None
+    assert await service.get_model(missing_id) is None
+    assert loads == 1
+
+    with patch("src.models.models.uuid.uuid4", return_value=uuid.UUID(missing_id)):
+        model = await service.create_model(sample_model_data, user_id="test_user")
+    assert (await service.get_model(model.id)).id == missing_id
+    assert loads == 2
+
+    # A tombstone computed before the create landed must not win
+    await local_cache.set_raw(f"model:{missing_id}", b"\xc1", revision=0)
+    assert await local_cache.get_raw(f"model:{missing_id}") != b"\xc1"
+
+
+@pytest.mark.asyncio
+async def test_deleted_models_are_cached_as_missing(session_factory, local_cache, sample_model_data):
+    service = ModelService(session_factory, local_cache)
+    model = await service.create_model(sample_model_data, user_id="test_user")
+    other = await service.create_model(sample_model_data, user_id="test_user")
+    assert await service.delete_model(model.id, user_id="test_user")
+    assert await service.delete_model(other.id, user_id="test_user")
+
+    loads = 0
+    load_snapshot = service._load_snapshot
+
+    async def counting_load(model_id):
+        nonlocal loads
+        loads += 1
+        return await load_snapshot(model_id)
+
+    service._load_snapshot = counting_load
+    for _ in range(3):
+        assert await service.get_model(model.id) is None
+    assert loads == 1
+
+    assert await service.get_models([other.id]) == [None]
+    with patch.object(ModelService, "_live_models", side_effect=AssertionError("hit the database")):
+        assert await service.get_models([other.id, model.id]) == [None, None]
+
+    # Leave no soft-deleted rows behind for the purge tests
+    for deleted in (model, other):
+        await service.delete_model(deleted.id, hard=True)
+
+
+@pytest.mark.asyncio
+async def test_hard_delete_refuses_snapshots_read_before_it(session_factory, local_cache, sample_model_data):
+    service = ModelService(session_factory, local_cache)
+    model = await service.create_model(sample_model_data, user_id="test_user")
+    await service.get_model(model.id)
+    key = f"model:{model.id}"
+    payload = await local_cache.get_raw(key)
+
+    assert await service.delete_model(model.id, hard=True)
+
+    # A loader that read the row before the delete finishes afterwards
+    await local_cache.set_raw(key, payload, revision=model.revision)
+    assert await local_cache.get_raw(key) is None
+
+
+@pytest.mark.asyncio
+async def test_purge_evicts_cached_deprecated_models(session_factory, local_cache, sample_model_data):
+    service = ModelService(session_factory, local_cache)
+    model = await service.create_model(sample_model_data, user_id="test_user")
+    await service.update_model(model.id, {'status': ModelStatus.DEPRECATED}, user_id="test_user")
+    assert (await service.get_model(model.id)).status == ModelStatus.DEPRECATED
+
+    hub = StatusHub()
+    published = []
+    hub.dispatch = published.extend
+    purge_job = ModelPurgeJob(
+        session_factory, retention=timedelta(days=365), deprecated_retention=timedelta(0),
+        batch_pause=0, cache=local_cache, status_hub=hub
+    )
+    assert await purge_job.run_once() == 1
+    assert await service.get_model(model.id) is None
+    # Still active until purged, so watchers hear about it here
+    assert [(d.model_id, d.deleted) for d in published] == [(model.id, True)]
+
+
+@pytest.mark.asyncio
+async def test_cached_keys_on_all_arguments(local_cache):
+    calls = []
+
+    @cached("lookup")
+    async def lookup(id, region="eu"):
+        calls.append((id, region))
+        return {"id": id, "region": region}
+
+    with patch.object(Cache, "_instance", local_cache):
+        assert await lookup(1) == {"id": 1, "region": "eu"}
+        assert await lookup(id=1, region="eu") == {"id": 1, "region": "eu"}
+        assert await lookup(1, region="us") == {"id": 1, "region": "us"}
+
+    assert calls == [(1, "eu"), (1, "us")]
+
+
+@pytest.mark.asyncio
+async def test_cached_serves_stale_while_revalidating(local_cache):
+    versions = iter(["v1", "v2"])
+
+    @cached("swr", expire=10, stale_ttl=30)
+    async def current_version():
+        return next(versions)
+
+    with patch.object(Cache, "_instance", local_cache):
+        assert await current_version() == "v1"
+
+        with patch("src.utils.cache.time.monotonic", return_value=time.monotonic() + 15):
+            assert await current_version() == "v1"
+            await asyncio.gather(*local_cache._refreshes)
+            assert await current_version() == "v2"
+
+
+def test_cached_sync_functions_use_local_tier(local_cache):
+    calls = []
+
+    @cached("sync")
+    def lookup(id):
+        calls.append(id)
+        return {"id": id} if id else None
+
+    with patch.object(Cache, "_instance", local_cache):
+        assert lookup(1) == lookup(id=1) == {"id": 1}
+        assert lookup(0) is None and lookup(0) is None
+
+    assert calls == [1, 0]
+    with pytest.raises(TypeError):
+        cached("sync", stale_ttl=30)(lambda: None)
+
+
+@pytest.mark.asyncio
+async def test_get_models_loads_only_uncached_ids(session_factory, local_cache, async_engine, sample_model_data):
+    service = ModelService(session_factory, local_cache)
+    cached_model = await service.create_model(sample_model_data, user_id="test_user")
+    uncached_model = await service.create_model(sample_model_data, user_id="test_user")
+    await service.get_model(cached_model.id)
+    await service.get_model("missing-model")
+
+    with patch.object(ModelService, "_live_models", wraps=ModelService._live_models) as live_models:
+        models = await service.get_models([uncached_model.id, "missing-model", cached_model.id])
+
+    assert [m.id if m else None for m in models] == [uncached_model.id, None, cached_model.id]
+    assert live_models.call_count == 1
+
+    with patch.object(ModelService, "_live_models", side_effect=AssertionError("hit the database")):
+        again = await service.get_models([uncached_model.id, "missing-model"])
+    assert again[0].id == uncached_model.id and again[1] is None
@@ -0,0 +1,123 @@
+import time
+
+import grpc
+import pytest
+import pytest_asyncio
+
+from src import smart_service_pb2 as pb2
+from src import smart_service_pb2_grpc as pb2_grpc
+from src.client import SmartServiceClient, build_service_config
+from src.client import client as client_module
+from src.services.service import SmartServiceServicer
+
+
+async def _start_server(servicer):
+    server = grpc.aio.server()
+    pb2_grpc.add_SmartServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    await server.start()
+    return server, f'127.0.0.1:{port}'
+
+
+@pytest_asyncio.fixture
+async def client(model_service, feature_service, orchestrator, session_factory):
+    server, target = await _start_server(SmartServiceServicer(
+        model_service=model_service,
+        feature_service=feature_service,
+        orchestrator=orchestrator,
+        session_factory=session_factory
+    ))
+    client = SmartServiceClient(target, pool_size=2, user_id="test_user")
+    yield client
+    await client.close()
+    await server.stop(None)
+
+
+@pytest.mark.asyncio
+async def test_get_model_returns_none_when_missing(client):
+    model = await client.create_model({'name': "Client Model", 'type': "DEVICE", 'category': "client"})
+
+    assert (await client.get_model(model.id)).name == "Client Model"
+    assert await client.get_model("missing") is None
+
+    # Reads after the write tell the server when this user last wrote
+    metadata = dict(client._call_options('GetModel', None, None)['metadata'])
+    assert abs(float(metadata['x-read-after']) - time.time()) < 5
+    assert client._call_options('GetModel', None, 'other_user')['metadata'] == (('x-user-id', 'other_user'),)
+
+
+@pytest.mark.asyncio
+async def test_batch_helpers_split_requests_and_keep_order(client, monkeypatch):
+    monkeypatch.setattr(client_module, 'MAX_BATCH_GET_IDS', 2)
+    results = await client.create_models(
+        [{'name': f"Batch {i}", 'type': "DEVICE"} for i in range(3)] + [{'name': "Bad", 'type': "NOPE"}],
+        batch_size=2
+    )
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert [r.success for r in results] == [True, True, True, False]
+
+    ids = [r.model_id for r in results if r.success]
+    models = await client.get_models([ids[2], "missing", ids[0], ids[1], ids[2]])
+    assert [m.id if m else None for m in models] == [ids[2], None, ids[0], ids[1], ids[2]]
+
+    # Positional arguments keep their meaning; fields is keyword-only
+    named = await client.get_models(ids, 2, 5.0, fields=['name'])
+    assert [m.name for m in named] == ["Batch 0", "Batch 1", "Batch 2"]
+    assert not any(m.id for m in named)
+
+
+@pytest.mark.asyncio
+async def test_reads_are_retried_through_service_config():
+    class FlakyServicer(pb2_grpc.SmartServiceServicer):
+        calls = 0
+
+        async def GetModel(self, request, context):
+            FlakyServicer.calls += 1
+            if FlakyServicer.calls < 3:
+                await context.abort(grpc.StatusCode.UNAVAILABLE, "try again")
+            return pb2.SmartModel(id=request.id)
+
+    server, target = await _start_server(FlakyServicer())
+    retry_policy = build_service_config(initial_backoff=0.01, max_backoff=0.05)
+    async with SmartServiceClient(target, pool_size=1, retry_policy=retry_policy) as client:
+        model = await client.get_model("m-1", timeout=5)
+    await server.stop(None)
+
+    assert model.id == "m-1"
+    assert FlakyServicer.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_watch_re_subscribes_when_the_stream_is_recycled():
+    class RecyclingServicer(pb2_grpc.SmartServiceServicer):
+        calls = 0
+
+        async def WatchModelStatus(self, request, context):
+            RecyclingServicer.calls += 1
+            yield pb2.ModelStatusUpdate(model_id=request.model_ids[0], snapshot=True)
+            if RecyclingServicer.calls == 1:
+                # What a client sees when max connection age closes the stream
+                await context.abort(grpc.StatusCode.UNAVAILABLE, "connection recycled")
+            yield pb2.ModelStatusUpdate(model_id=request.model_ids[0], deleted=True)
+
+    server, target = await _start_server(RecyclingServicer())
+    async with SmartServiceClient(target, pool_size=1) as client:
+        updates = [u async for u in client.watch_model_status(["m-1"], reconnect_delay=0.01)]
+    await server.stop(None)
+
+    assert [(u.snapshot, u.deleted) for u in updates] == [(True, False), (True, False), (False, True)]
+    assert RecyclingServicer.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_search_defaults_to_first_page(client):
+    model = await client.create_model({
+        'name': "Client Searchable Camera", 'type': "DEVICE", 'category': "client-search"
+    })
+
+    response = await client.search_models(category="client-search")
+    assert [m.id for m in response.models] == [model.id]
+    assert response.total == 1
+
+    response = await client.text_search_models("Searchable")
+    assert [m.id for m in response.models] == [model.id]
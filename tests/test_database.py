@@ -0,0 +1,104 @@
+import asyncio
+import time
+import pytest
+from sqlalchemy import text
+
+from src.models.models import SmartModel, ModelType
+from src.utils.database import (
+    TimedQueuePool, bind_read_after, bind_user, create_engine, create_schema, create_session_factory,
+    current_session, session_scope, to_async_url
+)
+from src.utils.monitoring import DB_POOL_CHECKOUT_WAIT
+
+
+def test_to_async_url():
+    assert to_async_url('postgresql://u:p@db:5432/smartdb') == 'postgresql+asyncpg://u:p@db:5432/smartdb'
+    assert to_async_url('sqlite:///:memory:') == 'sqlite+aiosqlite:///:memory:'
+
+
+@pytest.mark.asyncio
+async def test_nested_scopes_share_session(session_factory):
+    async with session_scope(session_factory) as outer:
+        async with session_scope(session_factory) as inner:
+            assert inner is outer
+        assert current_session() is outer
+
+    with pytest.raises(RuntimeError):
+        current_session()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_scopes_use_separate_sessions(session_factory):
+    async def open_scope():
+        async with session_scope(session_factory) as session:
+            await asyncio.sleep(0)
+            return session
+
+    first, second = await asyncio.gather(open_scope(), open_scope())
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_timed_pool_records_checkout_wait():
+    engine = create_engine('sqlite://', poolclass=TimedQueuePool)
+
+    def checkouts():
+        return sum(
+            sample.value for metric in DB_POOL_CHECKOUT_WAIT.collect() for sample in metric.samples
+            if sample.name.endswith('_count') and sample.labels.get('pool') == 'primary'
+        )
+
+    observed = checkouts()
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    assert checkouts() == observed + 1
+    await engine.dispose()
+
+
+@pytest.fixture
+async def replicated_factory():
+    primary = create_engine('sqlite://')
+    replica = create_engine('sqlite://', pool_name='replica-0')
+    for engine in (primary, replica):
+        await create_schema(engine)
+    yield create_session_factory(primary, replicas=[replica], read_your_writes_window=60)
+    for engine in (primary, replica):
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_read_only_scope_routes_to_replica_after_window(replicated_factory):
+    async with session_scope(replicated_factory) as session:
+        bind_user("writer")
+        model = SmartModel(name="Routed", type=ModelType.DEVICE)
+        session.add(model)
+        await session.commit()
+
+    # The replica has not seen the write, the writer still reads from the primary
+    async with session_scope(replicated_factory, read_only=True) as session:
+        bind_user("someone_else")
+        assert await session.get(SmartModel, model.id) is None
+
+    async with session_scope(replicated_factory, read_only=True) as session:
+        bind_user("writer")
+        assert await session.get(SmartModel, model.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_read_after_token_pins_reads_without_local_history(replicated_factory):
+    # Another worker served the write: this process has no record of it
+    async with session_scope(replicated_factory) as session:
+        model = SmartModel(name="Elsewhere", type=ModelType.DEVICE)
+        session.add(model)
+        await session.commit()
+
+    async with session_scope(replicated_factory, read_only=True) as session:
+        bind_user("caller")
+        bind_read_after(time.time() - 120)
+        assert await session.get(SmartModel, model.id) is None
+
+    async with session_scope(replicated_factory, read_only=True) as session:
+        bind_user("caller")
+        bind_read_after(time.time() - 1)
+        assert await session.get(SmartModel, model.id) is not None
@@ -0,0 +1,45 @@
+import grpc
+import pytest
+
+from src import smart_service_pb2 as pb2
+from src import smart_service_pb2_grpc as pb2_grpc
+from src.services.service import SmartServiceServicer
+from src.utils.grpc_server import ServerConfig, create_server, parse_rpc_compression
+
+
+def test_server_config_from_env(monkeypatch):
+    monkeypatch.setenv('GRPC_MAX_CONCURRENT_RPCS', '250')
+    monkeypatch.setenv('GRPC_HTTP2_BDP_PROBE', 'false')
+    monkeypatch.setenv('GRPC_HTTP2_LOOKAHEAD_BYTES', '1048576')
+    monkeypatch.setenv('GRPC_RPC_COMPRESSION', 'StreamModels=gzip, GetModel=none')
+
+    config = ServerConfig.from_env()
+    options = dict(config.options())
+
+    assert config.max_concurrent_rpcs == 250
+    assert config.rpc_compression == {
+        'StreamModels': grpc.Compression.Gzip, 'GetModel': grpc.Compression.NoCompression
+    }
+    assert options['grpc.http2.bdp_probe'] == 0
+    assert options['grpc.http2.lookahead_bytes'] == 1048576
+    assert 'grpc.max_connection_age_ms' not in options
+
+
+def test_rpc_compression_rejects_unknown_algorithm():
+    with pytest.raises(ValueError):
+        parse_rpc_compression('GetModel=brotli')
+
+
+@pytest.mark.asyncio
+async def test_per_rpc_compression_serves_calls(model_service, sample_model_data):
+    model = await model_service.create_model(dict(sample_model_data), user_id="test_user")
+    server = create_server(ServerConfig(rpc_compression={'GetModel': grpc.Compression.Gzip}))
+    pb2_grpc.add_SmartServiceServicer_to_server(SmartServiceServicer(model_service=model_service), server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    await server.start()
+    try:
+        async with grpc.aio.insecure_channel(f'127.0.0.1:{port}') as channel:
+            response = await pb2_grpc.SmartServiceStub(channel).GetModel(pb2.GetModelRequest(id=model.id))
+        assert response.id == model.id
+    finally:
+        await server.stop(None)
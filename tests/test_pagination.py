@@ -0,0 +1,108 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB, asyncpg
+
+from src.models.models import SmartModel, ModelType
+from src.utils.pagination import CountMode, CursorCodec, Explain, PaginationParams, QueryPaginator
+
+
+@pytest.fixture
+async def paged_models(session_factory):
+    category = f"pagination-{uuid.uuid4()}"
+    async with session_factory() as session:
+        session.add_all([
+            SmartModel(name=f"Paged {i}", type=ModelType.DEVICE, category=category)
+            for i in range(7)
+        ])
+        await session.commit()
+    return category
+
+
+@pytest.mark.asyncio
+async def test_offset_pagination(session_factory, paged_models):
+    query = select(SmartModel).where(SmartModel.category == paged_models)
+
+    async with session_factory() as session:
+        result = await QueryPaginator.paginate(session, query, PaginationParams(page=1, size=3))
+
+    assert len(result.items) == 3
+    assert result.metadata.total_items == 7
+    assert result.metadata.total_pages == 3
+    assert result.metadata.has_next and result.metadata.has_previous
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_walks_all_rows(session_factory, paged_models):
+    query = select(SmartModel).where(SmartModel.category == paged_models)
+    keys = (SmartModel.created_at, SmartModel.id)
+
+    seen, cursor = [], None
+    async with session_factory() as session:
+        while True:
+            params = PaginationParams(size=3, cursor=cursor, count_mode=CountMode.NONE)
+            result = await QueryPaginator.paginate_keyset(session, query, params, keys)
+            seen.extend(model.id for model in result.items)
+            assert result.metadata.total_items is None
+            cursor = result.metadata.next_cursor
+            if not result.metadata.has_next:
+                break
+
+    assert len(seen) == 7
+    assert len(set(seen)) == 7
+    assert cursor is None
+
+
+@pytest.mark.asyncio
+async def test_count_query_is_used_for_totals(session_factory, paged_models):
+    query = select(SmartModel).where(SmartModel.category == paged_models)
+    count_query = select(SmartModel.id).where(SmartModel.category == paged_models, SmartModel.name != "Paged 0")
+
+    async with session_factory() as session:
+        offset = await QueryPaginator.paginate(session, query, PaginationParams(size=3), count_query=count_query)
+        keyset = await QueryPaginator.paginate_keyset(
+            session, query, PaginationParams(size=3), (SmartModel.created_at, SmartModel.id), count_query=count_query
+        )
+
+    assert offset.metadata.total_items == 6
+    assert keyset.metadata.total_items == 6
+
+
+def test_invalid_cursor_is_rejected():
+    with pytest.raises(ValueError):
+        CursorCodec.decode("not-a-cursor", 2)
+
+
+def _postgres_session(*results):
+    session = MagicMock()
+    session.get_bind.return_value.dialect = asyncpg.dialect()
+    session.begin_nested.return_value.__aenter__ = AsyncMock()
+    session.begin_nested.return_value.__aexit__ = AsyncMock(return_value=False)
+    session.execute = AsyncMock(side_effect=results)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_estimate_binds_parameters_on_postgres():
+    query = select(SmartModel).where(
+        SmartModel.category == "cam :outdoor",
+        type_coerce(SmartModel.capabilities, JSONB).contains(["night_vision"])
+    )
+    session = _postgres_session(MagicMock(scalar=MagicMock(return_value='[{"Plan": {"Plan Rows": 42}}]')))
+
+    assert await QueryPaginator._count(session, query, CountMode.ESTIMATE) == (42, True)
+
+    statement = session.execute.call_args.args[0]
+    assert isinstance(statement, Explain)
+    compiled = statement.compile(dialect=asyncpg.dialect())
+    assert compiled.string.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert compiled.params == {'category_1': "cam :outdoor", 'param_1': ["night_vision"]}
+
+
+@pytest.mark.asyncio
+async def test_estimate_falls_back_to_exact_count():
+    session = _postgres_session(RuntimeError("explain failed"), MagicMock(scalar_one=MagicMock(return_value=7)))
+
+    assert await QueryPaginator._count(session, select(SmartModel), CountMode.ESTIMATE) == (7, False)
@@ -1,6 +1,17 @@
+import asyncio
 import pytest
+from datetime import timedelta
+from sqlalchemy import delete, event, func, inspect, select
 from src.domain.rules import BusinessRuleValidationError
-from src.models.models import ModelType
+from src.models.models import (
+    ModelType, ModelStatus, ModelIntegration, ModelStatusProjection, SmartModel, SmartFeature
+)
+from src.services.model_service import ModelService, fetch_plan_for_fields
+from src.services.purge import ModelPurgeJob
+from src.services.service import SmartServiceServicer
+from src.services.status_projection import StatusProjector
+from src.utils.database import create_engine, create_schema, create_session_factory, session_scope
+from src.utils.pagination import PaginationParams
 
 
 @pytest.mark.asyncio
@@ -44,4 +55,231 @@ async def test_feature_addition(model_service, feature_service, sample_model_dat
     )
 
     assert feature.model_id == model.id
-    assert feature.name == sample_feature_data["name"]
\ No newline at end of file
+    assert feature.name == sample_feature_data["name"]
+
+@pytest.mark.asyncio
+async def test_get_and_list_models(model_service, sample_model_data):
+    model = await model_service.create_model(
+        sample_model_data,
+        user_id="test_user"
+    )
+
+    fetched = await model_service.get_model(model.id)
+    assert fetched.id == model.id
+
+    models = await model_service.list_models({'category': sample_model_data['category']})
+    assert model.id in [m.id for m in models]
+
+
+@pytest.mark.asyncio
+async def test_check_model_status_loads_features(orchestrator, model_service, feature_service,
+                                                 sample_model_data, sample_feature_data):
+    model = await model_service.create_model(
+        sample_model_data,
+        user_id="test_user"
+    )
+    feature = await feature_service.add_feature(
+        model.id,
+        sample_feature_data,
+        user_id="test_user"
+    )
+
+    status = await orchestrator.check_model_status(model.id)
+
+    assert status["features"][feature.id]["status"] == "ACTIVE"
+
+
+@pytest.mark.asyncio
+async def test_full_fetch_plan_uses_fixed_query_count(model_service, feature_service, async_engine,
+                                                      sample_model_data, sample_feature_data):
+    sample_model_data['category'] = 'fetch_plan'
+    for _ in range(3):
+        model = await model_service.create_model(dict(sample_model_data), user_id="test_user")
+        await feature_service.add_feature(model.id, dict(sample_feature_data), user_id="test_user")
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, 'before_cursor_execute', record)
+    try:
+        models = await model_service.list_models({'category': 'fetch_plan'}, fetch_plan='full')
+    finally:
+        event.remove(async_engine.sync_engine, 'before_cursor_execute', record)
+
+    # models + features + integrations + tags, independent of the number of models
+    assert len(statements) == 4
+    assert len(models) == 3
+
+    proto = SmartServiceServicer()._convert_to_proto_model(models[0])
+    assert proto.features[0].name == sample_feature_data["name"]
+    assert proto.configuration.settings["resolution"] == "1080p"
+
+
+@pytest.mark.asyncio
+async def test_search_models_by_capabilities(model_service, sample_model_data):
+    sample_model_data['category'] = 'search_capabilities'
+    camera = await model_service.create_model(dict(sample_model_data), user_id="test_user")
+    await model_service.create_model(
+        dict(sample_model_data, capabilities=["night_vision"]),
+        user_id="test_user"
+    )
+
+    result = await model_service.search_models(
+        {
+            'category': 'search_capabilities',
+            'capabilities': ['night_vision', 'motion_detection']
+        },
+        PaginationParams(size=10)
+    )
+
+    assert [m.id for m in result.items] == [camera.id]
+    assert result.metadata.total_items == 1
+
+
+@pytest.mark.asyncio
+async def test_create_models_reports_per_item(model_service, sample_model_data, sample_feature_data):
+    items = [
+        dict(sample_model_data, category='batch', features=[dict(sample_feature_data)]),
+        {"name": "Missing type"},
+        dict(sample_model_data, category='batch', type="TOASTER"),
+        dict(sample_model_data, category='batch'),
+    ]
+
+    results = await model_service.create_models(items, user_id="test_user")
+
+    assert [r.success for r in results] == [True, False, False, True]
+    assert "Missing required fields: type" in results[1].error
+
+    models = await model_service.list_models({'category': 'batch'}, fetch_plan='full')
+    created = {m.id: m for m in models}
+    assert set(created) == {results[0].model_id, results[3].model_id}
+    assert created[results[0].model_id].features[0].name == sample_feature_data["name"]
+
+
+@pytest.mark.asyncio
+async def test_create_models_rolls_back_failed_insert(model_service, session_factory, sample_model_data,
+                                                      monkeypatch):
+    def fail(model_rows, feature_rows):
+        raise RuntimeError("projection insert failed")
+
+    monkeypatch.setattr(StatusProjector, 'rows_for_batch', staticmethod(fail))
+    items = [dict(sample_model_data, category='batch-rollback') for _ in range(2)]
+
+    async with session_scope(session_factory) as session:
+        results = await model_service.create_models(items, user_id="test_user")
+        # Whatever the caller commits next must not include the failed batch
+        await session.commit()
+
+    assert all("projection insert failed" in r.error for r in results)
+    assert await model_service.list_models({'category': 'batch-rollback'}) == []
+
+
+@pytest.mark.asyncio
+async def test_text_search_ranks_name_matches(model_service, sample_model_data):
+    doorbell = await model_service.create_model(
+        dict(sample_model_data, name="Zephyr Doorbell", description="Video doorbell"),
+        user_id="test_user"
+    )
+    await model_service.create_model(
+        dict(sample_model_data, name="Hallway Sensor", description="Pairs with the zephyr hub"),
+        user_id="test_user"
+    )
+
+    result = await model_service.text_search_models("zephyr", PaginationParams(size=10))
+
+    assert result.metadata.total_items == 2
+    assert result.items[0].id == doorbell.id
+
+    with pytest.raises(ValueError):
+        await model_service.text_search_models("  ", PaginationParams())
+
+
+@pytest.mark.asyncio
+async def test_status_projection_follows_writes(model_service, feature_service, session_factory,
+                                                async_engine, sample_model_data, sample_feature_data):
+    model = await model_service.create_model(sample_model_data, user_id="test_user")
+    feature = await feature_service.add_feature(model.id, sample_feature_data, user_id="test_user")
+    await model_service.update_model(model.id, {'status': ModelStatus.ACTIVE}, user_id="test_user")
+
+    async with session_factory() as session:
+        integration = ModelIntegration(model_id=model.id, name="camera api", integration_type="iot_device")
+        session.add(integration)
+        await session.commit()
+    await model_service.record_integration_health({integration.id: False})
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, 'before_cursor_execute', record)
+    try:
+        status = await model_service.get_model_status(model.id)
+    finally:
+        event.remove(async_engine.sync_engine, 'before_cursor_execute', record)
+
+    assert len(statements) == 1
+    assert status["model_status"] == ModelStatus.ACTIVE
+    assert status["features"][feature.id]["status"] == "ACTIVE"
+    assert status["integrations"] == {integration.id: "UNHEALTHY"}
+
+
+@pytest.mark.asyncio
+async def test_missing_status_projection_is_rebuilt_once_under_concurrency(tmp_path, mock_cache, sample_model_data):
+    engine = create_engine(f"sqlite:///{tmp_path / 'status.db'}")
+    await create_schema(engine)
+    service = ModelService(create_session_factory(engine), mock_cache)
+    model = await service.create_model(sample_model_data, user_id="test_user")
+    # As if the model was written before projections existed
+    async with service.session_factory() as session:
+        await session.execute(delete(ModelStatusProjection).where(ModelStatusProjection.model_id == model.id))
+        await session.commit()
+
+    try:
+        statuses = await asyncio.wait_for(
+            asyncio.gather(*(service.get_model_status(model.id) for _ in range(5))), timeout=30
+        )
+    finally:
+        await engine.dispose()
+
+    assert [status["model_status"] for status in statuses] == [ModelStatus.DRAFT] * 5
+
+
+@pytest.mark.asyncio
+async def test_soft_delete_hides_model_until_purged(model_service, feature_service, session_factory,
+                                                    sample_model_data, sample_feature_data):
+    models = [
+        await model_service.create_model(dict(sample_model_data, category='purge'), user_id="test_user")
+        for _ in range(3)
+    ]
+    await feature_service.add_feature(models[0].id, sample_feature_data, user_id="test_user")
+
+    for model in models:
+        assert await model_service.delete_model(model.id, user_id="test_user")
+    assert not await model_service.delete_model(models[0].id)
+
+    assert await model_service.get_model(models[0].id) is None
+    assert await model_service.list_models({'category': 'purge'}) == []
+
+    purge_job = ModelPurgeJob(session_factory, retention=timedelta(0), batch_size=2, batch_pause=0)
+    assert await purge_job.run_once() == 3
+
+    ids = [m.id for m in models]
+    async with session_factory() as session:
+        remaining = await session.scalar(select(func.count()).where(SmartModel.id.in_(ids)))
+        features = await session.scalar(select(func.count()).where(SmartFeature.model_id.in_(ids)))
+    assert remaining == 0
+    assert features == 0
+
+
+@pytest.mark.asyncio
+async def test_fields_limit_loaded_columns(session_factory, model_service, sample_model_data):
+    model = await model_service.create_model(dict(sample_model_data), user_id="test_user")
+    uncached = ModelService(session_factory)
+
+    async with uncached.session_scope():
+        loaded = await uncached.get_model(model.id, fetch_plan=fetch_plan_for_fields({'name'}), fields={'name'})
+        assert {'description', 'configuration', 'capabilities', 'features'} <= inspect(loaded).unloaded
+        assert loaded.name == model.name
@@ -0,0 +1,225 @@
+import asyncio
+import grpc
+import pytest
+from unittest.mock import MagicMock
+
+from src import smart_service_pb2 as pb2
+from src.models.models import ModelStatus
+from src.services.model_service import ModelService
+from src.services.service import SmartServiceServicer
+from src.services.status_hub import StatusHub
+
+
+@pytest.fixture
+def servicer(model_service, feature_service, orchestrator, session_factory):
+    return SmartServiceServicer(
+        model_service=model_service,
+        feature_service=feature_service,
+        orchestrator=orchestrator,
+        session_factory=session_factory
+    )
+
+
+@pytest.fixture
+def grpc_context():
+    return MagicMock()
+
+
+@pytest.mark.asyncio
+async def test_search_models_rpc(servicer, model_service, grpc_context, sample_model_data):
+    sample_model_data['category'] = 'search_rpc'
+    model = await model_service.create_model(dict(sample_model_data), user_id="test_user")
+
+    response = await servicer.SearchModels(
+        pb2.SearchModelsRequest(
+            type="DEVICE",
+            category="search_rpc",
+            status=pb2.DRAFT,
+            capabilities=["night_vision"]
+        ),
+        grpc_context
+    )
+
+    assert response.total == 1
+    assert response.models[0].id == model.id
+    grpc_context.set_code.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_search_models_rejects_unknown_type(servicer, grpc_context):
+    await servicer.SearchModels(pb2.SearchModelsRequest(type="TOASTER"), grpc_context)
+
+    grpc_context.set_code.assert_called_with(grpc.StatusCode.INVALID_ARGUMENT)
+
+
+@pytest.mark.asyncio
+async def test_batch_create_models_rpc(servicer, grpc_context):
+    request = pb2.BatchCreateModelsRequest(
+        models=[
+            pb2.CreateModelRequest(
+                name="Thermostat",
+                type="DEVICE",
+                category="climate",
+                features=[pb2.SmartFeature(name="Read Temperature", feature_type="SENSOR")]
+            ),
+            pb2.CreateModelRequest(name="Broken", type="TOASTER"),
+        ],
+        user_id="test_user"
+    )
+
+    response = await servicer.BatchCreateModels(request, grpc_context)
+
+    assert response.created == 1
+    assert response.failed == 1
+    assert response.results[0].success and response.results[0].model_id
+    assert "Invalid model type" in response.results[1].error
+
+
+@pytest.mark.asyncio
+async def test_delete_model_rpc(servicer, model_service, grpc_context, sample_model_data):
+    model = await model_service.create_model(dict(sample_model_data), user_id="test_user")
+
+    await servicer.DeleteModel(pb2.DeleteModelRequest(model_id=model.id, user_id="test_user"), grpc_context)
+    grpc_context.set_code.assert_not_called()
+
+    await servicer.DeleteModel(pb2.DeleteModelRequest(model_id=model.id, user_id="test_user"), grpc_context)
+    grpc_context.set_code.assert_called_with(grpc.StatusCode.NOT_FOUND)
+
+
+@pytest.mark.asyncio
+async def test_stream_models_sends_chunks(servicer, model_service, feature_service, grpc_context,
+                                          sample_model_data, sample_feature_data):
+    sample_model_data['category'] = 'stream_rpc'
+    created = [await model_service.create_model(dict(sample_model_data), user_id="test_user") for _ in range(5)]
+    await feature_service.add_feature(created[0].id, sample_feature_data, user_id="test_user")
+
+    chunks = [
+        chunk async for chunk in servicer.StreamModels(
+            pb2.StreamModelsRequest(category="stream_rpc", chunk_size=2), grpc_context
+        )
+    ]
+
+    assert [len(chunk.models) for chunk in chunks] == [2, 2, 1]
+    streamed = [m for chunk in chunks for m in chunk.models]
+    assert sorted(m.id for m in streamed) == sorted(m.id for m in created)
+    with_feature = next(m for m in streamed if m.id == created[0].id)
+    assert with_feature.features[0].name == sample_feature_data["name"]
+    grpc_context.set_code.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_get_models_keeps_request_order(servicer, model_service, grpc_context, sample_model_data):
+    first = await model_service.create_model(dict(sample_model_data), user_id="test_user")
+    second = await model_service.create_model(dict(sample_model_data), user_id="test_user")
+
+    response = await servicer.BatchGetModels(
+        pb2.BatchGetModelsRequest(ids=[second.id, "missing", first.id, second.id]),
+        grpc_context
+    )
+
+    assert [r.id for r in response.results] == [second.id, "missing", first.id, second.id]
+    assert [r.found for r in response.results] == [True, False, True, True]
+    assert response.results[0].model.id == second.id
+    grpc_context.set_code.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_watch_model_status_pushes_changes(session_factory, mock_cache, orchestrator, grpc_context,
+                                                 sample_model_data):
+    hub = StatusHub()
+    model_service = ModelService(session_factory, mock_cache, hub)
+    servicer = SmartServiceServicer(model_service=model_service, orchestrator=orchestrator, status_hub=hub)
+    model = await model_service.create_model(dict(sample_model_data), user_id="test_user")
+
+    updates = servicer.WatchModelStatus(pb2.WatchModelStatusRequest(model_ids=[model.id]), grpc_context)
+    initial = await asyncio.wait_for(updates.__anext__(), timeout=1)
+    assert initial.snapshot and initial.model_id == model.id
+
+    await model_service.update_model(model.id, {"status": ModelStatus.MAINTENANCE}, user_id="test_user")
+    change = await asyncio.wait_for(updates.__anext__(), timeout=1)
+    assert not change.snapshot
+    assert change.status == pb2.ModelStatus.Value("MAINTENANCE")
+
+    assert await model_service.delete_model(model.id, user_id="test_user")
+    removal = await asyncio.wait_for(updates.__anext__(), timeout=1)
+    assert removal.model_id == model.id and removal.deleted
+
+    await updates.aclose()
+    assert not hub._subscribers
+    # Leave no soft-deleted rows behind for the purge tests
+    await model_service.delete_model(model.id, hard=True)
+    grpc_context.set_code.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_watch_model_status_requires_ids(servicer, grpc_context):
+    updates = [u async for u in servicer.WatchModelStatus(pb2.WatchModelStatusRequest(), grpc_context)]
+    assert updates == []
+    grpc_context.set_code.assert_called_with(grpc.StatusCode.INVALID_ARGUMENT)
+
+
+@pytest.mark.asyncio
+async def test_search_models_read_mask_narrows_response(servicer, model_service, feature_service, grpc_context,
+                                                        sample_model_data, sample_feature_data):
+    sample_model_data['category'] = 'read_mask'
+    model = await model_service.create_model(dict(sample_model_data), user_id="test_user")
+    await feature_service.add_feature(model.id, sample_feature_data, user_id="test_user")
+
+    response = await servicer.SearchModels(
+        pb2.SearchModelsRequest(category="read_mask", read_mask={'paths': ['name', 'status']}), grpc_context
+    )
+    grpc_context.set_code.assert_not_called()
+    assert response.models[0] == pb2.SmartModel(name=model.name, status=pb2.DRAFT)
+
+    response = await servicer.SearchModels(
+        pb2.SearchModelsRequest(category="read_mask", read_mask={'paths': ['features', 'configuration.settings']}),
+        grpc_context
+    )
+    found = response.models[0]
+    assert [f.name for f in found.features] == [sample_feature_data["name"]]
+    assert dict(found.configuration.settings) == {"resolution": "1080p"}
+    assert not found.name and not found.integrations
+
+
+@pytest.mark.asyncio
+async def test_get_model_rejects_unknown_mask_path(servicer, model_service, grpc_context, sample_model_data):
+    model = await model_service.create_model(dict(sample_model_data), user_id="test_user")
+
+    await servicer.GetModel(pb2.GetModelRequest(id=model.id, read_mask={'paths': ['vendor']}), grpc_context)
+    grpc_context.set_code.assert_called_with(grpc.StatusCode.INVALID_ARGUMENT)
+
+
+@pytest.mark.asyncio
+async def test_search_models_pages_by_cursor(servicer, model_service, grpc_context, sample_model_data):
+    sample_model_data['category'] = 'search_cursor'
+    created = [
+        (await model_service.create_model(dict(sample_model_data, name=f"Cursor {i}"), user_id="test_user")).id
+        for i in range(5)
+    ]
+
+    seen, cursor = [], ''
+    while True:
+        response = await servicer.SearchModels(
+            pb2.SearchModelsRequest(
+                category="search_cursor", size=2, cursor=cursor, count_mode=pb2.COUNT_NONE,
+                read_mask={'paths': ['id']}
+            ),
+            grpc_context
+        )
+        assert not response.HasField('total')
+        seen.extend(m.id for m in response.models)
+        cursor = response.next_cursor
+        if not cursor:
+            break
+
+    assert seen == created
+    grpc_context.set_code.assert_not_called()
+
+    response = await servicer.SearchModels(
+        pb2.SearchModelsRequest(category="search_cursor", size=2, page=2), grpc_context
+    )
+    assert [m.id for m in response.models] == created[4:]
+    assert response.total == 5
+
+    await servicer.SearchModels(pb2.SearchModelsRequest(cursor="not-a-cursor"), grpc_context)
+    grpc_context.set_code.assert_called_with(grpc.StatusCode.INVALID_ARGUMENT)
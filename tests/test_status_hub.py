@@ -0,0 +1,55 @@
+import pytest
+
+from src.models.models import ModelStatus
+from src.services.model_service import ModelService
+from src.services.status_hub import StatusDelta, StatusHub
+
+
+@pytest.mark.asyncio
+async def test_pending_updates_are_coalesced_per_model():
+    hub = StatusHub()
+    subscription = hub.subscribe(["model-a", "model-b"])
+
+    await hub.publish([
+        StatusDelta(model_id="model-a", model_status=ModelStatus.MAINTENANCE),
+        StatusDelta(model_id="model-a", integration_status={"int-1": "UNHEALTHY"}),
+        StatusDelta(model_id="model-c", model_status=ModelStatus.ACTIVE),
+    ])
+
+    batch = await subscription.next_batch()
+    assert len(batch) == 1
+    assert batch[0].model_status == ModelStatus.MAINTENANCE
+    assert batch[0].integration_status == {"int-1": "UNHEALTHY"}
+
+    subscription.close()
+    await hub.publish([StatusDelta(model_id="model-a", model_status=ModelStatus.ACTIVE)])
+    assert not subscription._pending
+
+
+def test_delta_round_trips_through_dict():
+    delta = StatusDelta(model_id="m", model_status=ModelStatus.DEPRECATED, feature_status={"f": "ACTIVE"})
+    assert StatusDelta.from_dict(delta.to_dict()) == delta
+
+    deleted = delta.merge(StatusDelta(model_id="m", deleted=True))
+    assert deleted.deleted and deleted.model_status == ModelStatus.DEPRECATED
+    assert StatusDelta.from_dict(deleted.to_dict()) == deleted
+
+
+@pytest.mark.asyncio
+async def test_creates_and_deletes_are_published(session_factory, mock_cache, sample_model_data):
+    hub = StatusHub()
+    published = []
+    hub.dispatch = published.extend
+    service = ModelService(session_factory, mock_cache, hub)
+
+    model = await service.create_model(dict(sample_model_data), user_id="test_user")
+    [result] = await service.create_models([dict(sample_model_data)], user_id="test_user")
+    for model_id in (model.id, result.model_id):
+        assert await service.delete_model(model_id, hard=True)
+
+    assert [(d.model_id, d.model_status, d.deleted) for d in published] == [
+        (model.id, ModelStatus.DRAFT, False),
+        (result.model_id, ModelStatus.DRAFT, False),
+        (model.id, None, True),
+        (result.model_id, None, True),
+    ]
@@ -0,0 +1,33 @@
+import pytest
+
+from src.models.models import ModelIntegration, ModelStatus
+from src.orchestration.orchestration import ModelOrchestrator
+from src.orchestration.warmup import ServiceWarmup
+from src.services.model_service import ModelService
+
+
+@pytest.mark.asyncio
+async def test_warmup_preloads_active_models_and_integrations(session_factory, async_engine, local_cache,
+                                                             feature_service, mock_integration_manager,
+                                                             sample_model_data):
+    service = ModelService(session_factory, local_cache)
+    active = await service.create_model(dict(sample_model_data, category='warmup'), user_id="test_user")
+    await service.update_model(active.id, {'status': ModelStatus.ACTIVE}, user_id="test_user")
+    draft = await service.create_model(dict(sample_model_data, category='warmup'), user_id="test_user")
+    async with session_factory() as session:
+        integration = ModelIntegration(model_id=active.id, name="camera api", integration_type="iot_device")
+        session.add(integration)
+        await session.commit()
+
+    mock_integration_manager.active_integrations = {}
+    orchestrator = ModelOrchestrator(service, feature_service, mock_integration_manager)
+
+    summary = await ServiceWarmup(orchestrator, engines=[async_engine]).run()
+
+    assert summary['db_connections'] == 1
+    assert summary['cached_models'] >= 1
+    assert summary['integrations'] >= 1
+    assert local_cache.local.get(f"model:{active.id}") is not None
+    assert local_cache.local.get(f"model:{draft.id}") is None
+    connected = [call.args[0].id for call in mock_integration_manager.setup_integration.await_args_list]
+    assert integration.id in connected
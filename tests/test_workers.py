@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from grpc_health.v1 import health, health_pb2
+
+from src.main import report_readiness
+from src.utils.grpc_server import ServerConfig
+from src.utils.workers import WorkerReadiness, WorkerSupervisor, available_cpus, worker_count
+
+
+def _idle_worker(worker_id: int, workers: int, readiness: WorkerReadiness):
+    time.sleep(60)
+
+
+def _warm_worker(worker_id: int, workers: int, readiness: WorkerReadiness):
+    readiness.mark_warm(worker_id)
+
+
+def test_worker_count_defaults_to_available_cpus(monkeypatch):
+    monkeypatch.setenv('GRPC_WORKERS', '0')
+    assert worker_count() == available_cpus() >= 1
+    assert worker_count(3) == 3
+
+
+def test_reuseport_only_when_requested():
+    assert ('grpc.so_reuseport', 0) in ServerConfig().options()
+    assert ('grpc.so_reuseport', 1) in ServerConfig(so_reuseport=True).options()
+
+
+def test_supervisor_stops_all_workers():
+    supervisor = WorkerSupervisor(_idle_worker, workers=2, shutdown_grace=5)
+    threading.Timer(1.0, supervisor.stop).start()
+
+    assert supervisor.run() == 0
+    assert len(supervisor._processes) == 2
+    assert not any(p.is_alive() for p in supervisor._processes.values())
+
+
+def test_restarted_worker_is_cold_until_warmed_again():
+    supervisor = WorkerSupervisor(_warm_worker, workers=2, restart_delay=0)
+    for worker_id in range(2):
+        supervisor._start(worker_id)
+    for process in supervisor._processes.values():
+        process.join(10)
+    assert supervisor.readiness.all_warm()
+
+    supervisor._restart(1)
+    assert not supervisor.readiness.all_warm()
+    supervisor._processes[1].join(10)
+    assert supervisor.readiness.all_warm()
+
+
+@pytest.mark.asyncio
+async def test_health_follows_every_worker():
+    readiness = WorkerReadiness(2)
+    health_servicer = health.aio.HealthServicer()
+    task = asyncio.create_task(report_readiness(health_servicer, ('',), readiness, interval=0.01))
+
+    async def status():
+        await asyncio.sleep(0.05)
+        response = await health_servicer.Check(health_pb2.HealthCheckRequest(service=''), MagicMock())
+        return response.status
+
+    try:
+        readiness.mark_warm(0)
+        assert await status() == health_pb2.HealthCheckResponse.NOT_SERVING
+        readiness.mark_warm(1)
+        assert await status() == health_pb2.HealthCheckResponse.SERVING
+        readiness.mark_cold(1)
+        assert await status() == health_pb2.HealthCheckResponse.NOT_SERVING
+    finally:
+        task.cancel()